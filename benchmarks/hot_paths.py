@@ -0,0 +1,324 @@
+"""Offline timings of the scraping hot paths, from saved pages, comparable across commits.
+
+Times row extraction, ``_parse_row``, ``get_status_from_image_src``, dates
+popup parsing and ``filter_activities`` on the pages in ``fixtures/``, with
+the catalog at its usual size and at 10x. Nothing touches the network; with
+``--browser`` the extraction scripts also run in Chromium against the same
+pages loaded with ``set_content`` and every request aborted.
+
+    uv run python benchmarks/hot_paths.py --output before.json
+    uv run python benchmarks/hot_paths.py --compare before.json
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from longueuil_aweille.browse import (
+    DATES_EXTRACT_SCRIPT,
+    ROW_EXTRACT_SCRIPT,
+    Activity,
+    ActivityScraper,
+    RowData,
+    dates_rows_from_document,
+    rows_from_document,
+    select_resident_dates,
+)
+from longueuil_aweille.schedule import parse_price, parse_site_date, parse_time_range
+from longueuil_aweille.status import get_status_from_image_src
+from longueuil_aweille.webforms import parse_html
+
+FIXTURES = Path(__file__).parent / "fixtures"
+RESULTS_PAGE = FIXTURES / "results.html"
+DATES_POPUP = FIXTURES / "dates_popup.html"
+
+# Roughly what one unfiltered search of the site returns.
+CATALOG_SIZE = 1_000
+SCALES = (1, 10)
+
+# Typical browse filters; each round runs all of them.
+FILTERS: list[dict[str, Any]] = [
+    {"name_contains": "natation"},
+    {"location_contains": "piscine", "age": 4},
+    {"day": "samedi"},
+    {"day": "mer", "age": 8, "max_price": 10_000},
+    {"name_contains": "yoga", "time_from": 9 * 60, "time_until": 12 * 60},
+]
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 1.2
+
+
+@dataclass
+class Timing:
+    name: str
+    scale: int
+    items: int
+    rounds: int
+    min_s: float
+    median_s: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "scale": self.scale,
+            "items": self.items,
+            "rounds": self.rounds,
+            "min_ms": round(self.min_s * 1e3, 4),
+            "median_ms": round(self.median_s * 1e3, 4),
+            "per_item_us": round(self.median_s * 1e6 / self.items, 4),
+        }
+
+
+def measure(
+    name: str,
+    scale: int,
+    items: int,
+    run: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+    min_time: float = 0.5,
+) -> Timing:
+    """Time ``run`` over enough rounds to fill ``min_time``; ``setup`` runs untimed before each."""
+    samples: list[float] = []
+    run()
+    while (sum(samples) < min_time and len(samples) < 10_000) or len(samples) < 5:
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return Timing(name, scale, items, len(samples), min(samples), statistics.median(samples))
+
+
+async def measure_async(
+    name: str, items: int, run: Callable[[], Awaitable[object]], min_time: float = 0.5
+) -> Timing:
+    samples: list[float] = []
+    await run()
+    while (sum(samples) < min_time and len(samples) < 10_000) or len(samples) < 5:
+        start = time.perf_counter()
+        await run()
+        samples.append(time.perf_counter() - start)
+    return Timing(name, 1, items, len(samples), min(samples), statistics.median(samples))
+
+
+def grid_rows(html: str) -> list[RowData]:
+    return [row for row in rows_from_document(parse_html(html)) if len(row["cells"]) >= 14]
+
+
+def catalog_rows(page_rows: list[RowData], size: int) -> list[RowData]:
+    """``size`` rows cycled from the saved page, each with its own activity code."""
+    rows = []
+    for i in range(size):
+        row = copy.deepcopy(page_rows[i % len(page_rows)])
+        name = row["cells"][2].split("\n")[0]
+        row["cells"][2] = f"{name}\nBM-{i:06}"
+        row["index"] = i
+        rows.append(row)
+    return rows
+
+
+def clear_parse_caches() -> None:
+    for parser in (parse_site_date, parse_time_range, parse_price):
+        parser.cache_clear()
+
+
+def run_offline(size: int, min_time: float) -> list[Timing]:
+    results_html = RESULTS_PAGE.read_text(encoding="utf-8")
+    popup_html = DATES_POPUP.read_text(encoding="utf-8")
+    page_rows = grid_rows(results_html)
+    popup_rows = dates_rows_from_document(parse_html(popup_html))
+    scraper = ActivityScraper()
+
+    timings = [
+        measure(
+            "parse_results_page",
+            1,
+            len(page_rows),
+            lambda: grid_rows(results_html),
+            min_time=min_time,
+        ),
+        measure(
+            "parse_dates_popup",
+            1,
+            1,
+            lambda: select_resident_dates(dates_rows_from_document(parse_html(popup_html))),
+            min_time=min_time,
+        ),
+        measure(
+            "select_resident_dates",
+            1,
+            1,
+            lambda: select_resident_dates(popup_rows),
+            min_time=min_time,
+        ),
+    ]
+
+    for scale in SCALES:
+        rows = catalog_rows(page_rows, size * scale)
+        statuses = [(row["status_src"] or "", row["status_alt"] or "") for row in rows]
+        activities: list[Activity] = []
+
+        def parse_rows(rows: list[RowData] = rows, out: list[Activity] = activities) -> None:
+            out[:] = [a for row in rows if (a := scraper._parse_row(row)) is not None]
+
+        # Parsers are memoized per process, so each round starts from empty caches.
+        timings.append(
+            measure("parse_row", scale, len(rows), parse_rows, clear_parse_caches, min_time)
+        )
+        timings.append(
+            measure(
+                "status_from_image",
+                scale,
+                len(statuses),
+                lambda statuses=statuses: [get_status_from_image_src(s, a) for s, a in statuses],
+                min_time=min_time,
+            )
+        )
+
+        filtering = ActivityScraper()
+        filtering.activities = activities
+
+        def run_filters(scraper: ActivityScraper = filtering) -> None:
+            for criteria in FILTERS:
+                scraper.filter_activities(**criteria)
+
+        def drop_index(scraper: ActivityScraper = filtering) -> None:
+            scraper._index = None
+
+        timings.append(
+            measure(
+                "filter_activities_cold", scale, len(activities), run_filters, drop_index, min_time
+            )
+        )
+        timings.append(
+            measure("filter_activities", scale, len(activities), run_filters, min_time=min_time)
+        )
+    return timings
+
+
+async def run_browser(min_time: float) -> list[Timing]:
+    from playwright.async_api import async_playwright
+
+    results_html = RESULTS_PAGE.read_text(encoding="utf-8")
+    popup_html = DATES_POPUP.read_text(encoding="utf-8")
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            page = await browser.new_page()
+            await page.route("**/*", lambda route: route.abort())
+
+            await page.set_content(results_html)
+            rows = page.locator("table tr")
+            count = await rows.count()
+            grid = await measure_async(
+                "browser_extract_rows",
+                count,
+                lambda: rows.evaluate_all(ROW_EXTRACT_SCRIPT),
+                min_time,
+            )
+
+            await page.set_content(popup_html)
+            table = page.locator("table.DatesInscriptions").first
+            popup = await measure_async(
+                "browser_extract_dates", 1, lambda: table.evaluate(DATES_EXTRACT_SCRIPT), min_time
+            )
+        finally:
+            await browser.close()
+    return [grid, popup]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> bool:
+    """Print median ratios against ``baseline``; True when nothing slowed past ``threshold``."""
+    before = {f"{b['name']}@{b['scale']}x": b for b in baseline["benchmarks"]}
+    ok = True
+    print(f"{'benchmark':<32} {baseline['revision']:>12} {current['revision']:>12}  ratio")
+    for result in current["benchmarks"]:
+        key = f"{result['name']}@{result['scale']}x"
+        old = before.get(key)
+        if old is None:
+            print(f"{key:<32} {'-':>12} {result['median_ms']:>10.3f}ms  new")
+            continue
+        ratio = result["median_ms"] / old["median_ms"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  slower"
+            ok = False
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(
+            f"{key:<32} {old['median_ms']:>10.3f}ms {result['median_ms']:>10.3f}ms"
+            f"  {ratio:.2f}x{flag}"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=CATALOG_SIZE, help="Activities at 1x")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds per benchmark")
+    parser.add_argument("--browser", action="store_true", help="Also time extraction in Chromium")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Results JSON from an earlier run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Median ratio above which --compare reports a slowdown and exits with 1",
+    )
+    args = parser.parse_args()
+
+    timings = run_offline(args.size, args.min_time)
+    skipped: dict[str, str] = {}
+    if args.browser:
+        try:
+            timings += asyncio.run(run_browser(args.min_time))
+        except Exception as e:
+            skipped["browser"] = str(e).splitlines()[0]
+            print(f"Skipping browser benchmarks: {skipped['browser']}", file=sys.stderr)
+
+    results = {
+        "schema": SCHEMA_VERSION,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "size": args.size,
+        "benchmarks": [timing.to_dict() for timing in timings],
+        "skipped": skipped,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+    elif not args.output:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Memory held by catalog snapshots as plain ``Activity`` lists vs ``ActivityCodec`` rows.
+
+Each snapshot is built from freshly made strings, as a new scrape would
+produce, and a small share of activities change between snapshots.
+
+    uv run python benchmarks/memory.py --activities 10000 --snapshots 10
+"""
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from longueuil_aweille.browse import Activity, RegistrationDates
+from longueuil_aweille.compact import ActivityCodec
+from longueuil_aweille.status import ActivityStatus
+
+NAMES = ["Natation", "Parent-bébé", "Aquaforme", "Yoga doux", "Patinage libre", "Karaté"]
+DOMAINS = ["Activités aquatiques (Vieux-Longueuil)", "Sports de glace", "Arts martiaux"]
+LOCATIONS = ["Piscine Olympique", "Aréna Jacques-Cartier", "Centre communautaire Hubert-Perron"]
+PROMOTERS = ["Ville de Longueuil", "Club de natation Longueuil", "Association de karaté"]
+DAYS = ["Lundi", "Mardi", "Mercredi", "Samedi", "Dimanche"]
+PRICES = ["45,00 $", "62,50 $", "Gratuit", "120,00 $"]
+MONTHS = ["janvier", "avril", "septembre"]
+PAGE_URL = "https://loisir.longueuil.quebec/inscription/Pages/Anonyme/Resultat/Page.fr.aspx"
+
+
+def fresh(text: str) -> str:
+    """A new string object with the same value, like one parsed from a page."""
+    return "".join(list(text))
+
+
+def make_activity(i: int, rng: random.Random, spots: int | None = None) -> Activity:
+    month = MONTHS[i % len(MONTHS)]
+    hour = 8 + i % 12
+    return Activity(
+        name=fresh(f"{NAMES[i % len(NAMES)]} niveau {i % 10 + 1}"),
+        code=fresh(f"AQ-{i:05}"),
+        domain=fresh(DOMAINS[i % len(DOMAINS)]),
+        age_min=i % 6,
+        age_max=(i % 6) + 8,
+        start_date=fresh(f"{i % 28 + 1} {month} 2025"),
+        end_date=fresh(f"{i % 28 + 1} {month} 2026"),
+        promoter=fresh(PROMOTERS[i % len(PROMOTERS)]),
+        spots=rng.randint(0, 20) if spots is None else spots,
+        price=fresh(PRICES[i % len(PRICES)]),
+        days=fresh(DAYS[i % len(DAYS)]),
+        times=fresh(f"{hour} h 00 à {hour + 1} h 00"),
+        location=fresh(LOCATIONS[i % len(LOCATIONS)]),
+        status=ActivityStatus.AVAILABLE if i % 4 else ActivityStatus.NOT_YET,
+        page_url=fresh(PAGE_URL),
+        registration_dates=RegistrationDates(fresh("2025-12-01, 19:00"), fresh("2025-12-15")),
+        page_number=i // 50 + 1,
+        dates_button=fresh(f"ctlGrille$ctl{i:05}$ctlDates"),
+    )
+
+
+def snapshots(count: int, size: int, churn: float, seed: int) -> list[list[Activity]]:
+    """Deterministic snapshots where ``churn`` of the activities change spots each time."""
+    rng = random.Random(seed)
+    spots = [rng.randint(0, 20) for _ in range(size)]
+    result = []
+    for _ in range(count):
+        for i in rng.sample(range(size), int(size * churn)):
+            spots[i] = max(0, spots[i] - 1)
+        result.append([make_activity(i, rng, spots[i]) for i in range(size)])
+    return result
+
+
+def retained(build: Callable[[], Any]) -> tuple[int, Any]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, kept
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--activities", type=int, default=10_000)
+    parser.add_argument("--snapshots", type=int, default=10)
+    parser.add_argument("--churn", type=float, default=0.02, help="Share changed per snapshot")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    def plain() -> list[list[Activity]]:
+        return snapshots(args.snapshots, args.activities, args.churn, args.seed)
+
+    def compact() -> tuple[ActivityCodec, list[Any]]:
+        codec = ActivityCodec()
+        history = []
+        for snapshot in plain():
+            history.append(codec.encode_all(snapshot))
+        return codec, history
+
+    plain_bytes, plain_history = retained(plain)
+    compact_bytes, (codec, compact_history) = retained(compact)
+
+    lossless = all(
+        codec.decode_all(rows) == activities
+        for rows, activities in zip(compact_history, plain_history, strict=True)
+    )
+    print(
+        json.dumps(
+            {
+                "benchmark": "memory",
+                "activities": args.activities,
+                "snapshots": args.snapshots,
+                "churn": args.churn,
+                "activity_bytes": plain_bytes,
+                "compact_bytes": compact_bytes,
+                "ratio": round(plain_bytes / compact_bytes, 2),
+                "distinct_rows": len({id(row) for rows in compact_history for row in rows}),
+                "distinct_strings": len(codec.strings),
+                "lossless": lossless,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Race the real RegistrationBot against the local site simulator and report latency percentiles.
+
+Each run starts a fresh simulated site where the target activity sits on
+``--target-page`` and opens ``--open-after`` seconds later, then runs the
+bot in Chromium until the place is reserved. The site timestamps each step,
+so the report gives, from the opening: the first response showing the row
+available (poll gap), the row being selected (detection), the cart, and the
+confirmed reservation (time-to-reservation).
+
+    uv run python benchmarks/race.py --runs 10 --scheduler adaptive
+    uv run python benchmarks/race.py --runs 10 --backend http --network lean --snipe
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from longueuil_aweille.config import Participant, Settings
+from longueuil_aweille.registration import RegistrationBot, RegistrationStatus
+from longueuil_aweille.schedule import SITE_TIMEZONE
+from longueuil_aweille.simulator import RegistrationSite, demo_catalog, serve
+
+TARGET = "Parent-bébé"
+CREDENTIALS = {"01234567890123": "5145551234"}
+METRICS = {
+    "poll_gap": "first_served",
+    "detection": "selected",
+    "in_cart": "in_cart",
+    "time_to_reservation": "reserved",
+}
+
+
+class BenchmarkBot(RegistrationBot):
+    """Keeps the reservation instead of asking on stdin whether to undo it."""
+
+    async def _prompt_unregister(self) -> bool:
+        return False
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    return {
+        "p50_ms": round(percentile(values, 0.5) * 1e3, 1),
+        "p90_ms": round(percentile(values, 0.9) * 1e3, 1),
+        "p99_ms": round(percentile(values, 0.99) * 1e3, 1),
+        "max_ms": round(max(values) * 1e3, 1),
+        "mean_ms": round(statistics.fmean(values) * 1e3, 1),
+    }
+
+
+def race_once(args: argparse.Namespace) -> dict[str, Any]:
+    target_index = (args.target_page - 1) * args.per_page + args.per_page // 2
+    activities = demo_catalog(max(args.activities, target_index + 1), TARGET, target_index)
+    target = activities[target_index].code
+    opens_at = time.time() + args.open_after
+    site = RegistrationSite(
+        activities, CREDENTIALS, opens_at={target: opens_at}, per_page=args.per_page
+    )
+
+    with serve(site) as url:
+        settings = Settings(
+            registration_url=url,
+            headless=args.headless,
+            timeout=int(args.open_after) + 60,
+            refresh_interval=args.refresh_interval,
+            scheduler=args.scheduler,
+            domain=activities[target_index].domain,
+            activity_name=TARGET,
+            probe=args.probe,
+            backend=args.backend,
+            network_profile=args.network,
+            open_at=datetime.fromtimestamp(opens_at, SITE_TIMEZONE) if args.snipe else None,
+            participants=[
+                Participant(name=f"Participant {i}", age=5, carte_acces=card, telephone=phone)
+                for i, (card, phone) in enumerate(CREDENTIALS.items(), start=1)
+            ],
+        )
+        status = asyncio.run(BenchmarkBot(settings, verify=False).run())
+
+    return {
+        "status": status.value,
+        "requests": site.requests,
+        **site.events[target].since_opening(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--open-after", type=float, default=5.0, help="Seconds until it opens")
+    parser.add_argument("--activities", type=int, default=200, help="Activities on the site")
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--target-page", type=int, default=3, help="Results page of the target")
+    parser.add_argument("--refresh-interval", type=float, default=1.0)
+    parser.add_argument("--scheduler", choices=["fixed", "adaptive"], default="fixed")
+    parser.add_argument("--probe", action="store_true", help="Poll by replaying the postback")
+    parser.add_argument("--backend", choices=["browser", "http"], default="browser")
+    parser.add_argument("--network", choices=["full", "lean", "minimal"], default="full")
+    parser.add_argument("--snipe", action="store_true", help="Give the bot the opening time")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the bot's log")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    runs = []
+    for n in range(1, args.runs + 1):
+        run = race_once(args)
+        runs.append(run)
+        reserved = "never" if run["reserved"] is None else f"{run['reserved']:.2f}s after opening"
+        print(f"run {n}: {run['status']}, reserved {reserved}", file=sys.stderr)
+
+    succeeded = [r for r in runs if r["status"] == RegistrationStatus.SUCCESS.value]
+    results = {
+        "benchmark": "race",
+        "config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "runs": len(runs),
+        "failures": len(runs) - len(succeeded),
+        "metrics": {
+            name: summarize([r[event] for r in succeeded if r[event] is not None])
+            for name, event in METRICS.items()
+        },
+        "details": runs,
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
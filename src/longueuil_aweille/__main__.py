@@ -1,23 +1,91 @@
 import asyncio
+import json
+import time
+from collections.abc import Iterable
+from contextlib import nullcontext
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from enum import StrEnum
 from pathlib import Path
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
 from . import __version__
-from .browse import ActivityScraper, DomainNotFoundError
+from .browse import (
+    DAY_BITS,
+    DAY_VARIANTS,
+    Activity,
+    ActivityScraper,
+    DomainNotFoundError,
+    activity_key,
+)
+from .browser import (
+    DEFAULT_DAEMON_PORT,
+    BrowserDaemon,
+    running_daemon,
+    stop_daemon,
+)
+from .catalog import DEFAULT_CATALOG_PATH, ActivityCatalog
 from .config import Settings
+from .network import NetworkMonitor
+from .query import ActivityIndex, Query, SearchIndex, sort_activities
 from .registration import RegistrationBot
+from .replay import SessionArchive
+from .schedule import parse_site_date, parse_site_datetime, parse_time_range
+from .snipe import lookup_opening, resolve_target_names
 from .status import ActivityStatus, RegistrationStatus
-from .verify import VerificationBot, VerificationStatus
+from .verify import ParticipantVerification, VerificationBot, VerificationStatus
+from .waits import WaitStrategy
+from .watch import ActivityChange, CatalogWatcher, ChangeKind, plain_value
 
 app = typer.Typer(
     name="longueuil-aweille",
     help="Auto-register for Longueuil municipal activities",
 )
 console = Console()
+err_console = Console(stderr=True)
+
+
+class Backend(StrEnum):
+    BROWSER = "browser"
+    HTTP = "http"
+
+
+class Network(StrEnum):
+    FULL = "full"
+    LEAN = "lean"
+    MINIMAL = "minimal"
+
+
+class Scheduler(StrEnum):
+    FIXED = "fixed"
+    ADAPTIVE = "adaptive"
+
+
+class OutputFormat(StrEnum):
+    TABLE = "table"
+    NDJSON = "ndjson"
+
+
+class SortKey(StrEnum):
+    NAME = "name"
+    DATE = "date"
+    TIME = "time"
+    PRICE = "price"
+    SPOTS = "spots"
+
+
+SORT_FIELDS = {
+    SortKey.NAME: ("name",),
+    SortKey.DATE: ("start_day", "start_minute"),
+    SortKey.TIME: ("start_minute", "end_minute"),
+    SortKey.PRICE: ("price_cents",),
+    SortKey.SPOTS: ("spots",),
+}
 
 
 def version_callback(value: bool) -> None:
@@ -26,6 +94,118 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def print_wait_profile(waits: WaitStrategy) -> None:
+    summary = waits.summary()
+    if not summary:
+        return
+
+    table = Table(title="Wait profile")
+    table.add_column("Step", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Avg (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    table.add_column("Gave up", justify="right")
+    table.add_column("Fixed sleep (ms)", justify="right", style="dim")
+    for step in summary:
+        table.add_row(
+            step.step,
+            str(step.count),
+            f"{step.avg_ms:.0f}",
+            f"{step.max_ms:.0f}",
+            str(step.timeouts),
+            str(step.legacy_ms) if step.legacy_ms is not None else "-",
+        )
+    console.print()
+    console.print(table)
+
+
+def print_verification_results(results: list[ParticipantVerification]) -> None:
+    labels = {
+        VerificationStatus.VALID: "[green]Valid[/]",
+        VerificationStatus.INVALID: "[red]Invalid[/]",
+        VerificationStatus.ERROR: "[yellow]Could not verify[/]",
+    }
+
+    table = Table(title="Credentials")
+    table.add_column("Participant", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time (s)", justify="right")
+    for result in results:
+        table.add_row(result.participant.name, labels[result.status], f"{result.elapsed:.1f}")
+    console.print(table)
+
+
+def open_archive(record: Path | None, replay: Path | None, out: Console) -> SessionArchive | None:
+    if record is not None and replay is not None:
+        out.print("[red]Error: --record and --replay cannot be used together[/red]")
+        raise typer.Exit(1)
+    if record is not None:
+        return SessionArchive.record(record)
+    if replay is None:
+        return None
+    try:
+        archive = SessionArchive.replay(replay)
+    except ValueError as e:
+        out.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+    out.print(f"[dim]Replaying {len(archive.entries)} recorded requests from {replay}[/dim]")
+    return archive
+
+
+def finish_archive(
+    archive: SessionArchive, waits: WaitStrategy, elapsed: float, out: Console
+) -> None:
+    """Save a recording, or print how a replay's steps compare with the recorded run."""
+    if archive.mode == "record":
+        archive.save(waits.summary(), elapsed)
+        out.print(f"[dim]Recorded {len(archive.entries)} requests to {archive.path}[/dim]")
+        return
+
+    if archive.missed:
+        out.print(
+            f"[yellow]{len(archive.missed)} request(s) were not in the archive and were "
+            f"aborted, e.g. {archive.missed[0]}[/yellow]"
+        )
+
+    table = Table(title="Recorded vs replayed")
+    table.add_column("Step", style="cyan")
+    table.add_column("Recorded avg (ms)", justify="right")
+    table.add_column("Replayed avg (ms)", justify="right")
+    table.add_column("Ratio", justify="right")
+    for step in archive.compare(waits.summary()):
+        table.add_row(
+            step.step,
+            "-" if step.recorded_ms is None else f"{step.recorded_ms:.0f}",
+            "-" if step.replayed_ms is None else f"{step.replayed_ms:.0f}",
+            "-" if step.ratio is None else f"{step.ratio:.2f}x",
+        )
+    recorded = archive.recorded_elapsed
+    table.add_row(
+        "[bold]whole run[/]",
+        "-" if recorded is None else f"{recorded * 1000:.0f}",
+        f"{elapsed * 1000:.0f}",
+        f"{elapsed / recorded:.2f}x" if recorded else "-",
+    )
+    out.print()
+    out.print(table)
+
+
+def resolve_opening(at: str, settings: Settings, catalog_path: Path) -> datetime:
+    if at == "auto":
+        with ActivityCatalog(catalog_path) as catalog:
+            opening = asyncio.run(lookup_opening(settings, catalog))
+        if opening is None:
+            console.print("[red]Error: Could not find when registration opens[/red]")
+            raise typer.Exit(1)
+        return opening
+
+    opening = parse_site_datetime(at)
+    if opening is None:
+        console.print(f"[red]Error: Could not parse --at '{at}'[/red]")
+        raise typer.Exit(1)
+    return opening
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -67,7 +247,56 @@ def register(
     verify_credentials: bool = typer.Option(
         True,
         "--verify/--no-verify",
-        help="Verify credentials before registration",
+        help="Verify credentials during the search; stop before the cart if any are rejected",
+    ),
+    backend: Backend = typer.Option(
+        None,
+        "--backend",
+        help="Poll with browser reloads or with plain HTTP postbacks",
+    ),
+    network: Network = typer.Option(
+        None,
+        "--network",
+        help="Load everything, skip images/fonts/trackers (lean), or bare pages (minimal)",
+    ),
+    scheduler: Scheduler = typer.Option(
+        None,
+        "--scheduler",
+        help="Poll at a fixed interval, or back off while not yet open and adapt to latency",
+    ),
+    probe: bool = typer.Option(
+        None,
+        "--probe/--no-probe",
+        help="Poll by replaying the results request instead of reloading the page",
+    ),
+    profile_waits: bool = typer.Option(
+        False,
+        "--profile-waits",
+        help="Report how long each page wait actually took",
+    ),
+    at: str = typer.Option(
+        None,
+        "--at",
+        help="When registration opens (e.g. '2025-12-01 19:00'), or 'auto' to look it up",
+    ),
+    catalog_path: Path = typer.Option(
+        DEFAULT_CATALOG_PATH,
+        "--catalog",
+        envvar="LONGUEUIL_CATALOG",
+        help="Path to the local activity catalog (used by --at auto and to respell names)",
+    ),
+    record: Path | None = typer.Option(
+        None,
+        "--record",
+        dir_okay=False,
+        help="Save the browser's traffic to this HAR file for later --replay",
+    ),
+    replay: Path | None = typer.Option(
+        None,
+        "--replay",
+        exists=True,
+        dir_okay=False,
+        help="Serve the browser's traffic from a --record HAR file instead of the network",
     ),
 ) -> None:
     """Run the registration bot."""
@@ -79,35 +308,46 @@ def register(
         settings.headless = headless
     if timeout is not None:
         settings.timeout = timeout
+    if backend is not None:
+        settings.backend = backend.value
+    if network is not None:
+        settings.network_profile = network.value
+    if scheduler is not None:
+        settings.scheduler = scheduler.value
+    if probe is not None:
+        settings.probe = probe
+    if at is not None:
+        settings.open_at = resolve_opening(at, settings, catalog_path)
+    with ActivityCatalog(catalog_path) as catalog:
+        for original, spelling in resolve_target_names(settings, catalog):
+            console.print(f"[dim]Matched '{original}' to '{spelling}' from the catalog[/dim]")
 
     if not settings.participants:
         console.print("[red]Error: No participants configured[/red]")
         raise typer.Exit(1)
 
-    if verify_credentials:
-        console.print("[dim]Verifying credentials...[/dim]")
-        for participant in settings.participants:
-            bot = VerificationBot(
-                carte_acces=participant.carte_acces,
-                telephone=participant.telephone,
-                headless=True,
-            )
-            status = asyncio.run(bot.run())
-            if status == VerificationStatus.INVALID:
-                console.print(f"[red]Invalid credentials for {participant.name}[/red]")
-                raise typer.Exit(1)
-            elif status == VerificationStatus.ERROR:
-                console.print(
-                    f"[yellow]Could not verify {participant.name}, continuing anyway[/yellow]"
-                )
-            else:
-                console.print(f"[green]Verified {participant.name}[/green]")
-        console.print()
+    archive = open_archive(record, replay, console)
+    if archive is not None and (
+        settings.backend == "http" or settings.probe or settings.open_at is not None
+    ):
+        # These make requests outside the page, which the archive never sees.
+        console.print(
+            "[red]Error: --record and --replay need the browser backend, "
+            "without --probe or --at[/red]"
+        )
+        raise typer.Exit(1)
 
     info_table = Table(show_header=False, box=None, padding=(0, 2))
+    targets = settings.resolved_targets()
     info_table.add_row("[bold]Domain:[/]", settings.domain)
-    info_table.add_row("[bold]Activity:[/]", settings.activity_name)
+    if len(targets) > 1:
+        for rank, target in enumerate(targets, 1):
+            info_table.add_row(f"[bold]Target {rank}:[/]", target.label)
+    else:
+        info_table.add_row("[bold]Activity:[/]", targets[0].label)
     info_table.add_row("[bold]Participants:[/]", str(len(settings.participants)))
+    if settings.open_at is not None:
+        info_table.add_row("[bold]Opens at:[/]", settings.open_at.strftime("%Y-%m-%d %H:%M"))
 
     console.print(
         Panel(
@@ -122,11 +362,37 @@ def register(
 
     console.print()
 
-    reg_bot = RegistrationBot(settings)
+    waits = WaitStrategy(timeouts=settings.step_timeouts, profile=profile_waits)
+    if verify_credentials:
+        console.print("[dim]Verifying credentials while the search is set up...[/dim]")
+    monitor = NetworkMonitor(settings.network_profile, archive=archive)
+    reg_bot = RegistrationBot(
+        settings,
+        waits=waits,
+        verify=verify_credentials,
+        network=monitor,
+        report=lambda message: console.print(message, style="dim", markup=False),
+    )
+    start = time.perf_counter()
     reg_status = asyncio.run(reg_bot.run())
+    elapsed = time.perf_counter() - start
+    if monitor.stats.requests:
+        console.print(f"[dim]{monitor.summary()}[/dim]")
+    if archive is not None:
+        finish_archive(archive, waits, elapsed, console)
+
+    if verify_credentials and reg_bot.verification:
+        console.print()
+        print_verification_results(reg_bot.verification)
+
+    if profile_waits:
+        print_wait_profile(waits)
 
     console.print()
 
+    if isinstance(reg_bot.opening_to_cart, float):
+        console.print(f"[dim]Opening to cart: {reg_bot.opening_to_cart:.2f}s[/dim]")
+
     match reg_status:
         case RegistrationStatus.SUCCESS:
             console.print(Panel("[green bold]Registration completed[/]", border_style="green"))
@@ -186,13 +452,23 @@ def verify(
     carte_acces: str = typer.Option(..., "--carte", "-c", help="Numéro de carte d'accès"),
     telephone: str = typer.Option(..., "--tel", "-t", help="Numéro de téléphone"),
     headless: bool = typer.Option(True, help="Run browser in headless mode"),
+    network: Network = typer.Option(
+        Network.FULL,
+        "--network",
+        help="Load everything, skip images/fonts/trackers (lean), or bare pages (minimal)",
+    ),
 ) -> None:
     """Verify account credentials are valid."""
     console.print()
     console.print(f"[dim]Verifying credentials for carte: {carte_acces}[/dim]")
 
-    bot = VerificationBot(carte_acces=carte_acces, telephone=telephone, headless=headless)
+    monitor = NetworkMonitor(network.value)
+    bot = VerificationBot(
+        carte_acces=carte_acces, telephone=telephone, headless=headless, network=monitor
+    )
     status = asyncio.run(bot.run())
+    if monitor.stats.requests:
+        console.print(f"[dim]{monitor.summary()}[/dim]")
 
     console.print()
 
@@ -207,6 +483,148 @@ def verify(
             raise typer.Exit(1)
 
 
+STATUS_STYLES = {
+    ActivityStatus.AVAILABLE: "[green]Available[/]",
+    ActivityStatus.FULL: "[red]Full[/]",
+    ActivityStatus.CANCELLED: "[red]Cancelled[/]",
+    ActivityStatus.NEVER_AVAILABLE: "[dim]Never[/]",
+    ActivityStatus.NOT_YET: "[yellow]Not yet[/]",
+}
+
+
+def activity_table(activities: Iterable[Activity] = ()) -> Table:
+    table = Table()
+    table.add_column("Activity", style="cyan", no_wrap=False, width=35)
+    table.add_column("Age", style="white", width=10)
+    table.add_column("Day/Time", style="white", width=20)
+    table.add_column("Location", style="white", width=25)
+    table.add_column("Spots", style="white", justify="right", width=6)
+    table.add_column("Reg. Opens", style="white", width=18)
+    table.add_column("Status", style="white", width=12)
+    for activity in activities:
+        add_activity_row(table, activity)
+    return table
+
+
+def add_activity_row(table: Table, activity: Activity) -> None:
+    status_str = STATUS_STYLES.get(activity.status, activity.status.value)
+    age_str = (
+        f"{activity.age_min}-{activity.age_max}"
+        if activity.age_max < 150
+        else f"{activity.age_min}+"
+    )
+    location = activity.location[:25] if activity.location else "-"
+
+    reg_opens = "-"
+    if activity.registration_dates and activity.registration_dates.resident_start:
+        opening = parse_site_datetime(activity.registration_dates.resident_start)
+        reg_opens = (
+            f"{opening:%Y-%m-%d %H:%M}"
+            if opening is not None
+            else activity.registration_dates.resident_start
+        )
+
+    table.add_row(
+        activity.name[:35],
+        age_str,
+        format_schedule(activity),
+        location,
+        str(activity.spots),
+        reg_opens,
+        status_str,
+    )
+    table.title = f"Activities ({table.row_count} found)"
+
+
+def format_schedule(activity: Activity) -> str:
+    """Short weekdays and times from the parsed fields, e.g. ``Lun, Mer 9h00-9h45``."""
+    days = ", ".join(
+        variants[0].capitalize()
+        for day, variants in DAY_VARIANTS.items()
+        if activity.weekdays & DAY_BITS[day]
+    )
+    times = activity.times
+    if activity.start_minute is not None and activity.end_minute is not None:
+        times = format_minutes(activity.start_minute)
+        if activity.end_minute != activity.start_minute:
+            times += f"-{format_minutes(activity.end_minute)}"
+    return f"{days or activity.days} {times}".strip()
+
+
+def format_minutes(minutes: int) -> str:
+    return f"{minutes // 60}h{minutes % 60:02}"
+
+
+def parse_date_option(value: str, option: str) -> date | None:
+    if not value:
+        return None
+    parsed = parse_site_date(value)
+    if parsed is None:
+        console.print(f"[red]Error: Could not parse {option} '{value}'[/red]")
+        raise typer.Exit(1)
+    return parsed
+
+
+def parse_time_option(value: str, option: str) -> int | None:
+    if not value:
+        return None
+    parsed = parse_time_range(value)
+    if parsed is None:
+        console.print(f"[red]Error: Could not parse {option} '{value}'[/red]")
+        raise typer.Exit(1)
+    return parsed[0]
+
+
+def activity_json(activity: Activity) -> str:
+    data = asdict(activity)
+    data["status"] = activity.status.value
+    return json.dumps(data, ensure_ascii=False, default=date.isoformat)
+
+
+async def stream_activities(
+    scraper: ActivityScraper,
+    criteria: Query,
+    output: OutputFormat,
+    echo: bool = True,
+) -> tuple[list[Activity], list[Activity], bool]:
+    """Print matching activities as they are scraped; returns (scraped, matching, complete).
+
+    NDJSON lines carry registration dates only when the catalog already has
+    them; the table is redrawn with fetched dates once scraping is done.
+    """
+    scraped: list[Activity] = []
+    matches: list[Activity] = []
+    error: Exception | None = None
+    table = activity_table()
+    live = (
+        Live(table, console=console, transient=True, refresh_per_second=4)
+        if output == OutputFormat.TABLE
+        else nullcontext()
+    )
+    with live:
+        try:
+            async for activity in scraper.stream():
+                scraped.append(activity)
+                if not criteria.matches(activity):
+                    continue
+                matches.append(activity)
+                if output == OutputFormat.NDJSON:
+                    _, activity.registration_dates = scraper.dates_cache.lookup(
+                        activity_key(activity)
+                    )
+                    if echo:
+                        print(activity_json(activity), flush=True)
+                else:
+                    add_activity_row(table, activity)
+        except DomainNotFoundError:
+            raise
+        except Exception as e:
+            error = e
+    if error is not None:
+        err_console.print(f"[bold red]Scraping failed: {error}[/bold red]")
+    return scraped, matches, error is None
+
+
 @app.command()
 def browse(
     domain: str = typer.Option(
@@ -243,14 +661,120 @@ def browse(
         "--age",
         help="Filter by age (e.g., 5, 8, 12)",
     ),
+    query: str = typer.Option(
+        "",
+        "--query",
+        "-q",
+        help="Rank by fuzzy, accent-insensitive match on name, code, promoter and location",
+    ),
+    starts_from: str = typer.Option(
+        "",
+        "--starts-from",
+        help="Only activities starting on or after this date (e.g., 2026-01-10, '10 janvier 2026')",
+    ),
+    starts_until: str = typer.Option(
+        "",
+        "--starts-until",
+        help="Only activities starting on or before this date",
+    ),
+    after: str = typer.Option(
+        "",
+        "--after",
+        help="Only activities starting at or after this time (e.g., 9h, 18:30)",
+    ),
+    before: str = typer.Option(
+        "",
+        "--before",
+        help="Only activities ending by this time (e.g., 11h)",
+    ),
+    max_price: float | None = typer.Option(
+        None,
+        "--max-price",
+        min=0,
+        help="Only activities costing at most this many dollars",
+    ),
+    sort: SortKey | None = typer.Option(
+        None,
+        "--sort",
+        help="Sort the results; activities whose value could not be read go last",
+    ),
+    descending: bool = typer.Option(
+        False,
+        "--desc",
+        help="Sort in descending order",
+    ),
     headless: bool = typer.Option(
         True,
         "--headless/--no-headless",
         help="Run browser in headless mode",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of browser contexts scraping result pages in parallel",
+    ),
+    backend: Backend = typer.Option(
+        Backend.BROWSER,
+        "--backend",
+        help="Scrape with a browser or with plain HTTP postbacks",
+    ),
+    cached: bool = typer.Option(
+        False,
+        "--cached",
+        help="Answer from the local catalog when it is fresh enough",
+    ),
+    max_age: float = typer.Option(
+        24.0,
+        "--max-age",
+        help="Maximum catalog age in hours for --cached",
+    ),
+    catalog_path: Path = typer.Option(
+        DEFAULT_CATALOG_PATH,
+        "--catalog",
+        envvar="LONGUEUIL_CATALOG",
+        help="Path to the local activity catalog",
+    ),
+    network: Network = typer.Option(
+        Network.FULL,
+        "--network",
+        help="Load everything, skip images/fonts/trackers (lean), or bare pages (minimal)",
+    ),
+    profile_waits: bool = typer.Option(
+        False,
+        "--profile-waits",
+        help="Report how long each page wait actually took",
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        "--format",
+        "-f",
+        help="Live-updating table, or one JSON object per line on stdout as rows are parsed",
+    ),
+    record: Path | None = typer.Option(
+        None,
+        "--record",
+        dir_okay=False,
+        help="Save the browser's traffic to this HAR file for later --replay",
+    ),
+    replay: Path | None = typer.Option(
+        None,
+        "--replay",
+        exists=True,
+        dir_okay=False,
+        help="Serve the browser's traffic from a --record HAR file instead of the network",
+    ),
 ) -> None:
     """Browse available activities."""
-    console.print()
+    # With --format ndjson, stdout only carries activities.
+    notices = err_console if output == OutputFormat.NDJSON else console
+    notices.print()
+
+    archive = open_archive(record, replay, notices)
+    if archive is not None and (backend == Backend.HTTP or cached):
+        notices.print("[red]Error: --record and --replay need a live browser scrape[/red]")
+        raise typer.Exit(1)
 
     filters = []
     if domain:
@@ -265,86 +789,297 @@ def browse(
         filters.append(f"day: {day}")
     if age:
         filters.append(f"age: {age}")
+    if query:
+        filters.append(f"query: {query}")
+    if starts_from or starts_until:
+        filters.append(f"starts: {starts_from or '…'} to {starts_until or '…'}")
+    if after or before:
+        filters.append(f"time: {after or '…'} to {before or '…'}")
+    if max_price is not None:
+        filters.append(f"max price: {max_price:.2f} $")
 
     if filters:
-        console.print(f"[dim]Browsing activities ({', '.join(filters)})[/dim]")
+        notices.print(f"[dim]Browsing activities ({', '.join(filters)})[/dim]")
     else:
-        console.print("[dim]Browsing all activities[/dim]")
+        notices.print("[dim]Browsing all activities[/dim]")
 
-    scraper = ActivityScraper(
-        domain=domain,
-        available_only=available_only,
-        headless=headless,
+    criteria = Query(
+        name_contains,
+        location_contains,
+        day=day,
+        age=age,
+        starts_from=parse_date_option(starts_from, "--starts-from"),
+        starts_until=parse_date_option(starts_until, "--starts-until"),
+        time_from=parse_time_option(after, "--after"),
+        time_until=parse_time_option(before, "--before"),
+        max_price=None if max_price is None else round(max_price * 100),
     )
+    waits = WaitStrategy(profile=profile_waits)
+    monitor = NetworkMonitor(network.value, archive=archive)
+    start = time.perf_counter()
+    with ActivityCatalog(catalog_path) as catalog:
+        scraper = ActivityScraper(
+            domain=domain,
+            available_only=available_only,
+            headless=headless,
+            workers=workers,
+            backend=backend.value,
+            dates_cache=catalog.dates_cache(),
+            waits=waits,
+            network=monitor,
+        )
 
-    try:
-        activities = asyncio.run(scraper.run())
-    except DomainNotFoundError as e:
-        console.print(f"[bold red]Error: Domain '{e.domain}' not found[/bold red]")
-        if e.available_domains:
-            console.print("\n[yellow]Available domains:[/yellow]")
-            for d in e.available_domains:
-                console.print(f"  • {d}")
-        raise typer.Exit(1) from None
+        stored: list[Activity] | None = None
+        if cached:
+            stored = catalog.load(domain, available_only, max_age=timedelta(hours=max_age))
 
-    if name_contains or location_contains or day or age:
-        activities = scraper.filter_activities(
-            name_contains=name_contains,
-            location_contains=location_contains,
-            day=day,
-            age=age,
-        )
+        if stored is not None:
+            notices.print(f"[dim]Using cached catalog ({len(stored)} activities)[/dim]")
+            scraper.activities = stored
+            activities = ActivityIndex(stored).query(criteria)
+        else:
+            try:
+                # Ranking and sorting need every row, so that NDJSON is printed at the end.
+                scraped, activities, complete = asyncio.run(
+                    stream_activities(scraper, criteria, output, echo=not (query or sort))
+                )
+            except DomainNotFoundError as e:
+                notices.print(f"[bold red]Error: Domain '{e.domain}' not found[/bold red]")
+                if e.available_domains:
+                    notices.print("\n[yellow]Available domains:[/yellow]")
+                    for d in e.available_domains:
+                        notices.print(f"  • {d}")
+                raise typer.Exit(1) from None
 
-    if not activities:
-        console.print("[yellow]No activities found matching criteria[/yellow]")
-        return
+            if scraped:
+                update = catalog.save(scraped, domain, available_only, complete=complete)
+                notices.print(
+                    f"[dim]Catalog updated: {update.added} added, {update.changed} changed, "
+                    f"{update.unchanged} unchanged[/dim]"
+                )
+            if not complete:
+                notices.print("[yellow]Partial results; the catalog is not marked fresh[/yellow]")
 
-    table = Table(title=f"Activities ({len(activities)} found)")
-    table.add_column("Activity", style="cyan", no_wrap=False, width=35)
-    table.add_column("Age", style="white", width=10)
-    table.add_column("Day/Time", style="white", width=20)
-    table.add_column("Location", style="white", width=25)
-    table.add_column("Spots", style="white", justify="right", width=6)
-    table.add_column("Reg. Opens", style="white", width=18)
-    table.add_column("Status", style="white", width=12)
+        if query:
+            activities = [hit.activity for hit in SearchIndex(activities).search(query, limit=0)]
+        if sort:
+            activities = sort_activities(activities, SORT_FIELDS[sort], descending)
+        if output == OutputFormat.NDJSON and (stored is not None or query or sort):
+            for activity in activities:
+                print(activity_json(activity))
 
-    status_styles = {
-        ActivityStatus.AVAILABLE: "[green]Available[/]",
-        ActivityStatus.FULL: "[red]Full[/]",
-        ActivityStatus.CANCELLED: "[red]Cancelled[/]",
-        ActivityStatus.NEVER_AVAILABLE: "[dim]Never[/]",
-        ActivityStatus.NOT_YET: "[yellow]Not yet[/]",
-    }
+        if not activities:
+            notices.print("[yellow]No activities found matching criteria[/yellow]")
+            if archive is not None:
+                finish_archive(archive, waits, time.perf_counter() - start, notices)
+            return
 
-    for activity in activities:
-        status_str = status_styles.get(activity.status, activity.status.value)
-        age_str = (
-            f"{activity.age_min}-{activity.age_max}"
-            if activity.age_max < 150
-            else f"{activity.age_min}+"
-        )
-        schedule = f"{activity.days[:10]} {activity.times[:8]}".strip()
-        location = activity.location[:25] if activity.location else "-"
+        if stored is None and output == OutputFormat.TABLE:
+            asyncio.run(scraper.fetch_registration_dates(activities))
+            catalog.save_dates(scraper.dates_cache)
 
-        reg_opens = "-"
-        if activity.registration_dates and activity.registration_dates.resident_start:
-            date_str = activity.registration_dates.resident_start
-            if "," in date_str:
-                date_str = date_str.split(",")[0]
-            reg_opens = date_str[:16]
+    if output == OutputFormat.TABLE:
+        console.print()
+        console.print(activity_table(activities))
+    elapsed = time.perf_counter() - start
+    if monitor.stats.requests:
+        notices.print(f"[dim]{monitor.summary()}[/dim]")
+    if archive is not None:
+        finish_archive(archive, waits, elapsed, notices)
 
-        table.add_row(
-            activity.name[:35],
-            age_str,
-            schedule[:20],
-            location,
-            str(activity.spots),
-            reg_opens,
-            status_str,
+    if profile_waits:
+        print_wait_profile(waits)
+
+
+def format_change(change: ActivityChange) -> str:
+    activity = change.activity
+    label = f"{activity.name} ({activity.code})" if activity.code else activity.name
+    if change.kind == ChangeKind.ADDED:
+        return f"[green]+[/] {label}"
+    if change.kind == ChangeKind.REMOVED:
+        return f"[red]-[/] {label}"
+    fields = ", ".join(
+        f"{name} {plain_value(before)} → {plain_value(after)}"
+        for name, (before, after) in change.fields.items()
+    )
+    return f"[yellow]~[/] {label}: {fields}"
+
+
+async def watch_catalog(
+    watcher: CatalogWatcher,
+    catalog: ActivityCatalog,
+    interval: float,
+    scans: int,
+    output: OutputFormat,
+) -> None:
+    scraper = watcher.scraper
+    done = 0
+    while True:
+        changes = await watcher.scan()
+        if watcher.stats.complete and watcher.activities:
+            catalog.save(list(watcher.activities.values()), scraper.domain, scraper.available_only)
+
+        for change in changes:
+            if output == OutputFormat.NDJSON:
+                print(json.dumps(change.to_dict(), ensure_ascii=False), flush=True)
+            else:
+                console.print(format_change(change))
+        stats = watcher.stats
+        err_console.print(
+            f"[dim]{datetime.now():%H:%M:%S} {len(watcher.activities)} activities, "
+            f"{stats.pages_unchanged}/{stats.pages} pages unchanged, "
+            f"{stats.rows_parsed} rows parsed, {len(changes)} change(s)[/dim]"
         )
 
+        done += 1
+        if scans and done >= scans:
+            return
+        await asyncio.sleep(interval)
+
+
+@app.command()
+def watch(
+    domain: str = typer.Option(
+        "",
+        "--domain",
+        "-d",
+        help="Domain to watch (e.g., 'Activités aquatiques')",
+    ),
+    available_only: bool = typer.Option(
+        False,
+        "--available",
+        "-a",
+        help="Watch only activities with available spots",
+    ),
+    interval: float = typer.Option(
+        300.0,
+        "--interval",
+        "-i",
+        min=1.0,
+        help="Seconds between scans",
+    ),
+    scans: int = typer.Option(
+        0,
+        "--scans",
+        min=0,
+        help="Stop after this many scans (0 watches until interrupted)",
+    ),
+    headless: bool = typer.Option(
+        True,
+        "--headless/--no-headless",
+        help="Run browser in headless mode",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of browser contexts scraping result pages in parallel",
+    ),
+    backend: Backend = typer.Option(
+        Backend.BROWSER,
+        "--backend",
+        help="Scrape with a browser or with plain HTTP postbacks",
+    ),
+    network: Network = typer.Option(
+        Network.FULL,
+        "--network",
+        help="Load everything, skip images/fonts/trackers (lean), or bare pages (minimal)",
+    ),
+    catalog_path: Path = typer.Option(
+        DEFAULT_CATALOG_PATH,
+        "--catalog",
+        envvar="LONGUEUIL_CATALOG",
+        help="Path to the local activity catalog, refreshed on every scan",
+    ),
+    output: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        "--format",
+        "-f",
+        help="One line per change, or one JSON object per change on stdout",
+    ),
+) -> None:
+    """Rescan periodically and print added, removed and changed activities."""
+    scraper = ActivityScraper(
+        domain=domain,
+        available_only=available_only,
+        headless=headless,
+        workers=workers,
+        backend=backend.value,
+        network=NetworkMonitor(network.value),
+    )
+    err_console.print(
+        f"[dim]Watching {domain or 'all domains'} every {interval:g}s; "
+        "the first scan records a baseline[/dim]"
+    )
+    with ActivityCatalog(catalog_path) as catalog:
+        try:
+            asyncio.run(watch_catalog(CatalogWatcher(scraper), catalog, interval, scans, output))
+        except DomainNotFoundError as e:
+            err_console.print(f"[bold red]Error: Domain '{e.domain}' not found[/bold red]")
+            raise typer.Exit(1) from None
+        except KeyboardInterrupt:
+            err_console.print("[dim]Stopped watching[/dim]")
+
+
+@app.command()
+def daemon(
+    port: int = typer.Option(
+        DEFAULT_DAEMON_PORT,
+        "--port",
+        "-p",
+        help="Local port for the browser's DevTools endpoint",
+    ),
+    headless: bool = typer.Option(
+        True,
+        "--headless/--no-headless",
+        help="Run browser in headless mode",
+    ),
+    warm: int = typer.Option(
+        1,
+        "--warm",
+        min=0,
+        help="Number of registration pages to keep loaded for 'register'",
+    ),
+    config: Path = typer.Option(
+        Path("config.toml"),
+        "--config",
+        "-c",
+        help="Configuration file providing the registration URL, if present",
+    ),
+    status: bool = typer.Option(False, "--status", help="Show whether a daemon is running"),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon"),
+) -> None:
+    """Keep a warm browser running that other commands attach to.
+
+    The endpoint is published in ~/.cache/longueuil-aweille/daemon.json, or in
+    the file named by LONGUEUIL_DAEMON_STATE, which the other commands read too.
+    """
     console.print()
-    console.print(table)
+
+    if status or stop:
+        state = stop_daemon() if stop else running_daemon()
+        if state is None:
+            console.print("[yellow]No browser daemon running[/yellow]")
+            raise typer.Exit(1)
+        action = "Stopped" if stop else "Running"
+        console.print(f"[green]{action} browser daemon (pid {state.pid}) at {state.endpoint}[/]")
+        return
+
+    if running_daemon() is not None:
+        console.print("[red]Error: A browser daemon is already running[/red]")
+        raise typer.Exit(1)
+
+    settings = Settings.from_toml(config) if config.exists() else Settings()
+    browser_daemon = BrowserDaemon(
+        port=port,
+        headless=headless,
+        warm=warm,
+        warm_url=settings.registration_url,
+        keepalive_interval=settings.keepalive_interval,
+    )
+    console.print(f"[dim]Starting browser daemon on {browser_daemon.endpoint} (Ctrl+C to stop)[/]")
+    asyncio.run(browser_daemon.run())
 
 
 if __name__ == "__main__":
@@ -1,18 +1,56 @@
+import asyncio
 import logging
-from dataclasses import dataclass
-
-from playwright.async_api import Locator, Page, async_playwright
-
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
+
+from playwright.async_api import Browser, Locator, Page, async_playwright
+
+from .browser import new_context, new_page, open_browser
+from .network import NetworkMonitor
+from .schedule import PARSE_CACHE_SIZE, parse_price, parse_site_date, parse_time_range
 from .status import (
     DEFAULT_REGISTRATION_URL,
     ActivityStatus,
+    Paginator,
     get_status_from_image_src,
-    iterate_pagination,
 )
+from .waits import WaitStrategy
+from .webforms import Element, WebFormsClient
+
+if TYPE_CHECKING:
+    from .query import ActivityIndex
+
+Backend = Literal["browser", "http"]
 
 logger = logging.getLogger(__name__)
 
 
+DAY_VARIANTS: dict[str, list[str]] = {
+    "mon": ["lun", "monday", "lundi"],
+    "tue": ["mar", "tuesday", "mardi"],
+    "wed": ["mer", "wednesday", "mercredi"],
+    "thu": ["jeu", "thursday", "jeudi"],
+    "fri": ["ven", "friday", "vendredi"],
+    "sat": ["sam", "saturday", "samedi"],
+    "sun": ["dim", "sunday", "dimanche"],
+}
+DAY_BITS = {day: 1 << i for i, day in enumerate(DAY_VARIANTS)}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def day_mask(days: str) -> int:
+    """Bitmask of the weekdays named in ``days`` (lowercase), one bit per DAY_VARIANTS key."""
+    mask = 0
+    for day, variants in DAY_VARIANTS.items():
+        if any(v in days for v in variants):
+            mask |= DAY_BITS[day]
+    return mask
+
+
 class BrowseError(Exception):
     pass
 
@@ -48,6 +86,232 @@ class Activity:
     status: ActivityStatus
     page_url: str = ""
     registration_dates: RegistrationDates | None = None
+    page_number: int = 0
+    dates_button: str = ""
+    # Parsed from the text fields above when the activity is created, for native
+    # comparisons; None when the site's text could not be parsed.
+    start_day: date | None = field(init=False, repr=False, compare=False)
+    end_day: date | None = field(init=False, repr=False, compare=False)
+    start_minute: int | None = field(init=False, repr=False, compare=False)
+    end_minute: int | None = field(init=False, repr=False, compare=False)
+    weekdays: int = field(init=False, repr=False, compare=False)
+    price_cents: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.start_day = parse_site_date(self.start_date)
+        self.end_day = parse_site_date(self.end_date)
+        self.start_minute, self.end_minute = parse_time_range(self.times) or (None, None)
+        self.weekdays = day_mask(self.days.lower())
+        self.price_cents = parse_price(self.price)
+
+
+def activity_key(activity: Activity) -> str:
+    if activity.code:
+        return activity.code
+    return "|".join((activity.name, activity.days, activity.times, activity.location))
+
+
+DEFAULT_DATES_TTL = 6 * 3600
+
+
+@dataclass
+class RegistrationDatesCache:
+    """Registration dates keyed by activity, each entry expiring after ``ttl`` seconds."""
+
+    ttl: float = DEFAULT_DATES_TTL
+    entries: dict[str, tuple[float, RegistrationDates | None]] = field(default_factory=dict)
+
+    def lookup(self, key: str) -> tuple[bool, RegistrationDates | None]:
+        entry = self.entries.get(key)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return False, None
+        return True, entry[1]
+
+    def store(
+        self, key: str, dates: RegistrationDates | None, fetched_at: float | None = None
+    ) -> None:
+        self.entries[key] = (fetched_at if fetched_at is not None else time.time(), dates)
+
+
+class RowData(TypedDict):
+    index: int
+    cells: list[str]
+    status_src: str | None
+    status_alt: str | None
+    dates_button: str | None
+
+
+@dataclass
+class ResultsPage:
+    """The raw rows of one results page, before they are parsed into activities."""
+
+    number: int
+    url: str
+    rows: list[RowData]
+
+
+# Pulls every results row in a single round trip instead of one per cell.
+ROW_EXTRACT_SCRIPT = """
+rows => rows.map((row, index) => {
+    const cells = Array.from(row.querySelectorAll("td"));
+    const img = cells.length
+        ? cells[0].querySelector("img[id*='Grille'], img[src*='Inscr']")
+        : null;
+    const info = cells.length > 1
+        ? cells[1].querySelector("input[type='image'][title*=\\"dates d'inscription\\"]")
+        : null;
+    return {
+        index,
+        cells: cells.map(cell => cell.innerText),
+        status_src: img ? img.getAttribute("src") || "" : null,
+        status_alt: img ? img.getAttribute("alt") || "" : null,
+        dates_button: info ? info.getAttribute("name") || info.id : null,
+    };
+})
+"""
+
+
+class DatesRow(TypedDict):
+    lieu: str | None
+    clientele: str | None
+    dates: list[str]
+
+
+DATES_EXTRACT_SCRIPT = """
+table => Array.from(table.querySelectorAll("tr")).map(row => {
+    const lieu = row.querySelector("td.Lieu");
+    const clientele = row.querySelector("td.Clientele");
+    return {
+        lieu: lieu ? lieu.innerText : null,
+        clientele: clientele ? clientele.innerText : null,
+        dates: Array.from(row.querySelectorAll("td.Dates")).map(cell => cell.innerText),
+    };
+})
+"""
+
+
+def rows_from_document(root: Element) -> list[RowData]:
+    """Extract results rows from parsed HTML, mirroring ``ROW_EXTRACT_SCRIPT``."""
+    rows: list[RowData] = []
+    for index, row in enumerate(el for el in root.iter() if el.tag == "tr"):
+        cells = row.find_all("td")
+        img = None
+        if cells:
+            img = next(
+                (
+                    el
+                    for el in cells[0].find_all("img")
+                    if "Grille" in el.get("id") or "Inscr" in el.get("src")
+                ),
+                None,
+            )
+        info = None
+        if len(cells) > 1:
+            info = next(
+                (
+                    el
+                    for el in cells[1].find_all("input")
+                    if el.get("type").lower() == "image"
+                    and "dates d'inscription" in el.get("title")
+                ),
+                None,
+            )
+        rows.append(
+            {
+                "index": index,
+                "cells": [cell.inner_text() for cell in cells],
+                "status_src": img.get("src") if img is not None else None,
+                "status_alt": img.get("alt") if img is not None else None,
+                "dates_button": (info.get("name") or info.get("id")) if info is not None else None,
+            }
+        )
+    return rows
+
+
+def dates_rows_from_document(root: Element) -> list[DatesRow]:
+    """Extract the dates popup rows from parsed HTML, mirroring ``DATES_EXTRACT_SCRIPT``."""
+    table = next(
+        (el for el in root.iter() if el.tag == "table" and "DatesInscriptions" in el.get("class")),
+        None,
+    )
+    if table is None:
+        return []
+
+    rows: list[DatesRow] = []
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        lieu = next((c for c in cells if "Lieu" in c.get("class").split()), None)
+        clientele = next((c for c in cells if "Clientele" in c.get("class").split()), None)
+        rows.append(
+            {
+                "lieu": lieu.inner_text() if lieu is not None else None,
+                "clientele": clientele.inner_text() if clientele is not None else None,
+                "dates": [c.inner_text() for c in cells if "Dates" in c.get("class").split()],
+            }
+        )
+    return rows
+
+
+def select_resident_dates(rows: list[DatesRow]) -> RegistrationDates | None:
+    """Pick the online (Internet) resident registration window from the dates popup."""
+    current_lieu = ""
+    for row in rows:
+        if row["lieu"] is not None:
+            current_lieu = row["lieu"]
+
+        if "Internet" not in current_lieu:
+            continue
+
+        clientele = row["clientele"]
+        if clientele is None or "Résident" not in clientele or "Non" in clientele:
+            continue
+
+        if len(row["dates"]) >= 2:
+            dates = RegistrationDates(
+                resident_start=row["dates"][0].strip(),
+                resident_end=row["dates"][1].strip(),
+            )
+            return dates if dates.resident_start else None
+
+    return None
+
+
+def split_page_range(page_count: int, workers: int) -> list[list[int]]:
+    """Split pages 1..page_count into contiguous chunks, one per worker."""
+    workers = max(1, min(workers, page_count))
+    size, extra = divmod(page_count, workers)
+    chunks: list[list[int]] = []
+    start = 1
+    for i in range(workers):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(list(range(start, end)))
+        start = end
+    return chunks
+
+
+def merge_pages(pages: dict[int, list[Activity]], seen: set[str] | None = None) -> list[Activity]:
+    """Merge per-page results in page order, dropping duplicate activity codes.
+
+    Pass the same ``seen`` set to merge pages in several batches.
+    """
+    merged: list[Activity] = []
+    seen = set() if seen is None else seen
+    for number in sorted(pages):
+        for activity in pages[number]:
+            if activity.code:
+                if activity.code in seen:
+                    continue
+                seen.add(activity.code)
+            merged.append(activity)
+    return merged
+
+
+def _parse_int(value: str, default: int) -> int:
+    value = value.strip()
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
 
 
 @dataclass
@@ -73,41 +337,81 @@ class ActivityScraper:
         timeout: int = 60,
         registration_url: str = DEFAULT_REGISTRATION_URL,
         selectors: BrowseSelectors = DEFAULT_BROWSE_SELECTORS,
+        workers: int = 1,
+        backend: Backend = "browser",
+        dates_cache: RegistrationDatesCache | None = None,
+        waits: WaitStrategy | None = None,
+        network: NetworkMonitor | None = None,
     ):
         self.domain = domain
         self.available_only = available_only
         self.headless = headless
         self.timeout = timeout
+        self.workers = workers
+        self.backend = backend
+        self.dates_cache = dates_cache if dates_cache is not None else RegistrationDatesCache()
+        self.waits = waits or WaitStrategy()
+        self.network = network or NetworkMonitor()
         self.registration_url = registration_url
         self.selectors = selectors
         self.activities: list[Activity] = []
+        self._index: ActivityIndex | None = None
 
     async def run(self) -> list[Activity]:
+        """Collect the stream; a failure part way through is logged and ends it early."""
+        try:
+            async for activity in self.stream():
+                self.activities.append(activity)
+        except DomainNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Scraping failed: {e}")
+        return self.activities
+
+    async def stream(self) -> AsyncIterator[Activity]:
+        """Yield activities as each results page is parsed, in page order.
+
+        Nothing is kept on the scraper; ``run()`` collects the stream into
+        ``self.activities``. A failure part way through is raised once the
+        pages before it are out, so callers can tell a partial scrape apart.
+        """
+        seen: set[str] = set()
+        async for results in self.stream_pages():
+            for activity in merge_pages({results.number: self.parse_page(results)}, seen):
+                yield activity
+
+    async def stream_pages(self) -> AsyncIterator[ResultsPage]:
+        """Yield the raw rows of each results page, in page order."""
         logger.info("Starting activity scraper...")
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.headless)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            try:
+        if self.backend == "http":
+            async for results in self._stream_http():
+                yield results
+            return
+
+        async with async_playwright() as pw, open_browser(pw, headless=self.headless) as browser:
+            if self.workers > 1:
+                async for results in self._scrape_parallel(browser):
+                    yield results
+            else:
+                page = await new_page(browser, network=self.network)
                 await self._navigate_and_search(page)
-                await self._scrape_all_pages(page)
-                return self.activities
-            except DomainNotFoundError:
-                raise
-            except Exception as e:
-                logger.error(f"Scraping failed: {e}")
-                return self.activities
-            finally:
-                await browser.close()
+                async for results in self._scrape_all_pages(page):
+                    yield results
+
+    def parse_page(self, results: ResultsPage) -> list[Activity]:
+        activities: list[Activity] = []
+        for data in results.rows:
+            activity = self._parse_row(data, results.url, results.number)
+            if activity is not None:
+                activities.append(activity)
+        return activities
 
     async def _navigate_and_search(self, page: Page) -> None:
         logger.info("Opening registration website...")
-        await page.goto(self.registration_url, wait_until="networkidle")
+        await page.goto(self.registration_url, wait_until="domcontentloaded")
 
         logger.info("Opening Disponibilités tab...")
         await page.get_by_role("link", name="Disponibilités").click()
-        await page.wait_for_timeout(1000)
 
         if self.available_only:
             logger.info("Selecting 'Rechercher les activités avec places disponibles'...")
@@ -116,30 +420,31 @@ class ActivityScraper:
             logger.info("Selecting 'Rechercher toutes les activités'...")
             radio = page.locator("input[name*='ctlSelDisponibilite'][value='ctlToutes']")
 
+        await self.waits.for_visible(radio, "tab")
         await radio.click()
-        await page.wait_for_timeout(500)
+        await self.waits.for_checked(radio, "option")
 
         if self.domain:
             logger.info("Opening Domaines tab...")
             await page.get_by_role("link", name="Domaines").click()
-            await page.wait_for_timeout(1000)
 
             logger.info(f"Selecting domain: {self.domain}")
             checkbox = page.locator(
                 f"//*[contains(text(), '{self.domain}')]/preceding::input[@type='checkbox'][1]"
             )
+            await self.waits.for_visible(checkbox, "tab")
 
             if await checkbox.count() == 0:
                 available_domains = await self._get_available_domains(page)
                 raise DomainNotFoundError(self.domain, available_domains)
 
             await checkbox.first.click()
-            await page.wait_for_timeout(1000)
+            await self.waits.for_checked(checkbox, "option")
 
         logger.info("Clicking search button...")
-        await page.locator(self.selectors.search_button).click()
-        await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(3000)
+        await self.waits.for_replaced(
+            page, page.locator(self.selectors.search_button).click, "search"
+        )
 
     async def _get_available_domains(self, page: Page) -> list[str]:
         checkboxes = page.locator("input[type='checkbox']")
@@ -156,156 +461,323 @@ class ActivityScraper:
 
         return domains
 
-    async def _scrape_all_pages(self, page: Page) -> None:
-        await self._scrape_current_page(page)
-
-        async def scrape_page(p: Page) -> None:
-            await self._scrape_current_page(p)
-            return None
-
-        await iterate_pagination(
-            page,
-            scrape_page,
-            pagination_selector=self.selectors.pagination_links,
-        )
-
-    async def _scrape_current_page(self, page: Page) -> None:
-        rows = await page.locator("table tr").all()
-        count = len(rows)
-        logger.info(f"Found {count} rows on current page")
+    async def _scrape_parallel(self, browser: Browser) -> AsyncIterator[ResultsPage]:
+        logger.info(f"Scraping with {self.workers} workers...")
+        page_count: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        scraped: asyncio.Queue[ResultsPage] = asyncio.Queue()
 
-        for row in rows:
-            activity = await self._parse_row(row, page)
-            if activity and activity.name:
-                self.activities.append(activity)
-
-    async def _parse_row(self, row: Locator, page: Page) -> Activity | None:
+        async def worker(index: int) -> None:
+            context = await new_context(browser, self.network)
+            try:
+                page = await context.new_page()
+                await self._navigate_and_search(page)
+                paginator = self._paginator(page)
+
+                # Only worker 0 walks the pager; the others reuse its count.
+                if index == 0:
+                    page_count.set_result(await paginator.discover())
+                count = await page_count
+                chunks = split_page_range(count, self.workers)
+                if index >= len(chunks):
+                    return
+
+                for number in chunks[index]:
+                    if not await paginator.goto(number):
+                        logger.warning(f"Worker {index}: could not reach page {number}")
+                        await scraped.put(ResultsPage(number, page.url, []))
+                        continue
+                    await scraped.put(await self._read_page(page, number))
+                    logger.info(f"Worker {index}: scraped page {number}/{count}")
+            except Exception as e:
+                # Do not leave the other workers waiting for a count that never comes.
+                if index == 0 and not page_count.done():
+                    page_count.set_exception(e)
+                raise
+            finally:
+                await context.close()
+
+        tasks = [asyncio.create_task(worker(i)) for i in range(self.workers)]
+        workers = asyncio.gather(*tasks)
+        # Pages finish out of order; hold each one until every page before it is out.
+        pending: dict[int, ResultsPage] = {}
+        number = 1
+        error: Exception | None = None
         try:
-            cells = row.locator("td")
-            cell_count = await cells.count()
-
-            if cell_count < 14:
-                return None
-
-            status = ActivityStatus.AVAILABLE
-
-            status_cell = cells.nth(0)
-            status_img = status_cell.locator("img[id*='Grille'], img[src*='Inscr']").first
-            if await status_img.count() > 0:
-                src = await status_img.get_attribute("src") or ""
-                alt = await status_img.get_attribute("alt") or ""
-                status = get_status_from_image_src(src, alt)
-
-            name_cell = await cells.nth(2).inner_text()
-            name_lines = name_cell.strip().split("\n")
-            name = name_lines[0].strip() if name_lines else ""
-            code = name_lines[1].strip() if len(name_lines) > 1 else ""
-
-            if not name or len(name) < 3:
-                return None
+            while not (workers.done() and scraped.empty()):
+                getter = asyncio.ensure_future(scraped.get())
+                waiting: set[asyncio.Future[Any]] = {getter, workers}
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    continue
+                results = getter.result()
+                pending[results.number] = results
+                while number in pending:
+                    yield pending.pop(number)
+                    number += 1
+            await workers
+        except Exception as e:
+            error = e
+        finally:
+            # A failed gather leaves the other workers running; stop each and let
+            # it close its context before the browser goes away.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Whatever is left comes after a page that never arrived.
+        for leftover in sorted(pending):
+            yield pending[leftover]
+        if error is not None:
+            raise error
+
+    def _paginator(self, page: Page) -> Paginator:
+        return Paginator(page, self.selectors.pagination_links, self.waits)
+
+    async def _scrape_all_pages(self, page: Page) -> AsyncIterator[ResultsPage]:
+        async for number in self._paginator(page):
+            yield await self._read_page(page, number)
+
+    async def _read_page(self, page: Page, number: int = 0) -> ResultsPage:
+        rows: list[RowData] = await page.locator("table tr").evaluate_all(ROW_EXTRACT_SCRIPT)
+        logger.info(f"Found {len(rows)} rows on current page")
+        return ResultsPage(number, page.url, rows)
+
+    def _parse_row(
+        self, data: RowData, page_url: str = "", page_number: int = 0
+    ) -> Activity | None:
+        cells = data["cells"]
+        if len(cells) < 14:
+            return None
 
-            domain = (await cells.nth(3).inner_text()).strip()
+        status = ActivityStatus.AVAILABLE
+        if data["status_src"] is not None:
+            status = get_status_from_image_src(data["status_src"], data["status_alt"] or "")
 
-            age_min_str = (await cells.nth(4).inner_text()).strip()
-            age_max_str = (await cells.nth(5).inner_text()).strip()
+        name_lines = cells[2].strip().split("\n")
+        name = name_lines[0].strip() if name_lines else ""
+        code = name_lines[1].strip() if len(name_lines) > 1 else ""
 
-            try:
-                age_min = int(age_min_str) if age_min_str else 0
-            except ValueError:
-                age_min = 0
-            try:
-                age_max = int(age_max_str) if age_max_str else 150
-            except ValueError:
-                age_max = 150
-
-            start_date = (await cells.nth(6).inner_text()).strip()
-            end_date = (await cells.nth(7).inner_text()).strip()
-            promoter = (await cells.nth(8).inner_text()).strip()
+        if not name or len(name) < 3:
+            return None
 
-            spots_str = (await cells.nth(9).inner_text()).strip()
-            try:
-                spots = int(spots_str) if spots_str else 0
-            except ValueError:
-                spots = 0
-
-            price = (await cells.nth(10).inner_text()).strip()
-            days = (await cells.nth(11).inner_text()).strip()
-            times = (await cells.nth(12).inner_text()).strip()
-            location = (await cells.nth(13).inner_text()).strip()
-
-            registration_dates = await self._get_registration_dates(cells.nth(1), page)
-
-            return Activity(
-                name=name,
-                code=code,
-                domain=domain,
-                age_min=age_min,
-                age_max=age_max,
-                start_date=start_date,
-                end_date=end_date,
-                promoter=promoter,
-                spots=spots,
-                price=price,
-                days=days,
-                times=times,
-                location=location,
-                status=status,
-                page_url=page.url,
-                registration_dates=registration_dates,
-            )
+        return Activity(
+            name=name,
+            code=code,
+            domain=cells[3].strip(),
+            age_min=_parse_int(cells[4], 0),
+            age_max=_parse_int(cells[5], 150),
+            start_date=cells[6].strip(),
+            end_date=cells[7].strip(),
+            promoter=cells[8].strip(),
+            spots=_parse_int(cells[9], 0),
+            price=cells[10].strip(),
+            days=cells[11].strip(),
+            times=cells[12].strip(),
+            location=cells[13].strip(),
+            status=status,
+            page_url=page_url,
+            page_number=page_number,
+            dates_button=data["dates_button"] or "",
+        )
 
-        except Exception as e:
-            logger.debug(f"Error parsing row: {e}")
-            return None
+    async def fetch_registration_dates(
+        self, activities: list[Activity], concurrency: int = 4
+    ) -> None:
+        """Fill in registration dates for ``activities`` only, using the cache when fresh.
+
+        Misses are grouped by results page and fetched concurrently, each group
+        replaying the search in its own browser context (or HTTP session).
+        Dates buttons are named after the row position, so each activity's
+        button is looked up again by its code on the page; an activity that is
+        no longer on its page is skipped and left out of the cache.
+        """
+        pending: dict[int, list[Activity]] = {}
+        for activity in activities:
+            if not activity.dates_button:
+                continue
+            hit, dates = self.dates_cache.lookup(activity_key(activity))
+            if hit:
+                activity.registration_dates = dates
+            else:
+                pending.setdefault(max(activity.page_number, 1), []).append(activity)
+
+        if not pending:
+            return
+
+        count = sum(len(group) for group in pending.values())
+        logger.info(f"Fetching registration dates for {count} activities...")
+        if self.backend == "http":
+            fetched = await self._fetch_dates_http(pending, concurrency)
+        else:
+            fetched = await self._fetch_dates_browser(pending, concurrency)
+
+        for group in pending.values():
+            for activity in group:
+                if activity_key(activity) in fetched:
+                    self.dates_cache.store(activity_key(activity), activity.registration_dates)
+
+    def _dates_buttons(self, results: ResultsPage, group: list[Activity]) -> dict[str, str]:
+        """Map the keys of ``group`` to the dates button of their row on this page."""
+        buttons: dict[str, str] = {}
+        for data in results.rows:
+            activity = self._parse_row(data)
+            if activity is not None and activity.dates_button:
+                buttons.setdefault(activity_key(activity), activity.dates_button)
+
+        found = {key: buttons[key] for key in map(activity_key, group) if key in buttons}
+        for activity in group:
+            if activity_key(activity) not in found:
+                logger.warning(
+                    f"{activity.code or activity.name} is no longer on page "
+                    f"{results.number}; skipping its registration dates"
+                )
+        return found
+
+    async def _fetch_dates_browser(
+        self, pending: dict[int, list[Activity]], concurrency: int
+    ) -> set[str]:
+        """Fetch the dates of each group on its page; returns the keys looked up."""
+        semaphore = asyncio.Semaphore(concurrency)
+        fetched: set[str] = set()
+
+        async with async_playwright() as pw, open_browser(pw, headless=self.headless) as browser:
+
+            async def fetch_page(number: int, group: list[Activity]) -> None:
+                async with semaphore:
+                    context = await new_context(browser, self.network)
+                    try:
+                        page = await context.new_page()
+                        await self._navigate_and_search(page)
+                        if not await self._paginator(page).goto(number):
+                            logger.warning(f"Could not reach page {number} for dates")
+                            return
+                        buttons = self._dates_buttons(await self._read_page(page, number), group)
+                        for activity in group:
+                            key = activity_key(activity)
+                            if key not in buttons:
+                                continue
+                            button = page.locator(f"input[name='{buttons[key]}']")
+                            activity.registration_dates = await self._get_registration_dates(
+                                button, page
+                            )
+                            fetched.add(key)
+                    except Exception as e:
+                        logger.warning(f"Fetching dates on page {number} failed: {e}")
+                    finally:
+                        await context.close()
+
+            await asyncio.gather(*(fetch_page(n, g) for n, g in sorted(pending.items())))
+        return fetched
+
+    async def _fetch_dates_http(
+        self, pending: dict[int, list[Activity]], concurrency: int
+    ) -> set[str]:
+        """Fetch the dates of each group on its page; returns the keys looked up."""
+        semaphore = asyncio.Semaphore(concurrency)
+        fetched: set[str] = set()
+
+        async def fetch_page(number: int, group: list[Activity]) -> None:
+            async with (
+                semaphore,
+                WebFormsClient(self.registration_url, timeout=self.timeout) as client,
+            ):
+                try:
+                    await client.open()
+                    await client.search(
+                        search_button_id=self.selectors.search_button.lstrip("#"),
+                        available_only=self.available_only,
+                        domain=self.domain,
+                    )
+                    while client.page_number < number:
+                        step = await client.goto_page(number) or await client.goto_page(
+                            client.page_number + 1
+                        )
+                        if step is None:
+                            logger.warning(f"Could not reach page {number} for dates")
+                            return
+                    assert client.document is not None
+                    buttons = self._dates_buttons(
+                        self._read_document(client, client.document), group
+                    )
+                    for activity in group:
+                        key = activity_key(activity)
+                        if key not in buttons:
+                            continue
+                        activity.registration_dates = await self._get_registration_dates_http(
+                            client, buttons[key]
+                        )
+                        fetched.add(key)
+                except Exception as e:
+                    logger.warning(f"Fetching dates on page {number} failed: {e}")
+
+        await asyncio.gather(*(fetch_page(n, g) for n, g in sorted(pending.items())))
+        return fetched
 
     async def _get_registration_dates(
-        self, info_cell: Locator, page: Page
+        self, info_btn: Locator, page: Page
     ) -> RegistrationDates | None:
         try:
-            info_btn = info_cell.locator("input[type='image'][title*=\"dates d'inscription\"]")
             if await info_btn.count() == 0:
                 return None
-
-            await info_btn.click()
-            await page.wait_for_timeout(500)
+            info_btn = info_btn.first
 
             dates_table = page.locator("table.DatesInscriptions")
-            if await dates_table.count() == 0:
+            await info_btn.click()
+            if not await self.waits.for_visible(dates_table, "popup"):
                 return None
 
-            dates = RegistrationDates()
-            current_lieu = ""
+            rows: list[DatesRow] = await dates_table.first.evaluate(DATES_EXTRACT_SCRIPT)
 
-            rows = await dates_table.first.locator("tr").all()
-            for row in rows:
-                lieu_cell = row.locator("td.Lieu")
-                if await lieu_cell.count() > 0:
-                    current_lieu = await lieu_cell.inner_text()
+            close_btn = page.locator("a[id*='ctlFermer']")
+            if await close_btn.count() > 0:
+                await close_btn.first.click()
+                await self.waits.for_hidden(dates_table, "popup_close")
 
-                if "Internet" not in current_lieu:
-                    continue
+            return select_resident_dates(rows)
 
-                clientelle_cell = row.locator("td.Clientele")
-                if await clientelle_cell.count() == 0:
-                    continue
+        except Exception as e:
+            logger.debug(f"Error getting registration dates: {e}")
+            return None
 
-                clientelle = await clientelle_cell.inner_text()
-                if "Résident" not in clientelle or "Non" in clientelle:
-                    continue
+    async def _stream_http(self) -> AsyncIterator[ResultsPage]:
+        async with WebFormsClient(self.registration_url, timeout=self.timeout) as client:
+            logger.info("Opening registration website over HTTP...")
+            await client.open()
+            logger.info("Posting search form...")
+            try:
+                root = await client.search(
+                    search_button_id=self.selectors.search_button.lstrip("#"),
+                    available_only=self.available_only,
+                    domain=self.domain,
+                )
+            except LookupError as e:
+                if self.domain and isinstance(e.args[0], list):
+                    raise DomainNotFoundError(self.domain, e.args[0]) from None
+                raise
 
-                date_cells = row.locator("td.Dates")
-                if await date_cells.count() >= 2:
-                    dates.resident_start = (await date_cells.nth(0).inner_text()).strip()
-                    dates.resident_end = (await date_cells.nth(1).inner_text()).strip()
-                    break
+            yield self._read_document(client, root)
 
-            close_btn = page.locator("a[id*='ctlFermer']")
-            if await close_btn.count() > 0:
-                await close_btn.first.click()
-                await page.wait_for_timeout(300)
+            number = 1
+            while (number := number + 1) <= max(client.page_numbers()):
+                next_root = await client.goto_page(number)
+                if next_root is None:
+                    raise LookupError(f"Pager link for page {number} not found")
+                yield self._read_document(client, next_root)
 
-            return dates if dates.resident_start else None
+    def _read_document(self, client: WebFormsClient, root: Element) -> ResultsPage:
+        rows = rows_from_document(root)
+        logger.info(f"Found {len(rows)} rows on page {client.page_number}")
+        return ResultsPage(client.page_number, client.url, rows)
 
+    async def _get_registration_dates_http(
+        self, client: WebFormsClient, button_name: str
+    ) -> RegistrationDates | None:
+        try:
+            popup = await client.activate_by_name(button_name)
+            if popup is None:
+                return None
+            return select_resident_dates(dates_rows_from_document(popup))
         except Exception as e:
             logger.debug(f"Error getting registration dates: {e}")
             return None
@@ -316,35 +788,32 @@ class ActivityScraper:
         location_contains: str = "",
         day: str = "",
         age: int = 0,
+        starts_from: date | None = None,
+        starts_until: date | None = None,
+        time_from: int | None = None,
+        time_until: int | None = None,
+        max_price: int | None = None,
     ) -> list[Activity]:
-        filtered = self.activities
-
-        if name_contains:
-            filtered = [a for a in filtered if name_contains.lower() in a.name.lower()]
-
-        if location_contains:
-            filtered = [a for a in filtered if location_contains.lower() in a.location.lower()]
-
-        if day:
-            day_map = {
-                "mon": ["lun", "monday", "lundi"],
-                "tue": ["mar", "tuesday", "mardi"],
-                "wed": ["mer", "wednesday", "mercredi"],
-                "thu": ["jeu", "thursday", "jeudi"],
-                "fri": ["ven", "friday", "vendredi"],
-                "sat": ["sam", "saturday", "samedi"],
-                "sun": ["dim", "sunday", "dimanche"],
-            }
-            day_lower = day.lower()[:3]
-            day_variants = day_map.get(day_lower, [day_lower])
-
-            def matches_day(activity: Activity) -> bool:
-                days_lower = activity.days.lower()
-                return any(v in days_lower for v in day_variants)
-
-            filtered = [a for a in filtered if matches_day(a)]
-
-        if age > 0:
-            filtered = [a for a in filtered if a.age_min <= age <= a.age_max]
-
-        return filtered
+        # query builds on this module, so it is imported when first needed.
+        from .query import ActivityIndex, Query
+
+        index = self._index
+        if (
+            index is None
+            or index.activities is not self.activities
+            or len(index) != len(self.activities)
+        ):
+            index = self._index = ActivityIndex(self.activities)
+        return index.query(
+            Query(
+                name_contains,
+                location_contains,
+                day=day,
+                age=age,
+                starts_from=starts_from,
+                starts_until=starts_until,
+                time_from=time_from,
+                time_until=time_until,
+                max_price=max_price,
+            )
+        )
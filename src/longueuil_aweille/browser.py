@@ -0,0 +1,250 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Self
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+from playwright.async_api import Error as PlaywrightError
+
+from .network import NetworkMonitor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAEMON_STATE_PATH = Path.home() / ".cache" / "longueuil-aweille" / "daemon.json"
+DEFAULT_DAEMON_PORT = 9333
+
+# Set on a warm page by the client that takes it, so no one else does.
+CLAIM_SCRIPT = """() => {
+    if (window.__aweilleClaimed) return false;
+    window.__aweilleClaimed = true;
+    return true;
+}"""
+
+
+@dataclass
+class DaemonState:
+    """What a running ``aweille daemon`` publishes so other commands can attach."""
+
+    endpoint: str
+    pid: int
+    headless: bool
+    started_at: float
+    warm_url: str = ""
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self)))
+
+    @classmethod
+    def load(cls, path: Path) -> Self | None:
+        try:
+            return cls(**json.loads(path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+
+def daemon_state_path() -> Path:
+    return Path(os.environ.get("LONGUEUIL_DAEMON_STATE", DEFAULT_DAEMON_STATE_PATH))
+
+
+def process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def running_daemon(path: Path | None = None) -> DaemonState | None:
+    """Return the running daemon's state, cleaning up after one that died."""
+    path = path or daemon_state_path()
+    state = DaemonState.load(path)
+    if state is None:
+        return None
+    if not process_alive(state.pid):
+        logger.debug(f"Removing stale daemon state for pid {state.pid}")
+        path.unlink(missing_ok=True)
+        return None
+    return state
+
+
+@asynccontextmanager
+async def open_browser(pw: Playwright, headless: bool) -> AsyncIterator[Browser]:
+    """Attach to the browser daemon if one is running, otherwise launch Chromium.
+
+    Closing an attached browser only closes the contexts this client created
+    and disconnects, leaving the daemon's browser running.
+    """
+    browser: Browser | None = None
+    state = running_daemon()
+    if state is not None:
+        try:
+            browser = await pw.chromium.connect_over_cdp(state.endpoint)
+            logger.info(f"Attached to browser daemon at {state.endpoint}")
+        except PlaywrightError as e:
+            logger.warning(f"Could not attach to browser daemon, launching a browser: {e}")
+
+    if browser is None:
+        browser = await pw.chromium.launch(headless=headless)
+
+    try:
+        yield browser
+    finally:
+        await browser.close()
+
+
+async def claim_warm_page(browser: Browser, url: str) -> Page | None:
+    """Take a daemon page that has already loaded ``url``, if one is free."""
+    for context in browser.contexts:
+        for page in context.pages:
+            if page.url != url:
+                continue
+            with suppress(PlaywrightError):
+                if await page.evaluate(CLAIM_SCRIPT):
+                    logger.info("Using a warm page from the browser daemon")
+                    return page
+    return None
+
+
+async def new_context(browser: Browser, network: NetworkMonitor | None = None) -> BrowserContext:
+    context = await browser.new_context()
+    if network is not None:
+        await network.attach(context)
+    return context
+
+
+async def new_page(
+    browser: Browser, warm_url: str = "", network: NetworkMonitor | None = None
+) -> Page:
+    """A warm daemon page showing ``warm_url`` when available, else a page in a new context."""
+    if warm_url:
+        page = await claim_warm_page(browser, warm_url)
+        if page is not None:
+            # The daemon's context is shared with its other warm pages.
+            if network is not None:
+                await network.attach(page)
+            return page
+    context = await new_context(browser, network)
+    return await context.new_page()
+
+
+async def close_context(context: BrowserContext, _: Page) -> None:
+    with suppress(PlaywrightError):
+        await context.close()
+
+
+class BrowserDaemon:
+    """Keep a Chromium instance, and optionally loaded pages, running for other commands.
+
+    Warm pages each get their own context so clients do not share a session.
+    Pages that get claimed are replaced, and idle ones are reloaded now and then
+    so their session stays valid.
+    """
+
+    def __init__(
+        self,
+        port: int = DEFAULT_DAEMON_PORT,
+        headless: bool = True,
+        warm: int = 0,
+        warm_url: str = "",
+        keepalive_interval: float = 240.0,
+        state_path: Path | None = None,
+    ):
+        self.port = port
+        self.headless = headless
+        self.warm = warm if warm_url else 0
+        self.warm_url = warm_url
+        self.keepalive_interval = keepalive_interval
+        self.state_path = state_path or daemon_state_path()
+        self.warm_pages: list[Page] = []
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def run(self) -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.headless,
+                args=[f"--remote-debugging-port={self.port}"],
+            )
+            state = DaemonState(
+                endpoint=self.endpoint,
+                pid=os.getpid(),
+                headless=self.headless,
+                started_at=time.time(),
+                warm_url=self.warm_url if self.warm else "",
+            )
+            state.save(self.state_path)
+            logger.info(f"Browser daemon listening on {self.endpoint}")
+
+            try:
+                last_reload = time.monotonic()
+                while not stop.is_set():
+                    await self._replenish(browser)
+                    if time.monotonic() - last_reload >= self.keepalive_interval:
+                        await self._reload_idle()
+                        last_reload = time.monotonic()
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(stop.wait(), timeout=1.0)
+            finally:
+                self.state_path.unlink(missing_ok=True)
+                await browser.close()
+                logger.info("Browser daemon stopped")
+
+    async def _replenish(self, browser: Browser) -> None:
+        kept: list[Page] = []
+        for page in self.warm_pages:
+            if not page.is_closed() and not await self._claimed(page):
+                kept.append(page)
+        self.warm_pages = kept
+
+        while len(self.warm_pages) < self.warm:
+            context = await browser.new_context()
+            page = await context.new_page()
+            # Claimed pages are closed by their client; drop the empty context with them.
+            page.on("close", partial(close_context, context))
+            try:
+                await page.goto(self.warm_url, wait_until="domcontentloaded")
+            except PlaywrightError as e:
+                logger.warning(f"Could not warm a page: {e}")
+                await context.close()
+                return
+            self.warm_pages.append(page)
+            logger.info(f"Warm pages ready: {len(self.warm_pages)}/{self.warm}")
+
+    async def _reload_idle(self) -> None:
+        for page in self.warm_pages:
+            if await self._claimed(page):
+                continue
+            with suppress(PlaywrightError):
+                await page.reload(wait_until="domcontentloaded")
+
+    @staticmethod
+    async def _claimed(page: Page) -> bool:
+        try:
+            return bool(await page.evaluate("() => Boolean(window.__aweilleClaimed)"))
+        except PlaywrightError:
+            return True
+
+
+def stop_daemon(path: Path | None = None) -> DaemonState | None:
+    state = running_daemon(path)
+    if state is not None:
+        os.kill(state.pid, signal.SIGTERM)
+    return state
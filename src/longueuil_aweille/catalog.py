@@ -0,0 +1,286 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from .browse import Activity, RegistrationDates, RegistrationDatesCache, activity_key
+from .status import ActivityStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = Path.home() / ".cache" / "longueuil-aweille" / "catalog.db"
+
+# Bump when the tables change; the catalog is a cache and is rebuilt on mismatch.
+SCHEMA_VERSION = 2
+
+ACTIVITY_COLUMNS = (
+    "name",
+    "code",
+    "domain",
+    "age_min",
+    "age_max",
+    "start_date",
+    "end_date",
+    "promoter",
+    "spots",
+    "price",
+    "days",
+    "times",
+    "location",
+    "status",
+    "page_url",
+    "page_number",
+    "dates_button",
+)
+
+# Where the row sat in the results; kept up to date but left out of the content hash,
+# since one added or removed activity moves every row after it.
+POSITION_COLUMNS = ("page_url", "page_number", "dates_button")
+CONTENT_COLUMNS = tuple(c for c in ACTIVITY_COLUMNS if c not in POSITION_COLUMNS)
+
+INTEGER_COLUMNS = frozenset({"age_min", "age_max", "spots", "page_number"})
+COLUMN_DEFINITIONS = ",\n    ".join(
+    f"{column} {'INTEGER' if column in INTEGER_COLUMNS else 'TEXT'} NOT NULL"
+    for column in ACTIVITY_COLUMNS
+)
+
+SCHEMA = f"""
+CREATE TABLE activities (
+    key TEXT PRIMARY KEY,
+    {COLUMN_DEFINITIONS},
+    content_hash TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+CREATE TABLE registration_dates (
+    key TEXT PRIMARY KEY,
+    resident_start TEXT,
+    resident_end TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE scopes (
+    scope TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+CREATE TABLE scope_members (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (scope, key)
+);
+"""
+
+
+@dataclass
+class CatalogUpdate:
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+
+
+def catalog_scope(domain: str = "", available_only: bool = False) -> str:
+    return f"{domain}|{'available' if available_only else 'all'}"
+
+
+def activity_to_row(activity: Activity) -> dict[str, Any]:
+    """Flatten an activity for storage; registration dates live in their own table."""
+    row = asdict(activity)
+    del row["registration_dates"]
+    row["status"] = activity.status.value
+    return row
+
+
+def row_to_activity(row: sqlite3.Row) -> Activity:
+    values = {column: row[column] for column in ACTIVITY_COLUMNS}
+    values["status"] = ActivityStatus(values["status"])
+    dates = None
+    if row["resident_start"]:
+        dates = RegistrationDates(
+            resident_start=row["resident_start"], resident_end=row["resident_end"] or ""
+        )
+    return Activity(**values, registration_dates=dates)
+
+
+def content_hash(row: dict[str, Any]) -> str:
+    payload = json.dumps([row[column] for column in CONTENT_COLUMNS], ensure_ascii=False)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class ActivityCatalog:
+    """SQLite store of scraped activities, keyed by activity code."""
+
+    def __init__(self, path: Path = DEFAULT_CATALOG_PATH):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _ensure_schema(self) -> None:
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version == SCHEMA_VERSION:
+            return
+
+        logger.info(f"Rebuilding activity catalog at {self.path}")
+        with self.connection:
+            for table in ("activities", "registration_dates", "scopes", "scope_members"):
+                self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def age(self, domain: str = "", available_only: bool = False) -> timedelta | None:
+        """Time since the given search scope was last refreshed, if ever."""
+        row = self.connection.execute(
+            "SELECT refreshed_at FROM scopes WHERE scope = ?",
+            (catalog_scope(domain, available_only),),
+        ).fetchone()
+        if row is None:
+            return None
+        return timedelta(seconds=time.time() - row["refreshed_at"])
+
+    def load(
+        self,
+        domain: str = "",
+        available_only: bool = False,
+        max_age: timedelta | None = None,
+    ) -> list[Activity] | None:
+        """Return the activities of a search scope, or ``None`` if missing or stale."""
+        age = self.age(domain, available_only)
+        if age is None or (max_age is not None and age > max_age):
+            return None
+
+        rows = self.connection.execute(
+            """
+            SELECT activities.*, registration_dates.resident_start,
+                registration_dates.resident_end
+            FROM scope_members
+            JOIN activities ON activities.key = scope_members.key
+            LEFT JOIN registration_dates ON registration_dates.key = activities.key
+            WHERE scope_members.scope = ?
+            ORDER BY scope_members.position
+            """,
+            (catalog_scope(domain, available_only),),
+        ).fetchall()
+        return [row_to_activity(row) for row in rows]
+
+    def save(
+        self,
+        activities: list[Activity],
+        domain: str = "",
+        available_only: bool = False,
+        complete: bool = True,
+    ) -> CatalogUpdate:
+        """Store a scrape of a search scope, rewriting only rows whose content changed.
+
+        An incomplete scrape only updates the activities it saw; the scope keeps
+        its previous members and age, so ``load()`` does not serve it as fresh.
+        """
+        now = time.time()
+        scope = catalog_scope(domain, available_only)
+        update = CatalogUpdate()
+
+        rows = {activity_key(a): activity_to_row(a) for a in activities}
+        existing = self._stored(list(rows))
+        moved: list[tuple[Any, ...]] = []
+
+        with self.connection:
+            for key, row in rows.items():
+                digest = content_hash(row)
+                stored = existing.get(key)
+                if stored is None:
+                    update.added += 1
+                elif stored["content_hash"] != digest:
+                    update.changed += 1
+                else:
+                    update.unchanged += 1
+                    if any(stored[c] != row[c] for c in POSITION_COLUMNS):
+                        moved.append((*(row[c] for c in POSITION_COLUMNS), key))
+                    continue
+
+                columns = ("key", *ACTIVITY_COLUMNS, "content_hash", "scraped_at")
+                values = (key, *(row[c] for c in ACTIVITY_COLUMNS), digest, now)
+                self.connection.execute(
+                    f"INSERT OR REPLACE INTO activities ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    values,
+                )
+
+            self.connection.executemany(
+                f"UPDATE activities SET {', '.join(f'{c} = ?' for c in POSITION_COLUMNS)} "
+                "WHERE key = ?",
+                moved,
+            )
+
+            if not complete:
+                return update
+
+            self.connection.execute("DELETE FROM scope_members WHERE scope = ?", (scope,))
+            self.connection.executemany(
+                "INSERT INTO scope_members (scope, key, position) VALUES (?, ?, ?)",
+                [(scope, key, position) for position, key in enumerate(rows)],
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO scopes (scope, refreshed_at) VALUES (?, ?)",
+                (scope, now),
+            )
+
+        return update
+
+    def dates_cache(self, ttl: float | None = None) -> RegistrationDatesCache:
+        """Build a registration dates cache seeded with every stored lookup."""
+        cache = RegistrationDatesCache() if ttl is None else RegistrationDatesCache(ttl=ttl)
+        for row in self.connection.execute("SELECT * FROM registration_dates"):
+            dates = None
+            if row["resident_start"]:
+                dates = RegistrationDates(row["resident_start"], row["resident_end"] or "")
+            cache.store(row["key"], dates, fetched_at=row["fetched_at"])
+        return cache
+
+    def save_dates(self, cache: RegistrationDatesCache) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO registration_dates "
+                "(key, resident_start, resident_end, fetched_at) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        key,
+                        dates.resident_start if dates else None,
+                        dates.resident_end if dates else None,
+                        fetched_at,
+                    )
+                    for key, (fetched_at, dates) in cache.entries.items()
+                ],
+            )
+
+    def _stored(self, keys: list[str]) -> dict[str, sqlite3.Row]:
+        """The content hash and position of each stored activity among ``keys``."""
+        stored: dict[str, sqlite3.Row] = {}
+        # Stay well below SQLite's bound-parameter limit.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            rows = self.connection.execute(
+                f"SELECT key, content_hash, {', '.join(POSITION_COLUMNS)} FROM activities "
+                f"WHERE key IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            ).fetchall()
+            stored.update({row["key"]: row for row in rows})
+        return stored
@@ -0,0 +1,162 @@
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from .browse import Activity, RegistrationDates
+from .status import ActivityStatus
+
+STATUSES = list(ActivityStatus)
+STATUS_CODES = {status: i for i, status in enumerate(STATUSES)}
+
+# Sentinel for "could not be parsed" in the numeric columns, and for "no
+# registration dates" in the dates columns.
+MISSING = -1
+
+
+@dataclass(slots=True, frozen=True)
+class CompactActivity:
+    """One activity with its repeated strings replaced by dictionary codes.
+
+    Text fields hold codes into the :class:`ActivityCodec` that made them, so
+    they only mean something together with it. The ``*_day``, ``*_minute``
+    and ``price_cents`` columns carry the activity's parsed fields as plain
+    ints (``MISSING`` when unparsed): days are ``date.toordinal()``, times are
+    minutes since midnight.
+    """
+
+    name: int
+    code: str
+    domain: int
+    age_min: int
+    age_max: int
+    start_date: int
+    end_date: int
+    promoter: int
+    spots: int
+    price: int
+    days: int
+    times: int
+    location: int
+    status: int
+    page_url: int
+    page_number: int
+    dates_button: str
+    resident_start: int
+    resident_end: int
+    start_day: int
+    end_day: int
+    start_minute: int
+    end_minute: int
+    price_cents: int
+
+
+class StringDictionary:
+    """Two-way mapping between strings and small integer codes."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self.codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+    def decode(self, code: int) -> str:
+        return self.values[code]
+
+
+class ActivityCodec:
+    """Encode activities compactly, sharing strings and unchanged rows across snapshots.
+
+    Every string goes through one shared dictionary, and each distinct
+    encoded row is kept once: encoding an unchanged activity again, as
+    successive catalog snapshots do, returns the same ``CompactActivity``
+    object. ``decode`` gives back an ``Activity`` equal to the one encoded.
+    """
+
+    def __init__(self) -> None:
+        self.strings = StringDictionary()
+        self._rows: dict[CompactActivity, CompactActivity] = {}
+
+    def encode(self, activity: Activity) -> CompactActivity:
+        text = self.strings.encode
+        dates = activity.registration_dates
+        row = CompactActivity(
+            name=text(activity.name),
+            code=sys.intern(activity.code),
+            domain=text(activity.domain),
+            age_min=activity.age_min,
+            age_max=activity.age_max,
+            start_date=text(activity.start_date),
+            end_date=text(activity.end_date),
+            promoter=text(activity.promoter),
+            spots=activity.spots,
+            price=text(activity.price),
+            days=text(activity.days),
+            times=text(activity.times),
+            location=text(activity.location),
+            status=STATUS_CODES[activity.status],
+            page_url=text(activity.page_url),
+            page_number=activity.page_number,
+            dates_button=sys.intern(activity.dates_button),
+            resident_start=text(dates.resident_start) if dates else MISSING,
+            resident_end=text(dates.resident_end) if dates else MISSING,
+            start_day=_ordinal(activity.start_day),
+            end_day=_ordinal(activity.end_day),
+            start_minute=_int(activity.start_minute),
+            end_minute=_int(activity.end_minute),
+            price_cents=_int(activity.price_cents),
+        )
+        return self._rows.setdefault(row, row)
+
+    def encode_all(self, activities: Iterable[Activity]) -> tuple[CompactActivity, ...]:
+        return tuple(self.encode(activity) for activity in activities)
+
+    def decode(self, row: CompactActivity) -> Activity:
+        text = self.strings.decode
+        dates = None
+        if row.resident_start != MISSING:
+            dates = RegistrationDates(text(row.resident_start), text(row.resident_end))
+        return Activity(
+            name=text(row.name),
+            code=row.code,
+            domain=text(row.domain),
+            age_min=row.age_min,
+            age_max=row.age_max,
+            start_date=text(row.start_date),
+            end_date=text(row.end_date),
+            promoter=text(row.promoter),
+            spots=row.spots,
+            price=text(row.price),
+            days=text(row.days),
+            times=text(row.times),
+            location=text(row.location),
+            status=STATUSES[row.status],
+            page_url=text(row.page_url),
+            registration_dates=dates,
+            page_number=row.page_number,
+            dates_button=row.dates_button,
+        )
+
+    def decode_all(self, rows: Iterable[CompactActivity]) -> list[Activity]:
+        return [self.decode(row) for row in rows]
+
+    def text(self, code: int) -> str:
+        return self.strings.decode(code)
+
+
+def _ordinal(day: date | None) -> int:
+    return day.toordinal() if day is not None else MISSING
+
+
+def _int(value: int | None) -> int:
+    return value if value is not None else MISSING
@@ -1,8 +1,12 @@
+from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .schedule import SITE_TIMEZONE
+
 
 class Participant(BaseSettings):
     name: str = Field(..., description="Participant name for logging")
@@ -11,6 +15,17 @@ class Participant(BaseSettings):
     telephone: str = Field(..., description="Numéro de téléphone")
 
 
+class Target(BaseModel):
+    activity_name: str = Field(..., description="Activity name to search for")
+    domain: str = Field(default="", description="Domain/category; defaults to the top-level one")
+    day: str = Field(default="", description="Only rows held on this day (e.g. 'sat', 'dimanche')")
+    priority: int = Field(default=0, description="Lower is preferred; ties keep config order")
+
+    @property
+    def label(self) -> str:
+        return f"{self.activity_name} ({self.day})" if self.day else self.activity_name
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="LONGUEUIL_")
 
@@ -21,6 +36,16 @@ class Settings(BaseSettings):
     headless: bool = Field(default=False, description="Run browser in headless mode")
     timeout: int = Field(default=600, description="Timeout in seconds")
     refresh_interval: float = Field(default=5.0, description="Refresh interval in seconds")
+    scheduler: Literal["fixed", "adaptive"] = Field(
+        default="fixed",
+        description="How the delay between polls is chosen",
+    )
+    max_refresh_interval: float = Field(
+        default=60.0, description="Longest delay the adaptive scheduler backs off to"
+    )
+    refresh_jitter: float = Field(
+        default=0.1, ge=0.0, le=1.0, description="Random +/- fraction added to each delay"
+    )
     domain: str = Field(
         default="Activités aquatiques (Vieux-Longueuil)",
         description="Domain/category to select (e.g., 'Activités aquatiques (Vieux-Longueuil)')",
@@ -29,8 +54,73 @@ class Settings(BaseSettings):
         default="",
         description="Activity name to search for (e.g., 'Parent-bébé', 'Niveau 1')",
     )
+    activity_day: str = Field(
+        default="",
+        description="Only register for rows held on this day (e.g. 'sat', 'dimanche')",
+    )
+    targets: list[Target] = Field(
+        default_factory=list,
+        description="Several activities to chase at once, best priority first",
+    )
+    fallback_grace: float = Field(
+        default=5.0,
+        description="Seconds higher-priority targets get once a fallback is in the cart",
+    )
+    backend: Literal["browser", "http"] = Field(
+        default="browser",
+        description="How to poll for the activity: 'browser' reloads, 'http' posts the form",
+    )
+    network_profile: Literal["full", "lean", "minimal"] = Field(
+        default="full",
+        description="Which resources the browser loads: everything, no images/fonts, or bare pages",
+    )
+    probe: bool = Field(
+        default=False,
+        description="Poll by replaying the results postback instead of reloading the page",
+    )
+    open_at: datetime | None = Field(
+        default=None,
+        description="When registration opens; enables pre-warmed, clock-synced polling",
+    )
+    burst_lead: float = Field(
+        default=3.0, description="Seconds before opening to start the polling burst"
+    )
+    burst_window: float = Field(
+        default=90.0, description="Seconds after opening to keep polling at burst speed"
+    )
+    burst_interval: float = Field(
+        default=0.5, description="Refresh interval in seconds during the burst"
+    )
+    keepalive_interval: float = Field(
+        default=240.0, description="Seconds between search refreshes while idling"
+    )
+    verify_concurrency: int = Field(
+        default=4, ge=1, description="Participants verified at the same time"
+    )
+    step_timeouts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-step wait timeouts in ms (e.g. {search = 20000, popup = 3000})",
+    )
     participants: list[Participant] = Field(default_factory=list)
 
+    @field_validator("open_at")
+    @classmethod
+    def _localize_open_at(cls, value: datetime | None) -> datetime | None:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=SITE_TIMEZONE)
+        return value
+
+    def resolved_targets(self) -> list[Target]:
+        """Targets in priority order, or the single top-level activity."""
+        if not self.targets:
+            return [
+                Target(activity_name=self.activity_name, domain=self.domain, day=self.activity_day)
+            ]
+        targets = [
+            t if t.domain else t.model_copy(update={"domain": self.domain}) for t in self.targets
+        ]
+        return sorted(targets, key=lambda t: t.priority)
+
     @classmethod
     def from_toml(cls, path: Path) -> "Settings":
         import tomllib
@@ -40,4 +130,5 @@ class Settings(BaseSettings):
 
         participants_data = data.pop("participants", [])
         participants = [Participant(**p) for p in participants_data]
-        return cls(**data, participants=participants)
+        targets = [Target(**t) for t in data.pop("targets", [])]
+        return cls(**data, participants=participants, targets=targets)
@@ -0,0 +1,128 @@
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Literal
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Page, Request, Response, Route
+
+from .replay import SessionArchive
+
+logger = logging.getLogger(__name__)
+
+NetworkProfile = Literal["full", "lean", "minimal"]
+
+# Status detection reads the src/alt of the status images, never their bytes.
+LEAN_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+MINIMAL_BLOCKED_TYPES = LEAN_BLOCKED_TYPES | {"stylesheet", "ping", "eventsource", "manifest"}
+
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "newrelic.com",
+    "nr-data.net",
+)
+
+SITE_DOMAIN = "longueuil.quebec"
+
+
+def host_matches(host: str, domain: str) -> bool:
+    return host == domain or host.endswith(f".{domain}")
+
+
+def should_block(profile: NetworkProfile, resource_type: str, url: str) -> bool:
+    if profile == "full":
+        return False
+
+    host = urlsplit(url).hostname or ""
+    if any(host_matches(host, tracker) for tracker in TRACKER_HOSTS):
+        return True
+    if profile == "lean":
+        return resource_type in LEAN_BLOCKED_TYPES
+
+    # minimal: also drop styling and anything served from outside the city's sites.
+    if resource_type in MINIMAL_BLOCKED_TYPES:
+        return True
+    return resource_type != "document" and not host_matches(host, SITE_DOMAIN)
+
+
+@dataclass
+class NetworkStats:
+    """Requests made, requests blocked and bytes received, by resource type.
+
+    Blocked requests are aborted before any response, so their size is never
+    known; what a profile saves is the difference from a ``full`` run's
+    ``received`` for the types it blocks.
+    """
+
+    requests: int = 0
+    blocked: Counter[str] = field(default_factory=Counter)
+    received: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def blocked_total(self) -> int:
+        return sum(self.blocked.values())
+
+    @property
+    def bytes_received(self) -> int:
+        return sum(self.received.values())
+
+
+@dataclass
+class NetworkMonitor:
+    """Apply a network profile to pages and contexts and count what it let through.
+
+    Note that Playwright disables the HTTP cache for routed contexts, so
+    ``lean`` and ``minimal`` can re-download scripts a ``full`` run would have
+    cached; compare ``stats`` across profiles to pick one.
+
+    With an ``archive``, requests the profile lets through are recorded to it
+    or served from it instead of the network.
+    """
+
+    profile: NetworkProfile = "full"
+    stats: NetworkStats = field(default_factory=NetworkStats)
+    archive: SessionArchive | None = None
+
+    async def attach(self, target: BrowserContext | Page) -> None:
+        target.on("request", self._on_request)
+        target.on("response", self._on_response)
+        # Routes added last run first, so blocked requests never reach the archive.
+        if self.archive is not None:
+            await self.archive.attach(target)
+        if self.profile != "full":
+            await target.route("**/*", self._route)
+
+    async def _route(self, route: Route) -> None:
+        request = route.request
+        if should_block(self.profile, request.resource_type, request.url):
+            self.stats.blocked[request.resource_type] += 1
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+    def _on_request(self, _: Request) -> None:
+        self.stats.requests += 1
+
+    def _on_response(self, response: Response) -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.stats.received[response.request.resource_type] += int(length)
+
+    def summary(self) -> str:
+        stats = self.stats
+        blocked = ", ".join(f"{n} {kind}" for kind, n in stats.blocked.most_common())
+        received = ", ".join(
+            f"{size / 1024:.0f} KB {kind}" for kind, size in stats.received.most_common()
+        )
+        # Blocked requests never get a response; compare with a full run for bytes saved.
+        return (
+            f"Network ({self.profile}): {stats.requests} requests, "
+            f"{stats.blocked_total} blocked{f' ({blocked})' if blocked else ''}, "
+            f"{stats.bytes_received / 1024:.0f} KB received{f' ({received})' if received else ''}"
+        )
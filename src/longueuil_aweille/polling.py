@@ -0,0 +1,110 @@
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PollObservation:
+    """What the last poll saw, as input to the next delay."""
+
+    not_yet: bool = False
+    latency: float = 0.0
+    # Seconds since registration opened (negative before), if the opening is known.
+    since_opening: float | None = None
+
+
+@dataclass
+class PollDecision:
+    delay: float
+    reason: str
+
+
+class PollScheduler(Protocol):
+    def next_delay(self, observation: PollObservation) -> PollDecision: ...
+
+
+@dataclass
+class FixedScheduler:
+    """``refresh_interval`` between polls, ``burst_interval`` around the opening."""
+
+    interval: float
+    burst_interval: float
+    burst_lead: float
+    burst_window: float
+
+    def next_delay(self, observation: PollObservation) -> PollDecision:
+        since = observation.since_opening
+        if since is not None and -self.burst_lead <= since <= self.burst_window:
+            return PollDecision(self.burst_interval, "burst around opening")
+        return PollDecision(self.interval, "fixed interval")
+
+
+@dataclass
+class AdaptiveScheduler:
+    """Poll slowly when nothing can happen soon and quickly when it can.
+
+    - Backs off geometrically while the row says "not yet", up to
+      ``max_interval``. With a known opening, snipe mode idles until the
+      burst instead, so polling only starts at ``burst_lead`` before it.
+    - Never polls faster than ``latency_factor`` times the last response time,
+      so a struggling server does not get requests stacked on it.
+    - Adds +/- ``jitter`` (as a fraction) so polls do not fall on a fixed beat.
+    """
+
+    interval: float
+    burst_interval: float
+    burst_lead: float
+    burst_window: float
+    max_interval: float = 60.0
+    backoff: float = 1.5
+    latency_factor: float = 2.0
+    jitter: float = 0.1
+    rng: Callable[[], float] = random.random
+    _current: float = 0.0
+
+    def next_delay(self, observation: PollObservation) -> PollDecision:
+        since = observation.since_opening
+        if since is not None and -self.burst_lead <= since <= self.burst_window:
+            delay, reason = self.burst_interval, "burst around opening"
+            self._current = self.interval
+        elif observation.not_yet:
+            self._current = min(self.max_interval, max(self.interval, self._current * self.backoff))
+            delay, reason = self._current, "not yet open, backing off"
+        else:
+            self._current = self.interval
+            delay, reason = self.interval, "base interval"
+
+        floor = observation.latency * self.latency_factor
+        if delay < floor:
+            delay, reason = floor, f"{reason}; slowed to {self.latency_factor:g}x latency"
+
+        delay *= 1 + self.jitter * (2 * self.rng() - 1)
+        return PollDecision(max(delay, 0.0), reason)
+
+
+SCHEDULERS: dict[str, Callable[[Settings], PollScheduler]] = {
+    "fixed": lambda s: FixedScheduler(
+        interval=s.refresh_interval,
+        burst_interval=s.burst_interval,
+        burst_lead=s.burst_lead,
+        burst_window=s.burst_window,
+    ),
+    "adaptive": lambda s: AdaptiveScheduler(
+        interval=s.refresh_interval,
+        burst_interval=s.burst_interval,
+        burst_lead=s.burst_lead,
+        burst_window=s.burst_window,
+        max_interval=s.max_refresh_interval,
+        jitter=s.refresh_jitter,
+    ),
+}
+
+
+def make_scheduler(settings: Settings) -> PollScheduler:
+    return SCHEDULERS[settings.scheduler](settings)
@@ -0,0 +1,361 @@
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, fields, replace
+from datetime import date
+
+from .browse import DAY_BITS, DAY_VARIANTS, Activity
+from .schedule import fold
+from .status import ActivityStatus
+
+# "sat", "sam", "samedi" and "saturday" all name the same bit.
+DAY_NAMES = {name: day for day, variants in DAY_VARIANTS.items() for name in (day, *variants)}
+
+SORT_FIELDS = frozenset(f.name for f in fields(Activity)) - {"registration_dates"}
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+# Matches in the location or promoter count for less than in the name or code.
+SECONDARY_WEIGHT = 0.8
+DEFAULT_MIN_SCORE = 0.6
+# Renaming a configured activity needs more confidence than listing candidates.
+RESOLVE_MIN_SCORE = 0.75
+
+
+@dataclass
+class Query:
+    """A composite query; empty criteria match everything.
+
+    ``day`` may name several days separated by commas (any of them matches).
+    The range bounds are inclusive and compare the parsed fields: ``starts_from``
+    and ``starts_until`` the start date, ``time_from`` the start time and
+    ``time_until`` the end time (minutes since midnight), ``max_price`` the price
+    in cents. An activity whose field could not be parsed fails a range bound.
+    ``sort_by`` lists Activity field names, most significant first; unparsed
+    values sort last.
+    """
+
+    name_contains: str = ""
+    location_contains: str = ""
+    domain: str = ""
+    day: str = ""
+    age: int = 0
+    statuses: frozenset[ActivityStatus] = frozenset()
+    starts_from: date | None = None
+    starts_until: date | None = None
+    time_from: int | None = None
+    time_until: int | None = None
+    max_price: int | None = None
+    sort_by: tuple[str, ...] = ()
+    descending: bool = False
+    limit: int = 0
+
+    def matches(self, activity: Activity) -> bool:
+        """Whether one activity meets the criteria, for rows checked as they arrive.
+
+        Goes through ``ActivityIndex`` so both share one set of rules; index a
+        whole list instead of calling this per row.
+        """
+        return bool(ActivityIndex([activity]).query(replace(self, sort_by=(), limit=0)))
+
+
+class ActivityIndex:
+    """Activities with their text fields normalized and indexed once, for repeated queries.
+
+    - name, location and days are lowercased up front;
+    - activities are sorted by ``age_min`` so an age query only looks at the
+      prefix that starts young enough, and by start date so a date range is
+      a slice;
+    - locations and domains map each distinct value to its activities, so a
+      substring query tests the few distinct values rather than every row.
+
+    Queries intersect the index postings, then check what remains in one pass.
+    """
+
+    def __init__(self, activities: Sequence[Activity]):
+        self.activities = activities
+        # Fixed at build time, so callers can tell when the list grew underneath.
+        self._size = len(activities)
+        self._names = [a.name.lower() for a in activities]
+        self._days = [a.days.lower() for a in activities]
+        by_age = sorted(range(len(activities)), key=lambda i: activities[i].age_min)
+        self._age_order = by_age
+        self._age_mins = [activities[i].age_min for i in by_age]
+        starts = sorted(
+            (start, i) for i, a in enumerate(activities) if (start := a.start_day) is not None
+        )
+        self._start_order = [i for _, i in starts]
+        self._start_days = [start for start, _ in starts]
+        self._locations = self._invert(a.location for a in activities)
+        self._domains = self._invert(a.domain for a in activities)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _invert(values: Iterable[str]) -> dict[str, list[int]]:
+        postings: dict[str, list[int]] = {}
+        for i, value in enumerate(values):
+            postings.setdefault(value.lower(), []).append(i)
+        return postings
+
+    def query(self, query: Query) -> list[Activity]:
+        check_sort_fields(query.sort_by)
+        candidates = self._candidates(query)
+        name = query.name_contains.lower()
+        mask, day_texts = self._day_query(query.day)
+
+        matched: list[Activity] = []
+        for i in candidates:
+            if name and name not in self._names[i]:
+                continue
+            activity = self.activities[i]
+            if query.day and not (
+                activity.weekdays & mask or any(t in self._days[i] for t in day_texts)
+            ):
+                continue
+            if query.age > 0 and activity.age_max < query.age:
+                continue
+            if query.statuses and activity.status not in query.statuses:
+                continue
+            if not _in_ranges(activity, query):
+                continue
+            matched.append(activity)
+
+        if query.sort_by:
+            matched = sort_activities(matched, query.sort_by, query.descending)
+        return matched[: query.limit] if query.limit > 0 else matched
+
+    def _candidates(self, query: Query) -> Iterable[int]:
+        postings: list[set[int]] = []
+        if query.location_contains:
+            postings.append(self._lookup(self._locations, query.location_contains))
+        if query.domain:
+            postings.append(self._lookup(self._domains, query.domain))
+        if query.age > 0:
+            # age_max is checked per row; age_min narrows to a sorted prefix.
+            end = bisect_right(self._age_mins, query.age)
+            postings.append(set(self._age_order[:end]))
+        if query.starts_from is not None or query.starts_until is not None:
+            start = (
+                0 if query.starts_from is None else bisect_left(self._start_days, query.starts_from)
+            )
+            end = (
+                len(self._start_days)
+                if query.starts_until is None
+                else bisect_right(self._start_days, query.starts_until)
+            )
+            postings.append(set(self._start_order[start:end]))
+
+        if not postings:
+            return range(self._size)
+        postings.sort(key=len)
+        return sorted(set.intersection(*postings))
+
+    @staticmethod
+    def _lookup(index: dict[str, list[int]], text: str) -> set[int]:
+        needle = text.lower()
+        return {i for value, ids in index.items() if needle in value for i in ids}
+
+    @staticmethod
+    def _day_query(day: str) -> tuple[int, list[str]]:
+        mask = 0
+        texts: list[str] = []
+        for part in re.split(r"[,\s]+", day.lower()):
+            if not part:
+                continue
+            day_key = DAY_NAMES.get(part) or DAY_NAMES.get(part[:3])
+            if day_key is None:
+                texts.append(part)
+            else:
+                mask |= DAY_BITS[day_key]
+        return mask, texts
+
+
+def check_sort_fields(sort_by: Iterable[str]) -> None:
+    unknown = set(sort_by) - SORT_FIELDS
+    if unknown:
+        raise ValueError(f"Cannot sort by {', '.join(sorted(unknown))}")
+
+
+def sort_activities(
+    activities: Iterable[Activity], sort_by: Sequence[str], descending: bool = False
+) -> list[Activity]:
+    """Sort on Activity fields, most significant first; unparsed values go last either way."""
+    check_sort_fields(sort_by)
+    missing_last = 0 if descending else 1
+    return sorted(
+        activities,
+        key=lambda a: tuple(_sort_value(getattr(a, f), missing_last) for f in sort_by),
+        reverse=descending,
+    )
+
+
+def _in_ranges(activity: Activity, query: Query) -> bool:
+    # Start dates are already narrowed by the index.
+    if query.time_from is not None and (
+        activity.start_minute is None or activity.start_minute < query.time_from
+    ):
+        return False
+    if query.time_until is not None and (
+        activity.end_minute is None or activity.end_minute > query.time_until
+    ):
+        return False
+    return query.max_price is None or (
+        activity.price_cents is not None and activity.price_cents <= query.max_price
+    )
+
+
+def _sort_value(value: object, missing_last: int) -> tuple[int, object]:
+    if value is None:
+        return missing_last, 0
+    if isinstance(value, ActivityStatus):
+        value = value.value
+    elif isinstance(value, str):
+        value = value.lower()
+    return 1 - missing_last, value
+
+
+def words(text: str) -> str:
+    """The tokens of already folded ``text``, joined by single spaces."""
+    return " ".join(TOKEN_RE.findall(text))
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams of each token of already folded ``text``, padded so short tokens count."""
+    grams: set[str] = set()
+    for token in TOKEN_RE.findall(text):
+        padded = f"  {token} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+@dataclass
+class SearchHit:
+    activity: Activity
+    score: float
+
+
+class SearchIndex:
+    """Accent-insensitive, typo-tolerant search over name, code, promoter and location.
+
+    Text is folded (lowercased, accents stripped) and split into trigrams. A
+    query scores each activity by the share of its trigrams found in the name,
+    plus ``SECONDARY_WEIGHT`` times the share found in the location and
+    promoter, capped at 1. A query found whole in the name adds 1, and one
+    equal to the name or to the code adds 1 more, so exact matches rank first.
+
+    Names and places repeat across many activities, so trigrams are indexed
+    per distinct value and each distinct (name, place) pair is scored once.
+    """
+
+    def __init__(self, activities: Sequence[Activity]):
+        self.activities = activities
+        names: dict[str, int] = {}
+        places: dict[str, int] = {}
+        pairs: dict[tuple[int, int], list[int]] = {}
+        self._codes: dict[str, list[int]] = {}
+        for i, activity in enumerate(activities):
+            n = names.setdefault(fold(activity.name), len(names))
+            k = places.setdefault(fold(f"{activity.location} {activity.promoter}"), len(places))
+            pairs.setdefault((n, k), []).append(i)
+            if activity.code:
+                self._codes.setdefault(fold(activity.code), []).append(i)
+
+        self._names = list(names)
+        # Names as bare words, so "parent bebe" and "Parent-bébé" compare equal.
+        self._name_words = [words(name) for name in self._names]
+        self._pairs = list(pairs.items())
+        self._name_pairs: list[list[int]] = [[] for _ in names]
+        self._place_pairs: list[list[int]] = [[] for _ in places]
+        for p, ((n, k), _) in enumerate(self._pairs):
+            self._name_pairs[n].append(p)
+            self._place_pairs[k].append(p)
+        self._name_grams = self._invert_grams(self._names)
+        self._place_grams = self._invert_grams(list(places))
+
+    @staticmethod
+    def _invert_grams(values: list[str]) -> dict[str, list[int]]:
+        postings: dict[str, list[int]] = {}
+        for n, value in enumerate(values):
+            for gram in trigrams(value):
+                postings.setdefault(gram, []).append(n)
+        return postings
+
+    def search(
+        self, text: str, limit: int = 10, min_score: float = DEFAULT_MIN_SCORE
+    ) -> list[SearchHit]:
+        """Best matches first; ``limit`` of 0 returns every hit above ``min_score``."""
+        needle = fold(text).strip()
+        needle_words = words(needle)
+        grams = trigrams(needle)
+        if not grams:
+            return []
+
+        name_counts: Counter[int] = Counter()
+        place_counts: Counter[int] = Counter()
+        for gram in grams:
+            name_counts.update(self._name_grams.get(gram, ()))
+            place_counts.update(self._place_grams.get(gram, ()))
+
+        total = len(grams)
+        name_scores = {n: count / total for n, count in name_counts.items()}
+        place_scores = {k: SECONDARY_WEIGHT * count / total for k, count in place_counts.items()}
+        name_bonus = {
+            n: 2.0 if needle_words == self._name_words[n] else 1.0
+            for n in name_scores
+            if needle_words in self._name_words[n]
+        }
+
+        # Skip values that cannot reach min_score even with the best partner.
+        best_name = max(name_scores.values(), default=0.0) + max(name_bonus.values(), default=0.0)
+        best_place = max(place_scores.values(), default=0.0)
+        candidates: set[int] = set()
+        for n, score in name_scores.items():
+            if score + name_bonus.get(n, 0.0) + best_place >= min_score:
+                candidates.update(self._name_pairs[n])
+        for k, score in place_scores.items():
+            if score + best_name >= min_score:
+                candidates.update(self._place_pairs[k])
+
+        codes = set(self._codes.get(needle, ()))
+        scored: list[tuple[float, int, list[int]]] = []
+        for p in candidates:
+            (n, k), ids = self._pairs[p]
+            fuzzy = min(1.0, name_scores.get(n, 0.0) + place_scores.get(k, 0.0))
+            score = fuzzy + name_bonus.get(n, 0.0)
+            if score >= min_score:
+                scored.append((-score, ids[0], [i for i in ids if i not in codes]))
+        for i in codes:
+            # An exact code outranks everything sharing its name.
+            scored.append((-3.0, i, [i]))
+
+        scored.sort(key=lambda entry: entry[:2])
+        hits: list[SearchHit] = []
+        for score, _, ids in scored:
+            hits.extend(SearchHit(self.activities[i], -score) for i in ids)
+            if 0 < limit <= len(hits):
+                return hits[:limit]
+        return hits
+
+    def best(self, text: str, min_score: float = DEFAULT_MIN_SCORE) -> Activity | None:
+        hits = self.search(text, limit=1, min_score=min_score)
+        return hits[0].activity if hits else None
+
+    def spelling(self, text: str) -> str | None:
+        """How the site spells ``text``: "parent-bebe" gives "Parent-bébé".
+
+        Returns the part of the best match's name that ``text`` folds to, or
+        the whole name when the match is only fuzzy.
+        """
+        hit = self.best(text, min_score=RESOLVE_MIN_SCORE)
+        if hit is None:
+            return None
+        needle = fold(text).strip()
+        folded = fold(hit.name)
+        start = folded.find(needle)
+        # Folding keeps the length of accented Latin letters, so offsets line up.
+        if start >= 0 and len(folded) == len(hit.name):
+            return hit.name[start : start + len(needle)]
+        return hit.name
@@ -1,21 +1,64 @@
 import asyncio
 import logging
+import time
+from collections.abc import Callable, Iterable
+from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Browser, Locator, Page, Request, async_playwright
+from playwright.async_api import Error as PlaywrightError
 
-from .config import Settings
+from .browse import DAY_VARIANTS
+from .browser import new_page, open_browser
+from .config import Settings, Target
+from .network import NetworkMonitor
+from .polling import PollObservation, PollScheduler, make_scheduler
+from .snipe import ServerClock, sleep_until, sync_server_clock
 from .status import (
     ActivityStatus,
+    Paginator,
     RegistrationStatus,
+    get_registration_status,
     get_status_from_image_src,
-    iterate_pagination,
 )
+from .verify import ParticipantVerification, VerificationStatus, verify_participants_in
+from .waits import WaitStrategy
+from .webforms import Element, WebFormsClient, parse_html
 
 logger = logging.getLogger(__name__)
 
 
+# Headers worth keeping when replaying a postback; cookies come from the context.
+REPLAY_HEADERS = frozenset({"content-type", "referer", "x-microsoftajax", "x-requested-with"})
+
+
+@dataclass
+class TargetLocation:
+    """Where the target row was last seen, so later polls can go straight there."""
+
+    page_number: int
+    row: str
+
+
+def row_identity(cells: list[str]) -> str:
+    """The activity cell (name and code), which stays put while status and spots change."""
+    return cells[2].strip() if len(cells) > 2 else "\t".join(cells).strip()
+
+
+@dataclass
+class ResultsRequest:
+    url: str
+    post_data: str
+    headers: dict[str, str]
+
+
+class CredentialsRejectedError(Exception):
+    def __init__(self, names: list[str]):
+        self.names = names
+        super().__init__(f"Invalid credentials for: {', '.join(names)}")
+
+
 @dataclass
 class ActivityInfo:
     name: str = ""
@@ -53,179 +96,717 @@ DEFAULT_SELECTORS = Selectors(
 )
 
 
+# Page texts that tell _submit the outcome of the registration is known.
+SUBMIT_OUTCOMES = [
+    "Place réservée",
+    "déjà inscrit",
+    "Aucun dossier",
+    "n'a été retrouvé",
+    "critère d'âge",
+    "ne répond pas au critère",
+    "Erreur",
+]
+
+
+def log_unavailable(status: RegistrationStatus) -> None:
+    match status:
+        case RegistrationStatus.REGISTRATION_NEVER_AVAILABLE:
+            logger.info("Activity found but online registration never available")
+        case RegistrationStatus.ACTIVITY_FULL:
+            logger.info("Activity found but is COMPLET (full)")
+        case RegistrationStatus.ACTIVITY_CANCELLED:
+            logger.info("Activity found but is ANNULÉE (cancelled)")
+        case _:
+            logger.info("Found activity but not available yet")
+
+
+def row_matches_day(row_text: str, day: str) -> bool:
+    """Whether a results row is held on ``day``; an empty ``day`` matches every row."""
+    if not day:
+        return True
+    text = row_text.lower()
+    # Only full day names: abbreviations like 'mar' also match months in the row's dates.
+    names = [v for v in DAY_VARIANTS.get(day.lower()[:3], [day.lower()]) if len(v) > 3]
+    return any(name in text for name in names or [day.lower()])
+
+
+def may_still_open(status: RegistrationStatus, src: str, alt: str) -> bool:
+    """Whether an unselectable row is only not open yet, rather than full, cancelled or closed."""
+    return (
+        status == RegistrationStatus.FAILED
+        and get_status_from_image_src(src, alt) == ActivityStatus.NOT_YET
+    )
+
+
+def most_specific_status(
+    statuses: Iterable[RegistrationStatus | None],
+) -> RegistrationStatus | None:
+    """The status to report when no target opened, given in priority order.
+
+    Full, cancelled or never available says more than the generic ``FAILED``
+    of a row that is not open yet; ties go to the higher-priority target.
+    """
+    known = [status for status in statuses if status is not None]
+    definite = [status for status in known if status != RegistrationStatus.FAILED]
+    return (definite or known or [None])[0]
+
+
+def find_target_rows(root: Element, activity_name: str, day: str = "") -> list[Element]:
+    """Return results rows whose own text mentions ``activity_name`` and have a select button."""
+    needle = activity_name.lower()
+    rows: list[Element] = []
+    for row in root.iter():
+        if row.tag != "tr" or any(child.tag == "tr" for child in row.iter() if child is not row):
+            continue
+        text = row.inner_text()
+        if (
+            needle in text.lower()
+            and row_matches_day(text, day)
+            and _select_button(row) is not None
+        ):
+            rows.append(row)
+    return rows
+
+
+def rejected_names(verification: list[ParticipantVerification]) -> list[str]:
+    return [v.participant.name for v in verification if v.status == VerificationStatus.INVALID]
+
+
+def element_cells(row: Element) -> list[str]:
+    return [cell.inner_text() for cell in row.find_all("td")]
+
+
+def _select_button(row: Element) -> Element | None:
+    return next(
+        (
+            el
+            for el in row.find_all("input")
+            if el.get("type").lower() == "image" and "Selecteur" in el.get("id")
+        ),
+        None,
+    )
+
+
 class RegistrationBot:
-    def __init__(self, settings: Settings, selectors: Selectors = DEFAULT_SELECTORS):
+    """Poll for the target activity and register the participants once it opens.
+
+    ``report`` receives the per-poll progress lines meant for the user (search
+    hits, where the target went, the next poll interval); it defaults to the
+    module logger.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        selectors: Selectors = DEFAULT_SELECTORS,
+        waits: WaitStrategy | None = None,
+        verify: bool = False,
+        network: NetworkMonitor | None = None,
+        report: Callable[[str], None] | None = None,
+    ):
         self.settings = settings
+        self.report = report or logger.info
         self.selectors = selectors
+        self.waits = waits or WaitStrategy(timeouts=settings.step_timeouts)
+        self.verify = verify
+        self.network = network or NetworkMonitor(settings.network_profile)
+        self.verification: list[ParticipantVerification] = []
+        self._verification_task: asyncio.Task[list[ParticipantVerification]] | None = None
+        self.clock: ServerClock | None = None
+        self.scheduler: PollScheduler = make_scheduler(settings)
+        self.opening_to_cart: float | None = None
         self.last_activity_status: RegistrationStatus | None = None
+        self._last_postback: ResultsRequest | None = None
+        self._target_location: TargetLocation | None = None
+        self._paginator: Paginator | None = None
+        self.search_hits = 0
+        self._results_request: ResultsRequest | None = None
 
     async def run(self) -> RegistrationStatus:
         logger.info("Starting registration bot...")
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.settings.headless)
-            context = await browser.new_context()
-            page = await context.new_page()
+        async with (
+            async_playwright() as pw,
+            open_browser(pw, headless=self.settings.headless) as browser,
+        ):
+            if self.verify:
+                # Runs alongside the search setup; only adding to the cart waits for it.
+                self._verification_task = asyncio.create_task(
+                    verify_participants_in(
+                        browser,
+                        self.settings.participants,
+                        concurrency=self.settings.verify_concurrency,
+                        waits=self.waits,
+                        network=self.network,
+                    )
+                )
+                self._verification_task.add_done_callback(self._report_rejected)
 
             try:
-                await self._navigate_to_search(page)
-                result = await self._wait_and_select_activity(page)
-
-                if result == RegistrationStatus.SUCCESS:
-                    await self._fill_credentials(page)
-                    status = await self._submit(page)
-
-                    if status == RegistrationStatus.SUCCESS:
-                        logger.info("Registration completed successfully!")
-                        should_unregister = await self._prompt_unregister()
-                        if should_unregister:
-                            unregistered = await self._unregister_participants(page)
-                            if unregistered:
-                                logger.info("Unregistered from activity")
-                                await page.wait_for_timeout(500)
-                                return RegistrationStatus.UNREGISTERED
-                    elif status == RegistrationStatus.ALREADY_ENROLLED:
-                        logger.info("Already enrolled in this activity")
-                    elif status == RegistrationStatus.INVALID_CREDENTIALS:
-                        logger.error("Invalid credentials - dossier/NIP not found")
-                    elif status == RegistrationStatus.AGE_CRITERIA_NOT_MET:
-                        logger.error("Age criteria not met for this activity")
-
-                    return status
-
-                if self.last_activity_status:
-                    logger.error(f"Activity found but: {self.last_activity_status.value}")
-                    return self.last_activity_status
-
-                logger.error("Registration timed out - activity not found")
-                return RegistrationStatus.TIMEOUT
-
-            except Exception as e:
-                logger.error(f"Registration failed: {e}")
-                screenshot_path = f"error-{datetime.now().strftime('%Y%m%d-%H%M%S')}.png"
-                await page.screenshot(path=screenshot_path)
-                logger.info(f"Screenshot saved to {screenshot_path}")
-                return RegistrationStatus.FAILED
+                targets = self.settings.resolved_targets()
+                if len(targets) > 1:
+                    return await self._run_targets(browser, targets)
+
+                page = await new_page(
+                    browser, warm_url=self.settings.registration_url, network=self.network
+                )
+                try:
+                    return await self._run_on_page(page)
+                finally:
+                    # A warm page lives in the daemon's context, so close it explicitly.
+                    await page.close()
             finally:
-                await browser.close()
+                await self._finish_verification()
+                logger.info(self.network.summary())
+
+    async def _run_on_page(self, page: Page) -> RegistrationStatus:
+        try:
+            result = await self._poll_target(page)
+            if result == RegistrationStatus.SUCCESS:
+                return await self._complete(page)
+
+            if self.last_activity_status:
+                logger.error(f"Activity found but: {self.last_activity_status.value}")
+                return self.last_activity_status
+
+            logger.error("Registration timed out - activity not found")
+            return RegistrationStatus.TIMEOUT
+
+        except CredentialsRejectedError as e:
+            logger.error(str(e))
+            return RegistrationStatus.INVALID_CREDENTIALS
+        except Exception as e:
+            return await self._fail(page, e)
+
+    async def _poll_target(self, page: Page) -> RegistrationStatus | None:
+        """Set up the search and poll until the target is in the cart."""
+        if self.settings.probe:
+            page.on("request", self._remember_postback)
+        await self._navigate_to_search(page)
+        if self.settings.open_at is not None:
+            await self._prepare_snipe(page)
+        return await self._wait_and_select_activity(page)
+
+    async def _complete(self, page: Page) -> RegistrationStatus:
+        await self._fill_credentials(page)
+        status = await self._submit(page)
+
+        if status == RegistrationStatus.SUCCESS:
+            logger.info("Registration completed successfully!")
+            should_unregister = await self._prompt_unregister()
+            if should_unregister:
+                unregistered = await self._unregister_participants(page)
+                if unregistered:
+                    logger.info("Unregistered from activity")
+                    return RegistrationStatus.UNREGISTERED
+        elif status == RegistrationStatus.ALREADY_ENROLLED:
+            logger.info("Already enrolled in this activity")
+        elif status == RegistrationStatus.INVALID_CREDENTIALS:
+            logger.error("Invalid credentials - dossier/NIP not found")
+        elif status == RegistrationStatus.AGE_CRITERIA_NOT_MET:
+            logger.error("Age criteria not met for this activity")
+
+        return status
+
+    async def _fail(self, page: Page, error: Exception) -> RegistrationStatus:
+        logger.error(f"Registration failed: {error}")
+        screenshot_path = f"error-{datetime.now().strftime('%Y%m%d-%H%M%S')}.png"
+        await page.screenshot(path=screenshot_path)
+        logger.info(f"Screenshot saved to {screenshot_path}")
+        return RegistrationStatus.FAILED
+
+    def _for_target(self, target: Target) -> "RegistrationBot":
+        settings = self.settings.model_copy(
+            update={
+                "domain": target.domain,
+                "activity_name": target.activity_name,
+                "activity_day": target.day,
+                "targets": [],
+            }
+        )
+        bot = RegistrationBot(
+            settings,
+            self.selectors,
+            self.waits,
+            network=self.network,
+            report=lambda message: self.report(f"{target.label}: {message}"),
+        )
+        # Every poller checks the same background verification before its cart.
+        bot._verification_task = self._verification_task
+        return bot
+
+    async def _run_targets(self, browser: Browser, targets: list[Target]) -> RegistrationStatus:
+        """Poll every target in its own context and register the best one that opens.
+
+        Targets are in priority order. When one reaches the cart, lower-priority
+        pollers are cancelled at once, and higher-priority ones get
+        ``fallback_grace`` seconds to reach their own cart before the best
+        cart so far is kept.
+        """
+        bots = [self._for_target(t) for t in targets]
+        pages = [
+            await new_page(browser, warm_url=self.settings.registration_url, network=self.network)
+            for _ in targets
+        ]
+        tasks = {
+            asyncio.create_task(b._poll_target(p)): i
+            for i, (b, p) in enumerate(zip(bots, pages, strict=True))
+        }
+        pending = set(tasks)
+        winner: int | None = None
+        grace_deadline: float | None = None
+        loop = asyncio.get_running_loop()
+
+        try:
+            while pending:
+                timeout = None if grace_deadline is None else max(0.0, grace_deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    i = tasks[task]
+                    error = task.exception()
+                    if isinstance(error, CredentialsRejectedError):
+                        logger.error(str(error))
+                        winner = None
+                        return RegistrationStatus.INVALID_CREDENTIALS
+                    if error is not None:
+                        logger.warning(f"Target '{targets[i].label}' failed: {error}")
+                    elif task.result() == RegistrationStatus.SUCCESS:
+                        logger.info(f"Target '{targets[i].label}' is in the cart")
+                        if winner is None or i < winner:
+                            winner = i
+
+                if winner is None:
+                    continue
+                for task in list(pending):
+                    if tasks[task] > winner:
+                        logger.info(
+                            f"Cancelling lower-priority target '{targets[tasks[task]].label}'"
+                        )
+                        task.cancel()
+                        pending.discard(task)
+                if grace_deadline is None:
+                    grace_deadline = loop.time() + self.settings.fallback_grace
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for i, page in enumerate(pages):
+                if i != winner:
+                    await bots[i]._release_cart(page)
+                    await page.close()
+
+        if winner is None:
+            for target, bot in zip(targets, bots, strict=True):
+                if bot.last_activity_status:
+                    logger.info(f"Target '{target.label}': {bot.last_activity_status.value}")
+            self.last_activity_status = most_specific_status(b.last_activity_status for b in bots)
+            if self.last_activity_status:
+                logger.error(f"Activity found but: {self.last_activity_status.value}")
+                return self.last_activity_status
+            logger.error("Registration timed out - no target became available")
+            return RegistrationStatus.TIMEOUT
+
+        bot, page = bots[winner], pages[winner]
+        logger.info(f"Registering for target '{targets[winner].label}'")
+        self.opening_to_cart = bot.opening_to_cart
+        try:
+            return await bot._complete(page)
+        except Exception as e:
+            return await bot._fail(page, e)
+        finally:
+            await page.close()
+
+    async def _release_cart(self, page: Page) -> None:
+        """Empty the cart of a target that lost to a better one, so it holds no place.
+
+        A row that was only selected holds nothing; the site keeps a place
+        once the row is added to the cart.
+        """
+        try:
+            cart = page.locator(self.selectors.dossier_input_template.format(i=0))
+            if await cart.count() == 0:
+                return
+            logger.info("Removing a superseded target from its cart...")
+            await self._unregister_participants(page)
+        except Exception as e:
+            logger.warning(f"Could not empty a superseded cart: {e}")
 
     async def _navigate_to_search(self, page: Page) -> None:
-        logger.info("Opening registration website...")
-        await page.goto(self.settings.registration_url, wait_until="networkidle")
+        if page.url != self.settings.registration_url:
+            logger.info("Opening registration website...")
+            await page.goto(self.settings.registration_url, wait_until="domcontentloaded")
 
         logger.info("Selecting 'available only' filter...")
         await page.get_by_role("link", name="Disponibilités").click()
-        await page.wait_for_timeout(300)
-        await page.locator(self.selectors.available_only_radio).click()
-        await page.wait_for_timeout(300)
+        radio = page.locator(self.selectors.available_only_radio)
+        await self.waits.for_visible(radio, "tab")
+        await radio.click()
+        await self.waits.for_checked(radio, "option")
 
         logger.info(f"Searching for activity: {self.settings.activity_name}")
         await page.locator(self.selectors.keyword_search).fill(self.settings.activity_name)
-        await page.locator(self.selectors.search_option_or).click()
-        await page.wait_for_timeout(300)
+        option_or = page.locator(self.selectors.search_option_or)
+        await option_or.click()
+        await self.waits.for_checked(option_or, "option")
 
         if self.settings.domain:
             logger.info("Opening Domaines tab...")
             await page.get_by_role("link", name="Domaines").click()
-            await page.wait_for_timeout(500)
 
             logger.info(f"Selecting domain: {self.settings.domain}")
             checkbox = page.locator(
                 f"//*[contains(text(), '{self.settings.domain}')]/preceding::input[@type='checkbox'][1]"
             )
+            await self.waits.for_visible(checkbox, "tab")
             await checkbox.first.click()
-            await page.wait_for_timeout(300)
+            await self.waits.for_checked(checkbox, "option")
 
         logger.info("Clicking search button...")
-        await page.locator(self.selectors.search_button).click()
-        await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(1000)
+        await self.waits.for_replaced(
+            page, page.locator(self.selectors.search_button).click, "search"
+        )
+        self._paginator = Paginator(page, waits=self.waits)
 
     async def _wait_and_select_activity(self, page: Page) -> RegistrationStatus | None:
         logger.info(f"Searching for activity: {self.settings.activity_name}")
         start_time = asyncio.get_running_loop().time()
         attempts = 0
+        reload_time = 0.0
+
+        client: WebFormsClient | None = None
+        if self.settings.backend == "http":
+            client = WebFormsClient(self.settings.registration_url, timeout=self.settings.timeout)
+
+        try:
+            while asyncio.get_running_loop().time() - start_time < self.settings.timeout:
+                attempts += 1
+                elapsed = int(asyncio.get_running_loop().time() - start_time)
+                logger.info(f"Attempt #{attempts} (elapsed: {elapsed}s)")
+                poll_start = time.perf_counter()
+
+                # None: no cheap answer, look at the page itself.
+                ready: bool | None = None
+                if client is not None:
+                    ready = await self._probe_http(client)
+                elif self.settings.probe:
+                    ready = await self._probe_results(page)
+
+                if ready is not False:
+                    if ready:
+                        logger.info("Activity selectable according to probe, using browser...")
+                        await self._reload(page)
+                    result = await self._find_and_select_activity(page)
+
+                    if result == RegistrationStatus.SUCCESS:
+                        logger.info("Activity found and selected!")
+                        return result
+
+                logger.info("Activity not available yet, refreshing...")
+                latency = reload_time + time.perf_counter() - poll_start
+                await asyncio.sleep(self._next_delay(latency))
+                reload_time = 0.0
+                if ready is None:
+                    reload_start = time.perf_counter()
+                    await self._reload(page)
+                    reload_time = time.perf_counter() - reload_start
+        finally:
+            if client is not None:
+                await client.close()
 
-        while asyncio.get_running_loop().time() - start_time < self.settings.timeout:
-            attempts += 1
-            elapsed = int(asyncio.get_running_loop().time() - start_time)
-            logger.info(f"Attempt #{attempts} (elapsed: {elapsed}s)")
+        return None
 
-            result = await self._find_and_select_activity(page)
+    async def _prepare_snipe(self, page: Page) -> None:
+        """Sync with the server clock, then idle until just before registration opens."""
+        assert self.settings.open_at is not None
+        opening = self.settings.open_at.timestamp()
+
+        self.clock = await sync_server_clock(page.context.request, self.settings.registration_url)
+        burst_start = opening - self.settings.burst_lead
+
+        while (remaining := burst_start - self.clock.now()) > 0:
+            logger.info(f"Registration opens in {remaining:.0f}s, search page ready")
+            if remaining <= self.settings.keepalive_interval:
+                await sleep_until(self.clock, burst_start)
+                break
+            await asyncio.sleep(self.settings.keepalive_interval)
+            # Keep the ASP.NET session and search results warm while idling.
+            await self._reload(page)
+
+        logger.info("Starting polling burst around opening time")
+
+    def _next_delay(self, latency: float) -> float:
+        since_opening = None
+        if self.settings.open_at is not None:
+            now = self.clock.now() if self.clock is not None else time.time()
+            since_opening = now - self.settings.open_at.timestamp()
+
+        observation = PollObservation(
+            not_yet=self.last_activity_status == RegistrationStatus.FAILED,
+            latency=latency,
+            since_opening=since_opening,
+        )
+        decision = self.scheduler.next_delay(observation)
+        self.report(
+            f"Next poll in {decision.delay:.2f}s ({decision.reason}; "
+            f"last poll took {latency * 1000:.0f} ms)"
+        )
+        return decision.delay
 
-            if result == RegistrationStatus.SUCCESS:
-                logger.info("Activity found and selected!")
-                return result
+    async def _reload(self, page: Page) -> None:
+        await self.waits.for_replaced(
+            page, lambda: page.reload(wait_until="domcontentloaded"), "reload"
+        )
 
-            logger.info("Activity not available yet, refreshing...")
-            await asyncio.sleep(self.settings.refresh_interval)
-            await page.reload(wait_until="networkidle")
-            await page.wait_for_timeout(2000)
+    def _remember_postback(self, request: Request) -> None:
+        post_data = request.post_data
+        if request.method == "POST" and post_data and "__VIEWSTATE" in post_data:
+            headers = {k: v for k, v in request.headers.items() if k in REPLAY_HEADERS}
+            self._last_postback = ResultsRequest(request.url, post_data, headers)
 
-        return None
+    async def _probe_results(self, page: Page) -> bool | None:
+        """Replay the postback that rendered the target row and classify the row.
+
+        Returns whether the row is selectable, or ``None`` when there is nothing
+        to replay yet or the row is no longer in the response.
+        """
+        results = self._results_request
+        if results is None:
+            return None
+
+        start = time.perf_counter()
+        try:
+            response = await page.context.request.post(
+                results.url, data=results.post_data, headers=results.headers
+            )
+            body = await response.text()
+        except PlaywrightError as e:
+            logger.warning(f"Probe failed: {e}")
+            return None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        rows = find_target_rows(
+            parse_html(body), self.settings.activity_name, self.settings.activity_day
+        )
+        logger.info(f"Probe: {len(body) / 1024:.0f} KB in {elapsed_ms:.0f} ms, {len(rows)} rows")
+        if self._target_location is not None:
+            expected = self._target_location.row
+            rows = [row for row in rows if row_identity(element_cells(row)) == expected]
+        if not rows:
+            self._results_request = None
+            return None
+
+        button = _select_button(rows[0])
+        assert button is not None
+        src, alt = button.get("src"), button.get("alt")
+        status = get_registration_status(src, alt, rows[0].inner_text())
+        if status is None:
+            return True
+        if not may_still_open(status, src, alt):
+            # Closed for good: let the browser look for another matching row.
+            self._results_request = None
+            return None
+        log_unavailable(status)
+        self.last_activity_status = status
+        return False
+
+    async def _probe_http(self, client: WebFormsClient) -> bool:
+        """Run the search over HTTP and report whether the target row is selectable."""
+        try:
+            await client.open()
+            root = await client.search(
+                search_button_id=self.selectors.search_button.lstrip("#"),
+                available_only=True,
+                domain=self.settings.domain,
+                keyword=self.settings.activity_name,
+                keyword_input_id=self.selectors.keyword_search.lstrip("#"),
+                keyword_or_id=self.selectors.search_option_or.lstrip("#"),
+            )
+        except Exception as e:
+            logger.warning(f"HTTP search failed: {e}")
+            return False
+
+        number = 1
+        page_root: Element | None = root
+        while page_root is not None:
+            for row in find_target_rows(
+                page_root, self.settings.activity_name, self.settings.activity_day
+            ):
+                button = _select_button(row)
+                assert button is not None
+                src, alt = button.get("src"), button.get("alt")
+                status = get_registration_status(src, alt, row.inner_text())
+                if status is None:
+                    return True
+                log_unavailable(status)
+                self.last_activity_status = status
+                if may_still_open(status, src, alt):
+                    return False
+
+            # Re-read each time: a block pager only links the next block from its end.
+            if (number := number + 1) > max(client.page_numbers()):
+                break
+            page_root = await client.goto_page(number)
+
+        return False
 
     async def _find_and_select_activity(self, page: Page) -> RegistrationStatus | None:
+        """Check the page where the target was last seen, else scan every results page."""
+        self.search_hits = 0
+        checked: set[int] = set()
+        pager = self._pager(page)
+        try:
+            location = self._target_location
+            if location is not None:
+                if not await pager.goto(location.page_number):
+                    logger.warning(f"Could not reach results page {location.page_number}")
+                checked.add(pager.current)
+                result = await self._check_results_page(page)
+                if result is not None or (self.search_hits and self._target_location):
+                    return result
+                self.report("Target row moved or closed, scanning all results pages")
+                self._target_location = None
+
+            if pager.current not in checked:
+                checked.add(pager.current)
+                result = await self._check_results_page(page)
+                if result is not None or self._target_location is not None:
+                    return result
+
+            async for number in pager.pages(start=1):
+                if number in checked:
+                    continue
+                checked.add(number)
+                result = await self._check_results_page(page)
+                if result is not None or self._target_location is not None:
+                    return result
+            return None
+        finally:
+            self.report(f"Search hits this poll: {self.search_hits} on {len(checked)} page(s)")
+
+    async def _check_results_page(self, page: Page) -> RegistrationStatus | None:
         result = await self._try_select_on_page(page)
-        if result == RegistrationStatus.SUCCESS:
-            return result
-        if result is not None:
+        if result is not None and result != RegistrationStatus.SUCCESS:
             self.last_activity_status = result
+        return result if result == RegistrationStatus.SUCCESS else None
 
-        async def try_page(p: Page) -> RegistrationStatus | None:
-            r = await self._try_select_on_page(p)
-            if r == RegistrationStatus.SUCCESS:
-                return r
-            if r is not None:
-                self.last_activity_status = r
-            return None
-
-        return await iterate_pagination(page, try_page)
+    def _pager(self, page: Page) -> Paginator:
+        if self._paginator is None or self._paginator.page is not page:
+            self._paginator = Paginator(page, waits=self.waits)
+        return self._paginator
 
     async def _try_select_on_page(self, page: Page) -> RegistrationStatus | None:
-        activity_name = self.settings.activity_name
+        """Select the first open matching row, remembering one that is not open yet.
 
+        While a row is remembered, it is the only one looked at. Once it is
+        full, cancelled or will never open, it is forgotten and the other
+        matching rows get their turn.
+        """
+        activity_name = self.settings.activity_name
         activity_elements = page.get_by_text(activity_name, exact=False)
         count = await activity_elements.count()
         logger.info(f"Found {count} elements matching '{activity_name}'")
 
+        rows: list[tuple[Locator, list[str]]] = []
         for i in range(count):
-            el = activity_elements.nth(i)
-            parent_row = el.locator("xpath=ancestor::tr[1]")
+            parent_row = activity_elements.nth(i).locator("xpath=ancestor::tr[1]")
             select_btn = parent_row.locator("input[type='image'][id*='Selecteur']")
-            btn_count = await select_btn.count()
-
-            if btn_count > 0:
-                btn = select_btn.first
-                src = await btn.get_attribute("src") or ""
-                alt = await btn.get_attribute("alt") or ""
-
-                status = get_status_from_image_src(src, alt)
-                if status == ActivityStatus.NEVER_AVAILABLE:
-                    logger.info("Activity found but online registration never available")
-                    return RegistrationStatus.REGISTRATION_NEVER_AVAILABLE
+            if await select_btn.count() == 0:
+                continue
+            cells = await parent_row.locator("td").all_inner_texts()
+            if row_matches_day("\t".join(cells), self.settings.activity_day):
+                rows.append((select_btn.first, cells))
+
+        if self._target_location is not None:
+            # The remembered row goes first; sorted() keeps the others in page order.
+            expected = self._target_location.row
+            rows = sorted(rows, key=lambda row: row_identity(row[1]) != expected)
+
+        for btn, cells in rows:
+            identity = row_identity(cells)
+            if self._target_location is not None and identity != self._target_location.row:
+                continue
+
+            self.search_hits += 1
+            src = await btn.get_attribute("src") or ""
+            alt = await btn.get_attribute("alt") or ""
+            status = get_registration_status(src, alt, "\t".join(cells))
+            if status is None:
+                return await self._select_row(page, btn)
+
+            log_unavailable(status)
+            if not may_still_open(status, src, alt):
+                self.last_activity_status = status
+                self._target_location = None
+                continue
+
+            self._target_location = TargetLocation(self._pager(page).current, identity)
+            # Probes replay whatever postback rendered this row.
+            self._results_request = self._last_postback
+            return status
 
-                row_content = await parent_row.inner_text()
-                if "COMPLET" in row_content.upper():
-                    logger.info("Activity found but is COMPLET (full)")
-                    return RegistrationStatus.ACTIVITY_FULL
-                if "ANNULÉE" in row_content.upper():
-                    logger.info("Activity found but is ANNULÉE (cancelled)")
-                    return RegistrationStatus.ACTIVITY_CANCELLED
+        return None
 
-                if status == ActivityStatus.NOT_YET or status == ActivityStatus.FULL:
-                    logger.info(f"Found activity but not available: {status.value}")
-                    return RegistrationStatus.FAILED
+    async def _select_row(self, page: Page, btn: Locator) -> RegistrationStatus:
+        logger.info("Found activity, clicking select button...")
+        cart_button = page.locator(self.selectors.cart_button)
+        await btn.click()
+        await self.waits.for_visible(cart_button, "select")
+
+        await self._check_credentials()
+        logger.info("Adding to cart...")
+        await cart_button.click()
+        await self.waits.for_visible(
+            page.locator(self.selectors.dossier_input_template.format(i=0)), "cart"
+        )
 
-                logger.info("Found activity, clicking select button...")
-                await btn.click()
-                await page.wait_for_timeout(500)
+        if self.clock is not None and self.settings.open_at is not None:
+            self.opening_to_cart = self.clock.now() - self.settings.open_at.timestamp()
+            logger.info(f"In cart {self.opening_to_cart:.2f}s after opening")
 
-                logger.info("Adding to cart...")
-                await page.locator(self.selectors.cart_button).click()
-                await page.wait_for_load_state("networkidle")
+        return RegistrationStatus.SUCCESS
 
-                return RegistrationStatus.SUCCESS
+    async def _check_credentials(self) -> None:
+        """Wait for the background verification, failing if anyone was rejected."""
+        if self._verification_task is None:
+            return
+        if not self._verification_task.done():
+            logger.info("Waiting for credential verification to finish...")
+        try:
+            self.verification = await self._verification_task
+        except Exception as e:
+            logger.warning(f"Credential verification failed, continuing anyway: {e}")
+        self._verification_task = None
+
+        rejected = rejected_names(self.verification)
+        if rejected:
+            raise CredentialsRejectedError(rejected)
+
+    def _report_rejected(self, task: asyncio.Task[list[ParticipantVerification]]) -> None:
+        """Warn as soon as verification ends, long before the cart when sniping an opening."""
+        if task.cancelled() or task.exception() is not None:
+            return
+        rejected = rejected_names(task.result())
+        if rejected:
+            logger.warning(
+                f"Invalid credentials for: {', '.join(rejected)}; "
+                "registration will stop before adding to the cart"
+            )
 
-        return None
+    async def _finish_verification(self) -> None:
+        """Keep results that came in without being needed, and stop a pending run."""
+        task, self._verification_task = self._verification_task, None
+        if task is None:
+            return
+        if task.done() and not task.cancelled() and task.exception() is None:
+            self.verification = task.result()
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
     async def _fill_credentials(self, page: Page) -> None:
         logger.info("Filling credentials...")
@@ -243,13 +824,12 @@ class RegistrationBot:
             unregister_selector = self.selectors.unregister_button_template.format(i=i)
             unregister_btn = page.locator(unregister_selector)
             if await unregister_btn.count() > 0:
+                confirm_btn = page.locator("input#OUI[value='OUI']")
                 await unregister_btn.first.click()
-                await page.wait_for_timeout(300)
+                await self.waits.for_visible(confirm_btn, "unregister")
 
-                confirm_btn = page.locator("input#OUI[value='OUI']")
                 if await confirm_btn.count() > 0:
-                    await confirm_btn.click()
-                    await page.wait_for_timeout(500)
+                    await self.waits.for_postback(page, confirm_btn.click, "unregister")
                     logger.info(f"Unregistered participant {i}")
 
         page_content = await page.locator("body").inner_text()
@@ -268,9 +848,10 @@ class RegistrationBot:
 
     async def _submit(self, page: Page) -> RegistrationStatus:
         logger.info("Submitting registration...")
-        await page.locator(self.selectors.validate_button).click()
-        await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(2000)
+        await self.waits.for_replaced(
+            page, page.locator(self.selectors.validate_button).click, "submit", "body"
+        )
+        await self.waits.for_text(page, SUBMIT_OUTCOMES, "outcome")
 
         page_content = await page.locator("body").inner_text()
 
@@ -0,0 +1,233 @@
+"""Record a browser session to a HAR archive once, then replay it offline.
+
+Recording routes every request through ``route.fetch()`` and keeps the
+response in HAR 1.2 form. Replaying fulfills each request from the archive
+without touching the network. Requests are matched on method, URL and post
+data, and identical requests get their recorded responses in order, so a
+page polled until a row flips sees the flip at the same poll again. Once
+those responses run out, the last one keeps being served.
+
+The archive also keeps the recorded run's per-step wait timings, so a
+replay can be compared step by step against the run it came from.
+"""
+
+import base64
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, Self
+
+from playwright.async_api import APIResponse, BrowserContext, Page, Request, Route
+from playwright.async_api import Error as PlaywrightError
+
+from . import __version__
+from .waits import StepSummary
+
+logger = logging.getLogger(__name__)
+
+ArchiveMode = Literal["record", "replay"]
+
+HAR_VERSION = "1.2"
+TEXT_MIME_PARTS = ("text/", "javascript", "json", "xml")
+# The recorded body is already decoded, and Playwright sets its length itself.
+DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+RequestKey = tuple[str, str, str]
+
+
+@dataclass
+class StepComparison:
+    step: str
+    recorded_ms: float | None
+    replayed_ms: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.recorded_ms or self.replayed_ms is None:
+            return None
+        return self.replayed_ms / self.recorded_ms
+
+
+def request_key(method: str, url: str, post_data: str | None) -> RequestKey:
+    return method.upper(), url, post_data or ""
+
+
+def har_headers(headers: dict[str, str]) -> list[dict[str, str]]:
+    return [{"name": name, "value": value} for name, value in headers.items()]
+
+
+def har_content(body: bytes, mime_type: str) -> dict[str, Any]:
+    content: dict[str, Any] = {"size": len(body), "mimeType": mime_type}
+    if any(part in mime_type for part in TEXT_MIME_PARTS):
+        try:
+            content["text"] = body.decode()
+            return content
+        except UnicodeDecodeError:
+            pass
+    content["text"] = base64.b64encode(body).decode("ascii")
+    content["encoding"] = "base64"
+    return content
+
+
+def content_body(content: dict[str, Any]) -> bytes:
+    text = content.get("text", "")
+    if content.get("encoding") == "base64":
+        return base64.b64decode(text)
+    return str(text).encode()
+
+
+def har_entry(
+    request: Request, response: APIResponse, body: bytes, elapsed_ms: float, started: datetime
+) -> dict[str, Any]:
+    mime_type = response.headers.get("content-type", "")
+    entry: dict[str, Any] = {
+        "startedDateTime": started.isoformat(),
+        "time": round(elapsed_ms, 3),
+        "request": {
+            "method": request.method,
+            "url": request.url,
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": har_headers(request.headers),
+            "queryString": [],
+            "headersSize": -1,
+            "bodySize": len(request.post_data or ""),
+        },
+        "response": {
+            "status": response.status,
+            "statusText": response.status_text,
+            "httpVersion": "HTTP/1.1",
+            "cookies": [],
+            "headers": [{"name": h["name"], "value": h["value"]} for h in response.headers_array],
+            "content": har_content(body, mime_type),
+            "redirectURL": response.headers.get("location", ""),
+            "headersSize": -1,
+            "bodySize": len(body),
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": round(elapsed_ms, 3), "receive": 0},
+        "_resourceType": request.resource_type,
+    }
+    if request.post_data is not None:
+        entry["request"]["postData"] = {
+            "mimeType": request.headers.get("content-type", ""),
+            "text": request.post_data,
+        }
+    return entry
+
+
+def entry_key(entry: dict[str, Any]) -> RequestKey:
+    request = entry["request"]
+    return request_key(request["method"], request["url"], request.get("postData", {}).get("text"))
+
+
+class SessionArchive:
+    """Browser traffic recorded to, or replayed from, a HAR file.
+
+    Attach it to every context or page of a run (``NetworkMonitor`` does when
+    given one), then ``save()`` after a recording. Replay misses are aborted
+    and listed in ``missed``.
+    """
+
+    def __init__(self, path: Path, mode: ArchiveMode):
+        self.path = path
+        self.mode = mode
+        self.entries: list[dict[str, Any]] = []
+        self.recorded_steps: list[StepSummary] = []
+        self.recorded_elapsed: float | None = None
+        self.served = 0
+        self.missed: list[str] = []
+        self._queues: dict[RequestKey, deque[dict[str, Any]]] = {}
+
+    @classmethod
+    def record(cls, path: Path) -> Self:
+        return cls(path, "record")
+
+    @classmethod
+    def replay(cls, path: Path) -> Self:
+        """Load ``path``; raises ``ValueError`` when it is not a HAR archive."""
+        archive = cls(path, "replay")
+        try:
+            log = json.loads(path.read_text(encoding="utf-8"))["log"]
+            archive.entries = list(log["entries"])
+            archive.recorded_steps = [StepSummary(**step) for step in log.get("_steps", [])]
+            archive.recorded_elapsed = log.get("_elapsed_s")
+            for entry in archive.entries:
+                archive._queues.setdefault(entry_key(entry), deque()).append(entry)
+        except (OSError, KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Not a HAR archive: {path} ({e})") from e
+        return archive
+
+    async def attach(self, target: BrowserContext | Page) -> None:
+        await target.route("**/*", self._route)
+
+    async def _route(self, route: Route) -> None:
+        if self.mode == "record":
+            await self._record(route)
+        else:
+            await self._replay(route)
+
+    async def _record(self, route: Route) -> None:
+        request = route.request
+        started = datetime.now(UTC)
+        start = time.perf_counter()
+        try:
+            # Redirects are recorded as they come; the browser requests the target itself.
+            response = await route.fetch(max_redirects=0)
+            body = await response.body()
+        except PlaywrightError as e:
+            logger.debug(f"Not recording {request.method} {request.url}: {e}")
+            await route.abort()
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.entries.append(har_entry(request, response, body, elapsed_ms, started))
+        await route.fulfill(response=response, body=body)
+
+    async def _replay(self, route: Route) -> None:
+        request = route.request
+        queue = self._queues.get(request_key(request.method, request.url, request.post_data))
+        if not queue:
+            logger.debug(f"Not in archive: {request.method} {request.url}")
+            self.missed.append(f"{request.method} {request.url}")
+            await route.abort()
+            return
+
+        entry = queue.popleft() if len(queue) > 1 else queue[0]
+        response = entry["response"]
+        self.served += 1
+        await route.fulfill(
+            status=response["status"],
+            headers={
+                h["name"]: h["value"]
+                for h in response["headers"]
+                if h["name"].lower() not in DROPPED_RESPONSE_HEADERS
+            },
+            body=content_body(response["content"]),
+        )
+
+    def save(self, steps: list[StepSummary], elapsed: float) -> None:
+        """Write the recorded entries, with the run's step timings and duration."""
+        log = {
+            "version": HAR_VERSION,
+            "creator": {"name": "longueuil-aweille", "version": __version__},
+            "pages": [],
+            "entries": self.entries,
+            "_steps": [asdict(step) for step in steps],
+            "_elapsed_s": round(elapsed, 3),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"log": log}, ensure_ascii=False), encoding="utf-8")
+        logger.info(f"Recorded {len(self.entries)} requests to {self.path}")
+
+    def compare(self, steps: list[StepSummary]) -> list[StepComparison]:
+        """Average wait per step in the recorded run next to the same step in ``steps``."""
+        recorded = {s.step: s.avg_ms for s in self.recorded_steps}
+        replayed = {s.step: s.avg_ms for s in steps}
+        return [
+            StepComparison(step, recorded.get(step), replayed.get(step))
+            for step in dict.fromkeys([*recorded, *replayed])
+        ]
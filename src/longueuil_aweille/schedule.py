@@ -0,0 +1,113 @@
+import re
+import unicodedata
+from datetime import date, datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+SITE_TIMEZONE = ZoneInfo("America/Montreal")
+
+FRENCH_MONTHS = {
+    "janvier": 1,
+    "janv": 1,
+    "fevrier": 2,
+    "fevr": 2,
+    "fev": 2,
+    "mars": 3,
+    "avril": 4,
+    "avr": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7,
+    "juil": 7,
+    "aout": 8,
+    "septembre": 9,
+    "sept": 9,
+    "octobre": 10,
+    "oct": 10,
+    "novembre": 11,
+    "nov": 11,
+    "decembre": 12,
+    "dec": 12,
+}
+
+ISO_DATE_RE = re.compile(r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})")
+FRENCH_DATE_RE = re.compile(r"(\d{1,2})(?:er)?\s+([a-z]+)\.?\s+(\d{4})")
+TIME_RE = re.compile(r"(\d{1,2})\s*(?:h|:)\s*(\d{2})?")
+PRICE_RE = re.compile(r"(\d{1,3}(?:[ \u00a0\u202f]?\d{3})*)(?:[,.](\d{2}))?")
+
+# A catalog repeats a few hundred distinct date, time and price strings, so
+# the column parsers below are memoized per string.
+PARSE_CACHE_SIZE = 4096
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents so 'Décembre' and 'decembre' compare equal."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def parse_site_datetime(text: str) -> datetime | None:
+    """Parse a date and optional time as shown on the site, in the site's timezone.
+
+    Handles ``2025-12-01, 19:00``, ``2025-12-01 19 h 00`` and
+    ``1er décembre 2025, 19 h``. Returns ``None`` when no date is found.
+    """
+    folded = fold(text)
+
+    iso = ISO_DATE_RE.search(folded)
+    if iso:
+        year, month, day = (int(g) for g in iso.groups())
+        rest = folded[iso.end() :]
+    else:
+        french = FRENCH_DATE_RE.search(folded)
+        if french is None or french.group(2) not in FRENCH_MONTHS:
+            return None
+        day, month, year = (
+            int(french.group(1)),
+            FRENCH_MONTHS[french.group(2)],
+            int(french.group(3)),
+        )
+        rest = folded[french.end() :]
+
+    hour = minute = 0
+    clock = TIME_RE.search(rest)
+    if clock:
+        hour = int(clock.group(1))
+        minute = int(clock.group(2) or 0)
+
+    try:
+        return datetime(year, month, day, hour, minute, tzinfo=SITE_TIMEZONE)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_site_date(text: str) -> date | None:
+    """The date part of :func:`parse_site_datetime`."""
+    parsed = parse_site_datetime(text)
+    return parsed.date() if parsed is not None else None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_time_range(text: str) -> tuple[int, int] | None:
+    """Minutes since midnight of the first and last time in ``9 h 00 à 10 h 30``."""
+    times = [
+        int(hour) * 60 + int(minute or 0)
+        for hour, minute in TIME_RE.findall(fold(text))
+        if int(hour) < 24 and int(minute or 0) < 60
+    ]
+    if not times:
+        return None
+    return times[0], times[-1]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_price(text: str) -> int | None:
+    """Price in cents from ``45,00 $`` or ``1 200 $``; ``Gratuit`` is 0."""
+    if "gratuit" in fold(text):
+        return 0
+    match = PRICE_RE.search(text)
+    if match is None:
+        return None
+    dollars = re.sub(r"\D", "", match.group(1))
+    return int(dollars) * 100 + int(match.group(2) or 0)
@@ -0,0 +1,596 @@
+"""A local stand-in for the registration site, for end-to-end runs without the real one.
+
+It serves the same ASP.NET WebForms markup the bots rely on: the search block
+with its tabs, ``ctl*`` ids and ``__doPostBack`` links, a windowed or block
+results pager, the dates popup, the cart with its credential inputs and the
+confirmation page. Search state lives in a session cookie, so postbacks can
+be replayed and reloads show the same results. Activities listed in
+``opens_at`` show as not yet open until their time comes, then flip to
+available, and each step of a race for them is timestamped in ``events``.
+"""
+
+import html
+import logging
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Literal
+from urllib.parse import parse_qs
+
+from .browse import Activity
+from .schedule import SITE_TIMEZONE, fold
+from .status import ActivityStatus
+
+logger = logging.getLogger(__name__)
+
+SITE_PATH = "/inscription/Pages/Anonyme/Resultat/Page.fr.aspx?m=1"
+SESSION_COOKIE = "ASP.NET_SessionId"
+
+SEARCH_TARGET = "ctlBlocRecherche$ctlRechercher"
+PAGE_TARGET_PREFIX = "ctlGrille$ctlPagination$ctlLienPage"
+CART_TARGET = "ctlGrille$ctlMenuActionsBas$ctlAppelPanierIdent"
+CONFIRM_TARGET = "ctlMenuActionBas$ctlAppelPanierConfirm"
+AVAILABILITY_FIELD = "ctlBlocRecherche$ctlSelDisponibilite"
+KEYWORD_FIELD = "ctlBlocRecherche$ctlMotsCles$ctlMotsCle"
+KEYWORD_OPTION_FIELD = "ctlBlocRecherche$ctlMotsCles$ctlOption"
+CART_FIELD = "ctlPanierActivites$ctlActivites$ctl{i:02d}$ctlRow$ctlListeIdentification$ctlListe$itm0$ctlBloc${name}"
+
+STATUS_IMAGES = {
+    ActivityStatus.AVAILABLE: ("/inscription/images/Inscrire.png", "Inscrire"),
+    ActivityStatus.NOT_YET: ("/inscription/images/InscrNotNow.png", "Pas encore disponible"),
+    ActivityStatus.FULL: ("/inscription/images/InscrComplet.png", "Complet"),
+    ActivityStatus.CANCELLED: ("/inscription/images/InscrAnnule.png", "Annulé"),
+    ActivityStatus.NEVER_AVAILABLE: (
+        "/inscription/images/InscrJamaisDispo.png",
+        "Jamais disponible",
+    ),
+}
+# Statuses that "Disponibilités seulement" leaves out.
+UNAVAILABLE = frozenset(
+    {ActivityStatus.FULL, ActivityStatus.CANCELLED, ActivityStatus.NEVER_AVAILABLE}
+)
+
+SCRIPT = """
+function __doPostBack(target, argument) {
+    var form = document.forms[0];
+    form.__EVENTTARGET.value = target;
+    form.__EVENTARGUMENT.value = argument;
+    form.submit();
+}
+function showTab(id) {
+    document.querySelectorAll(".Panneau").forEach(function (panel) {
+        panel.style.display = panel.id === id ? "block" : "none";
+    });
+}
+"""
+
+
+@dataclass
+class RaceEvents:
+    """Wall-clock times (``time.time()``) of each step of the race for one activity."""
+
+    opened: float
+    first_served: float | None = None
+    selected: float | None = None
+    in_cart: float | None = None
+    reserved: float | None = None
+
+    def since_opening(self) -> dict[str, float | None]:
+        return {
+            "first_served": _delta(self.first_served, self.opened),
+            "selected": _delta(self.selected, self.opened),
+            "in_cart": _delta(self.in_cart, self.opened),
+            "reserved": _delta(self.reserved, self.opened),
+        }
+
+
+def _delta(at: float | None, since: float) -> float | None:
+    return None if at is None else at - since
+
+
+@dataclass
+class Search:
+    keyword: str = ""
+    any_word: bool = False
+    available_only: bool = False
+    domains: frozenset[str] = frozenset()
+
+
+@dataclass
+class Session:
+    search: Search | None = None
+    page: int = 1
+    selected: str | None = None
+    cart: str | None = None
+
+
+@dataclass
+class Response:
+    body: str
+    status: int = 200
+
+
+class RegistrationSite:
+    """The site's state and pages; thread-safe, as the server handles requests concurrently.
+
+    ``credentials`` maps access card numbers to phone numbers; the cart has one
+    identification block per entry. ``opens_at`` maps activity codes to the
+    wall-clock time their registration opens. The ``"window"`` pager links
+    ``pager_window`` pages around the current one; the ``"block"`` pager links
+    a block of that many, with "..." links to the neighbouring blocks.
+    """
+
+    def __init__(
+        self,
+        activities: list[Activity],
+        credentials: dict[str, str],
+        opens_at: dict[str, float] | None = None,
+        per_page: int = 20,
+        pager_window: int = 10,
+        pager: Literal["window", "block"] = "window",
+        viewstate_size: int = 4096,
+    ):
+        self.activities = {a.code: a for a in activities}
+        self.credentials = credentials
+        self.opens_at = opens_at or {}
+        self.per_page = per_page
+        self.pager_window = pager_window
+        self.pager = pager
+        self.viewstate = secrets.token_urlsafe(viewstate_size * 3 // 4)
+        self.domains = sorted({a.domain for a in activities})
+        self.events = {code: RaceEvents(opened=at) for code, at in self.opens_at.items()}
+        self.enrolled: dict[str, set[str]] = {}
+        self.requests = 0
+        self._sessions: dict[str, Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, session_id: str | None) -> tuple[str, Session]:
+        with self._lock:
+            if session_id is None or session_id not in self._sessions:
+                session_id = secrets.token_hex(12)
+                self._sessions[session_id] = Session()
+            return session_id, self._sessions[session_id]
+
+    def status(self, activity: Activity, now: float) -> ActivityStatus:
+        opens = self.opens_at.get(activity.code)
+        if opens is not None and now < opens:
+            return ActivityStatus.NOT_YET
+        return activity.status
+
+    def get(self, session: Session) -> Response:
+        with self._lock:
+            self.requests += 1
+            if session.search is None:
+                return Response(self._search_page(session))
+            return Response(self._results_page(session))
+
+    def post(self, session: Session, form: dict[str, str]) -> Response:
+        with self._lock:
+            self.requests += 1
+            target = form.get("__EVENTTARGET", "")
+            clicked = next((k[:-2] for k in form if k.endswith(".x")), "")
+
+            if target == SEARCH_TARGET:
+                session.search = Search(
+                    keyword=form.get(KEYWORD_FIELD, ""),
+                    any_word=form.get(KEYWORD_OPTION_FIELD) == "ctlOptionOU",
+                    available_only=form.get(AVAILABILITY_FIELD) == "ctlDispoSeulement",
+                    domains=frozenset(
+                        domain
+                        for i, domain in enumerate(self.domains, start=1)
+                        if f"ctlDomaines$ctl{i:02d}" in form
+                    ),
+                )
+                session.page = 1
+                session.selected = None
+            elif target.startswith(PAGE_TARGET_PREFIX):
+                session.page = int(target.removeprefix(PAGE_TARGET_PREFIX))
+            elif clicked.endswith("$ctlSelecteur"):
+                return Response(self._select(session, clicked))
+            elif clicked.endswith("$ctlDates"):
+                activity = self._row_activity(session, clicked)
+                return Response(self._results_page(session, popup=activity))
+            elif target == CART_TARGET:
+                return Response(self._cart(session))
+            elif target == CONFIRM_TARGET:
+                return Response(self._confirm(session, form))
+
+            if session.search is None:
+                return Response(self._search_page(session))
+            return Response(self._results_page(session))
+
+    def _matches(self, search: Search, activity: Activity, now: float) -> bool:
+        if search.domains and activity.domain not in search.domains:
+            return False
+        if search.available_only and self.status(activity, now) in UNAVAILABLE:
+            return False
+        words = fold(search.keyword).split()
+        text = fold(f"{activity.name} {activity.code}")
+        if not words:
+            return True
+        found = [word in text for word in words]
+        return any(found) if search.any_word else all(found)
+
+    def _results(self, session: Session, now: float) -> list[Activity]:
+        assert session.search is not None
+        search = session.search
+        return [a for a in self.activities.values() if self._matches(search, a, now)]
+
+    def _page_count(self, results: list[Activity]) -> int:
+        return max(1, -(-len(results) // self.per_page))
+
+    def _page_rows(self, session: Session, now: float) -> list[Activity]:
+        results = self._results(session, now)
+        session.page = min(session.page, self._page_count(results))
+        start = (session.page - 1) * self.per_page
+        return results[start : start + self.per_page]
+
+    def _row_activity(self, session: Session, name: str) -> Activity | None:
+        # Row controls are named ctlGrille$ctlNN$..., counting from 02 like ASP.NET.
+        try:
+            row = int(name.split("$")[1].removeprefix("ctl")) - 2
+        except (IndexError, ValueError):
+            return None
+        rows = self._page_rows(session, time.time()) if session.search else []
+        return rows[row] if 0 <= row < len(rows) else None
+
+    def _select(self, session: Session, name: str) -> str:
+        now = time.time()
+        activity = self._row_activity(session, name)
+        if activity is not None and self.status(activity, now) == ActivityStatus.AVAILABLE:
+            session.selected = activity.code
+            events = self.events.get(activity.code)
+            if events is not None and events.selected is None:
+                events.selected = now
+        return self._results_page(session)
+
+    def _cart(self, session: Session) -> str:
+        if session.selected is None:
+            return self._results_page(session, message="Erreur : aucune activité sélectionnée.")
+        session.cart = session.selected
+        events = self.events.get(session.cart)
+        if events is not None and events.in_cart is None:
+            events.in_cart = time.time()
+        activity = self.activities[session.cart]
+
+        blocks = []
+        for i in range(max(1, len(self.credentials))):
+            dossier = CART_FIELD.format(i=i, name="ctlDossier")
+            nip = CART_FIELD.format(i=i, name="ctlNip")
+            blocks.append(
+                f"""<div class="Identification">
+<label for="{_id(dossier)}">Numéro de carte d'accès</label>
+<input type="text" id="{_id(dossier)}" name="{dossier}" value="" />
+<label for="{_id(nip)}">Numéro de téléphone</label>
+<input type="text" id="{_id(nip)}" name="{nip}" value="" />
+</div>"""
+            )
+        body = f"""<h1>Panier</h1>
+<p class="Activite">{html.escape(activity.name)} ({html.escape(activity.code)})</p>
+<div id="ctlPanierActivites">
+{"".join(blocks)}
+</div>
+{_postback_link("ctlMenuActionBas_ctlAppelPanierConfirm", CONFIRM_TARGET, "Confirmer")}"""
+        return self._document("Panier", body)
+
+    def _confirm(self, session: Session, form: dict[str, str]) -> str:
+        code = session.cart
+        if code is None:
+            return self._document("Erreur", "<p>Erreur : le panier est vide.</p>")
+
+        cards: list[str] = []
+        for i in range(max(1, len(self.credentials))):
+            card = form.get(CART_FIELD.format(i=i, name="ctlDossier"), "").strip()
+            phone = form.get(CART_FIELD.format(i=i, name="ctlNip"), "").strip()
+            if not card:
+                continue
+            if self.credentials.get(card) != phone:
+                return self._document(
+                    "Erreur", "<p>Aucun dossier correspondant n'a été retrouvé.</p>"
+                )
+            cards.append(card)
+
+        enrolled = self.enrolled.setdefault(code, set())
+        activity = self.activities[code]
+        if not cards:
+            message = "<p>Aucun dossier correspondant n'a été retrouvé.</p>"
+        elif enrolled.issuperset(cards):
+            message = "<p>Vous êtes déjà inscrit à cette activité.</p>"
+        elif activity.spots < len(cards):
+            message = "<p>Erreur : il ne reste plus assez de places.</p>"
+        else:
+            enrolled.update(cards)
+            self.activities[code] = replace(activity, spots=activity.spots - len(cards))
+            events = self.events.get(code)
+            if events is not None and events.reserved is None:
+                events.reserved = time.time()
+            session.cart = None
+            session.selected = None
+            message = (
+                f"<p>Place réservée pour {html.escape(activity.name)}.</p>"
+                f"<p>Nouveau tarif ajusté : {html.escape(activity.price)}</p>"
+            )
+        return self._document("Confirmation", f"<h1>Confirmation</h1>\n{message}")
+
+    def _search_block(self, session: Session) -> str:
+        search = session.search or Search()
+        checked = ' checked="checked"'
+        domains = "\n".join(
+            f'<span><input type="checkbox" id="ctlDomaines_ctl{i:02d}" name="ctlDomaines$ctl{i:02d}"'
+            f"{checked if domain in search.domains else ''} />"
+            f'<label for="ctlDomaines_ctl{i:02d}">{html.escape(domain)}</label></span>'
+            for i, domain in enumerate(self.domains, start=1)
+        )
+        every = "" if search.available_only else checked
+        only = checked if search.available_only else ""
+        all_words = "" if search.any_word else checked
+        any_word = checked if search.any_word else ""
+        return f"""<div id="ctlBlocRecherche">
+<ul class="Onglets">
+<li><a id="ctlBlocRecherche_ctlOngletDispo" href="javascript:showTab('ctlBlocRecherche_ctlPanneauDispo')">Disponibilités</a></li>
+<li><a id="ctlBlocRecherche_ctlOngletDomaines" href="javascript:showTab('ctlBlocRecherche_ctlPanneauDomaines')">Domaines</a></li>
+</ul>
+<div id="ctlBlocRecherche_ctlPanneauDispo" class="Panneau" style="display:none">
+<input type="radio" id="ctlBlocRecherche_ctlToutes" name="{AVAILABILITY_FIELD}" value="ctlToutes"{every} />
+<label for="ctlBlocRecherche_ctlToutes">Toutes les activités</label>
+<input type="radio" id="ctlBlocRecherche_ctlDispoSeulement" name="{AVAILABILITY_FIELD}" value="ctlDispoSeulement"{only} />
+<label for="ctlBlocRecherche_ctlDispoSeulement">Disponibles seulement</label>
+</div>
+<div id="ctlBlocRecherche_ctlPanneauDomaines" class="Panneau" style="display:none">
+{domains}
+</div>
+<div id="ctlBlocRecherche_ctlMotsCles">
+<input type="text" id="ctlBlocRecherche_ctlMotsCles_ctlMotsCle" name="{KEYWORD_FIELD}" value="{html.escape(search.keyword)}" />
+<input type="radio" id="ctlBlocRecherche_ctlMotsCles_ctlOptionET" name="{KEYWORD_OPTION_FIELD}" value="ctlOptionET"{all_words} />
+<label for="ctlBlocRecherche_ctlMotsCles_ctlOptionET">Tous les mots</label>
+<input type="radio" id="ctlBlocRecherche_ctlMotsCles_ctlOptionOU" name="{KEYWORD_OPTION_FIELD}" value="ctlOptionOU"{any_word} />
+<label for="ctlBlocRecherche_ctlMotsCles_ctlOptionOU">Un des mots</label>
+</div>
+{_postback_link("ctlBlocRecherche_ctlRechercher", SEARCH_TARGET, "Rechercher")}
+</div>"""
+
+    def _search_page(self, session: Session) -> str:
+        return self._document("Recherche", self._search_block(session))
+
+    def _results_page(
+        self, session: Session, popup: Activity | None = None, message: str = ""
+    ) -> str:
+        now = time.time()
+        results = self._results(session, now)
+        rows = self._page_rows(session, now)
+        page_count = self._page_count(results)
+
+        rendered = []
+        for n, activity in enumerate(rows, start=2):
+            status = self.status(activity, now)
+            events = self.events.get(activity.code)
+            if (
+                events is not None
+                and events.first_served is None
+                and status == ActivityStatus.AVAILABLE
+            ):
+                events.first_served = now
+            rendered.append(_row(n, activity, status))
+
+        pager = self._pager(session.page, page_count)
+        cart = ""
+        if session.selected is not None:
+            cart = _postback_link(
+                "ctlGrille_ctlMenuActionsBas_ctlAppelPanierIdent", CART_TARGET, "Ajouter au panier"
+            )
+        body = f"""{self._search_block(session)}
+<p class="Message">{html.escape(message)}</p>
+<table id="ctlGrille" class="Grille">
+<tr class="Entete"><th>Statut</th><th>Info</th><th>Activité</th><th>Domaine</th><th>Âge min.</th><th>Âge max.</th><th>Début</th><th>Fin</th><th>Promoteur</th><th>Places</th><th>Coût</th><th>Jour(s)</th><th>Heure(s)</th><th>Lieu</th><th></th></tr>
+{"".join(rendered)}
+</table>
+<div id="ctlGrille_ctlPagination" class="Pagination">
+{pager}
+</div>
+<div id="ctlGrille_ctlMenuActionsBas">{cart}</div>
+{self._dates_popup(popup) if popup is not None else ""}"""
+        return self._document("Résultats de la recherche", body)
+
+    def _pager(self, page: int, page_count: int) -> str:
+        window = self.pager_window
+        if self.pager == "block":
+            first = (page - 1) // window * window + 1
+        else:
+            first = max(1, min(page - window // 2, page_count - window + 1))
+        last = min(page_count, first + window - 1)
+
+        links = [
+            f'<span class="PageCourante">{n}</span>' if n == page else _page_link(n, str(n))
+            for n in range(first, last + 1)
+        ]
+        if self.pager == "block":
+            if first > 1:
+                links.insert(0, _page_link(first - 1, "..."))
+            if last < page_count:
+                links.append(_page_link(last + 1, "..."))
+        return "\n".join(links)
+
+    def _dates_popup(self, activity: Activity) -> str:
+        opens = self.opens_at.get(activity.code)
+        start = (
+            datetime.fromtimestamp(opens, SITE_TIMEZONE).strftime("%Y-%m-%d, %H:%M")
+            if opens is not None
+            else "2025-12-01, 19:00"
+        )
+        return f"""<div id="ctlPopupDates" class="Popup">
+<table class="DatesInscriptions">
+<tr><td class="Lieu" rowspan="2">Internet</td><td class="Clientele">Non-résident</td>
+<td class="Dates">{start}</td><td class="Dates">2026-01-31, 23:59</td></tr>
+<tr><td class="Clientele">Résident</td>
+<td class="Dates">{start}</td><td class="Dates">2026-01-31, 23:59</td></tr>
+</table>
+{_postback_link("ctlPopupDates_ctlFermer", "ctlPopupDates$ctlFermer", "Fermer")}
+</div>"""
+
+    def _document(self, title: str, body: str) -> str:
+        return f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8" />
+<title>{html.escape(title)} - Loisirs Longueuil</title>
+<script>{SCRIPT}</script>
+</head>
+<body>
+<form method="post" action="./Page.fr.aspx?m=1" id="aspnetForm">
+<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="" />
+<input type="hidden" name="__EVENTARGUMENT" id="__EVENTARGUMENT" value="" />
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{self.viewstate}" />
+{body}
+</form>
+</body>
+</html>
+"""
+
+
+def _id(name: str) -> str:
+    return name.replace("$", "_")
+
+
+def _postback_link(element_id: str, target: str, text: str) -> str:
+    return (
+        f"<a id=\"{element_id}\" href=\"javascript:__doPostBack('{target}','')\">"
+        f"{html.escape(text)}</a>"
+    )
+
+
+def _page_link(number: int, text: str) -> str:
+    return _postback_link(
+        f"ctlGrille_ctlPagination_ctlLienPage{number}", f"{PAGE_TARGET_PREFIX}{number}", text
+    )
+
+
+def _row(n: int, activity: Activity, status: ActivityStatus) -> str:
+    src, alt = STATUS_IMAGES[status]
+    prefix = f"ctlGrille$ctl{n:02d}"
+    cells = [
+        activity.domain,
+        str(activity.age_min),
+        str(activity.age_max),
+        activity.start_date,
+        activity.end_date,
+        activity.promoter,
+        str(activity.spots),
+        activity.price,
+        activity.days,
+        activity.times,
+        activity.location,
+    ]
+    return f"""<tr>
+<td><img id="{_id(prefix)}_imgStatut" src="{src}" alt="{alt}" /></td>
+<td><input type="image" name="{prefix}$ctlDates" id="{_id(prefix)}_ctlDates" src="/inscription/images/Info.png" title="Voir les dates d'inscription" /></td>
+<td>{html.escape(activity.name)}<br />{html.escape(activity.code)}</td>
+{"".join(f"<td>{html.escape(cell)}</td>" for cell in cells)}
+<td><input type="image" name="{prefix}$ctlSelecteur" id="{_id(prefix)}_ctlSelecteur" src="{src}" alt="{alt}" /></td>
+</tr>
+"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    site: RegistrationSite
+
+    def do_GET(self) -> None:
+        if not self.path.startswith(SITE_PATH.split("?")[0]):
+            self._send(Response("", status=404), None)
+            return
+        session_id, session = self.site.session(self._session_id())
+        self._send(self.site.get(session), session_id)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = self.rfile.read(length).decode()
+        form = {k: v[-1] for k, v in parse_qs(payload, keep_blank_values=True).items()}
+        session_id, session = self.site.session(self._session_id())
+        self._send(self.site.post(session, form), session_id)
+
+    def _session_id(self) -> str | None:
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    def _send(self, response: Response, session_id: str | None) -> None:
+        body = response.body.encode()
+        self.send_response(response.status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if session_id is not None and session_id != self._session_id():
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={session_id}; path=/; HttpOnly")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+@contextmanager
+def serve(site: RegistrationSite, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve ``site`` from a background thread; yields the registration URL."""
+    handler = type("SiteHandler", (_Handler,), {"site": site})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, name="simulator", daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}{SITE_PATH}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def demo_catalog(
+    size: int = 200, target: str = "Parent-bébé", target_index: int = 0
+) -> list[Activity]:
+    """``size`` plausible activities; the one at ``target_index`` is named ``target``."""
+    names = ["Natation niveau 1", "Aquaforme", "Yoga doux", "Patinage libre", "Karaté débutant"]
+    domains = [
+        "Activités aquatiques (Vieux-Longueuil)",
+        "Sports (Saint-Hubert)",
+        "Arts et culture (Greenfield Park)",
+    ]
+    days = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
+    statuses = [ActivityStatus.AVAILABLE] * 6 + [ActivityStatus.FULL, ActivityStatus.CANCELLED]
+    activities = []
+    for i in range(size):
+        hour = 8 + i % 12
+        activities.append(
+            Activity(
+                name=target if i == target_index else names[i % len(names)],
+                code=f"SIM-{i:04d}",
+                domain=domains[0] if i == target_index else domains[i % len(domains)],
+                age_min=i % 6,
+                age_max=(i % 6) + 10,
+                start_date=f"{i % 28 + 1} janvier 2026",
+                end_date=f"{i % 28 + 1} mars 2026",
+                promoter="Ville de Longueuil",
+                spots=10 + i % 5,
+                price=f"{40 + i % 30},00 $",
+                days=days[i % len(days)],
+                times=f"{hour} h 00 à {hour} h 45",
+                location="Piscine Olympique" if i % 2 else "Centre communautaire",
+                status=ActivityStatus.AVAILABLE
+                if i == target_index
+                else statuses[i % len(statuses)],
+            )
+        )
+    return activities
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+from playwright.async_api import APIRequestContext
+
+from .browse import Activity, ActivityScraper, DomainNotFoundError
+from .catalog import ActivityCatalog
+from .config import Settings
+from .query import RESOLVE_MIN_SCORE, SearchIndex
+from .schedule import parse_site_datetime
+
+logger = logging.getLogger(__name__)
+
+# Catalog rows and cached dates older than this are looked up again for --at auto.
+OPENING_MAX_AGE = timedelta(hours=6)
+
+
+@dataclass
+class ServerClock:
+    """Offset between the local clock and the server's, estimated from ``Date`` headers.
+
+    ``Date`` only has one-second resolution, so each response bounds the offset
+    to an interval. Intersecting samples taken at different sub-second phases
+    narrows it down.
+    """
+
+    lower: float = -math.inf
+    upper: float = math.inf
+    samples: int = 0
+
+    def add_sample(self, date_header: str, sent: float, received: float) -> None:
+        server = parsedate_to_datetime(date_header).timestamp()
+        # The server read [server, server + 1) at some local time in [sent, received].
+        lower = server - received
+        upper = server + 1 - sent
+
+        if lower > self.upper or upper < self.lower:
+            logger.debug("Clock sample disagrees with previous ones, restarting estimate")
+            self.lower, self.upper, self.samples = lower, upper, 0
+        else:
+            self.lower = max(self.lower, lower)
+            self.upper = min(self.upper, upper)
+        self.samples += 1
+
+    @property
+    def offset(self) -> float:
+        if not self.samples:
+            return 0.0
+        return (self.lower + self.upper) / 2
+
+    @property
+    def uncertainty(self) -> float:
+        if not self.samples:
+            return math.inf
+        return (self.upper - self.lower) / 2
+
+    def now(self) -> float:
+        """Current server time as a Unix timestamp."""
+        return time.time() + self.offset
+
+
+async def sync_server_clock(request: APIRequestContext, url: str, samples: int = 5) -> ServerClock:
+    clock = ServerClock()
+    for i in range(samples):
+        sent = time.time()
+        response = await request.head(url)
+        received = time.time()
+
+        date_header = response.headers.get("date")
+        if date_header:
+            clock.add_sample(date_header, sent, received)
+
+        if i < samples - 1:
+            # Shift each sample to a different sub-second phase of the server clock.
+            await asyncio.sleep(1 + 1 / samples)
+
+    logger.info(
+        f"Server clock offset: {clock.offset * 1000:+.0f} ms (±{clock.uncertainty * 1000:.0f} ms)"
+    )
+    return clock
+
+
+async def sleep_until(clock: ServerClock, target: float) -> None:
+    """Sleep until the server clock reaches ``target``."""
+    while (remaining := target - clock.now()) > 0:
+        await asyncio.sleep(min(remaining, 60))
+
+
+def find_target(activities: list[Activity], activity_name: str) -> Activity | None:
+    return SearchIndex(activities).best(activity_name, min_score=RESOLVE_MIN_SCORE)
+
+
+def resolve_target_names(settings: Settings, catalog: ActivityCatalog) -> list[tuple[str, str]]:
+    """Respell configured activity names the way the catalog does, before the race.
+
+    The results page is searched by case-insensitive substring, so a name with
+    missing accents or a typo would never match. Names that already match a
+    catalog activity are left alone. Returns the (old, new) names changed.
+    """
+    indexes: dict[str, SearchIndex | None] = {}
+
+    def respell(name: str, domain: str) -> str | None:
+        if domain not in indexes:
+            activities = catalog.load(domain)
+            indexes[domain] = SearchIndex(activities) if activities else None
+        index = indexes[domain]
+        if index is None:
+            return None
+        if any(name.lower() in a.name.lower() for a in index.activities):
+            return None
+        return index.spelling(name)
+
+    renamed: list[tuple[str, str]] = []
+    if settings.targets:
+        for target in settings.targets:
+            spelling = respell(target.activity_name, target.domain or settings.domain)
+            if spelling and spelling != target.activity_name:
+                renamed.append((target.activity_name, spelling))
+                target.activity_name = spelling
+    else:
+        spelling = respell(settings.activity_name, settings.domain)
+        if spelling and spelling != settings.activity_name:
+            renamed.append((settings.activity_name, spelling))
+            settings.activity_name = spelling
+    return renamed
+
+
+async def lookup_opening(settings: Settings, catalog: ActivityCatalog) -> datetime | None:
+    """Find when online resident registration opens for the best-priority target.
+
+    Uses the catalog when it knows the activity and its dates, both no older
+    than ``OPENING_MAX_AGE``. Otherwise, or when the activity has left its
+    catalogued page, scrapes the configured domain and fetches the target's
+    dates popup.
+    """
+    best = settings.resolved_targets()[0]
+    scraper = ActivityScraper(
+        domain=best.domain,
+        headless=True,
+        registration_url=settings.registration_url,
+        backend=settings.backend,
+        dates_cache=catalog.dates_cache(ttl=OPENING_MAX_AGE.total_seconds()),
+    )
+
+    target = find_target(
+        catalog.load(best.domain, max_age=OPENING_MAX_AGE) or [], best.activity_name
+    )
+    if target is not None:
+        await scraper.fetch_registration_dates([target])
+    if target is None or target.registration_dates is None:
+        logger.info("Looking up the activity's registration dates...")
+        activities: list[Activity] = []
+        complete = True
+        try:
+            async for activity in scraper.stream():
+                activities.append(activity)
+        except DomainNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Scraping failed: {e}")
+            complete = False
+        catalog.save(activities, best.domain, complete=complete)
+        target = find_target(activities, best.activity_name)
+        if target is not None:
+            await scraper.fetch_registration_dates([target])
+
+    catalog.save_dates(scraper.dates_cache)
+    if target is None or target.registration_dates is None:
+        return None
+    return parse_site_datetime(target.registration_dates.resident_start)
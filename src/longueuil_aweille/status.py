@@ -1,10 +1,12 @@
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator
 from enum import Enum
-from typing import TypeVar
 
 from playwright.async_api import Page
 
+from .waits import WaitStrategy
+from .webforms import pager_link_numbers
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_REGISTRATION_URL = (
@@ -48,34 +50,120 @@ def get_status_from_image_src(src: str, alt: str = "") -> ActivityStatus:
     return ActivityStatus.AVAILABLE
 
 
-T = TypeVar("T")
-
-PageCallback = Callable[[Page], Awaitable[T | None]]
-
-
-async def iterate_pagination(
-    page: Page,
-    callback: PageCallback[T],
-    pagination_selector: str = "a[id*='ctlLienPage']",
-) -> T | None:
-    result = await callback(page)
-    if result is not None:
-        return result
+def get_registration_status(src: str, alt: str, row_text: str) -> RegistrationStatus | None:
+    """Classify a target row from its select button and text; ``None`` means selectable."""
+    status = get_status_from_image_src(src, alt)
+    if status == ActivityStatus.NEVER_AVAILABLE:
+        return RegistrationStatus.REGISTRATION_NEVER_AVAILABLE
 
-    page_links = page.locator(pagination_selector)
-    num_pages = await page_links.count()
+    row_upper = row_text.upper()
+    if "COMPLET" in row_upper:
+        return RegistrationStatus.ACTIVITY_FULL
+    if "ANNULÉE" in row_upper:
+        return RegistrationStatus.ACTIVITY_CANCELLED
 
-    for i in range(num_pages):
-        page_links = page.locator(pagination_selector)
-        if i >= await page_links.count():
-            break
-
-        await page_links.nth(i).click()
-        await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(2000)
+    if status in (ActivityStatus.NOT_YET, ActivityStatus.FULL):
+        return RegistrationStatus.FAILED
+    return None
 
-        result = await callback(page)
-        if result is not None:
-            return result
 
-    return None
+PAGINATION_SELECTOR = "a[id*='ctlLienPage']"
+
+
+class Paginator:
+    """Navigate the results pager of a search, one postback per click.
+
+    The ASP.NET pager only links a window or block of page numbers, so pages
+    outside it are reached by clicking the visible number closest to the
+    target until the target itself is linked. A "..." link counts as the page
+    it leads to, just past the block. The page on screen after the search is
+    page 1.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        selector: str = PAGINATION_SELECTOR,
+        waits: WaitStrategy | None = None,
+        current: int = 1,
+        max_steps: int = 50,
+    ):
+        self.page = page
+        self.selector = selector
+        self.waits = waits or WaitStrategy()
+        self.current = current
+        self.max_steps = max_steps
+        self.page_count: int | None = None
+        self._stopped = False
+
+    async def discover(self) -> int:
+        """Find the total page count, walking the pager window to its end if needed."""
+        if self.page_count is not None:
+            return self.page_count
+
+        for _ in range(self.max_steps):
+            visible = await self._visible_numbers()
+            last = max([self.current, *visible])
+            if last == self.current:
+                break
+            await self._click(last)
+        else:
+            logger.warning("Gave up walking the pager; page count may be incomplete")
+
+        self.page_count = max([self.current, *await self._visible_numbers()])
+        logger.info(f"Results have {self.page_count} page(s)")
+        return self.page_count
+
+    async def goto(self, number: int) -> bool:
+        """Show page ``number``; returns whether it could be reached."""
+        for _ in range(self.max_steps):
+            if self.current == number:
+                return True
+            visible = await self._visible_numbers()
+            if not visible:
+                return False
+            step = min(visible, key=lambda n: abs(n - number))
+            if abs(step - number) >= abs(self.current - number):
+                return False
+            await self._click(step)
+        return self.current == number
+
+    async def pages(self, start: int | None = None) -> AsyncIterator[int]:
+        """Yield each page number once it is shown, from ``start`` (default: current) on.
+
+        Iteration ends after the last page or when ``stop()`` is called; call
+        ``resume()`` to continue after the last page yielded.
+        """
+        self._stopped = False
+        number = self.current if start is None else start
+        while not self._stopped:
+            if not await self.goto(number):
+                logger.warning(f"Could not reach results page {number}")
+                return
+            yield number
+            if self.page_count is not None and number >= self.page_count:
+                return
+            if self.page_count is None and number + 1 not in await self._visible_numbers():
+                return
+            number += 1
+
+    def __aiter__(self) -> AsyncIterator[int]:
+        return self.pages()
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def resume(self) -> AsyncIterator[int]:
+        return self.pages(self.current + 1)
+
+    async def _link_numbers(self) -> list[int | None]:
+        texts = await self.page.locator(self.selector).all_inner_texts()
+        return pager_link_numbers(texts, self.current)
+
+    async def _visible_numbers(self) -> list[int]:
+        return [n for n in await self._link_numbers() if n is not None]
+
+    async def _click(self, number: int) -> None:
+        link = self.page.locator(self.selector).nth((await self._link_numbers()).index(number))
+        await self.waits.for_replaced(self.page, link.click, "pagination")
+        self.current = number
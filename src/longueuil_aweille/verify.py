@@ -1,8 +1,15 @@
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
 
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Browser, Page, async_playwright
+
+from .browser import new_context, open_browser
+from .config import Participant
+from .network import NetworkMonitor
+from .waits import WaitStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +34,21 @@ DEFAULT_VERIFY_SELECTORS = VerifySelectors(
 )
 
 
+INVALID_INDICATORS = [
+    "n'est pas valide",
+    "pas valide",
+    "invalide",
+    "non trouvé",
+    "erreur",
+]
+
+VALID_INDICATORS = [
+    "Voici les informations",
+    "En règle",
+    "Statut du dossier",
+]
+
+
 class VerificationBot:
     def __init__(
         self,
@@ -35,39 +57,48 @@ class VerificationBot:
         headless: bool = False,
         timeout: int = 30,
         selectors: VerifySelectors = DEFAULT_VERIFY_SELECTORS,
+        waits: WaitStrategy | None = None,
+        network: NetworkMonitor | None = None,
     ):
         self.carte_acces = carte_acces
         self.telephone = telephone
         self.headless = headless
         self.timeout = timeout
         self.selectors = selectors
+        self.waits = waits or WaitStrategy()
+        self.network = network or NetworkMonitor()
         self.verification_url = "https://validationcarteacces.longueuil.quebec/"
 
     async def run(self) -> VerificationStatus:
         logger.info("Starting credential verification")
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.headless)
-            context = await browser.new_context()
-            page = await context.new_page()
+        async with async_playwright() as pw, open_browser(pw, headless=self.headless) as browser:
+            return await self.run_in(browser)
 
-            try:
-                status = await self._verify(page)
-                return status
-            except Exception as e:
-                logger.error(f"Verification failed: {e}")
-                return VerificationStatus.ERROR
-            finally:
-                await browser.close()
+    async def run_in(self, browser: Browser) -> VerificationStatus:
+        """Verify in a fresh context of an already running browser."""
+        context = await new_context(browser, self.network)
+        try:
+            page = await context.new_page()
+            return await self._verify(page)
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return VerificationStatus.ERROR
+        finally:
+            await context.close()
 
     async def _verify(self, page: Page) -> VerificationStatus:
         logger.info("Opening verification page")
-        await page.goto(self.verification_url, wait_until="networkidle")
+        await page.goto(self.verification_url, wait_until="domcontentloaded")
 
         await self._fill_form(page)
 
         logger.info("Submitting form")
-        await page.locator(self.selectors.submit_button).first.click()
-        await page.wait_for_load_state("networkidle")
+        await self.waits.for_replaced(
+            page, page.locator(self.selectors.submit_button).first.click, "submit", "body"
+        )
+        await self.waits.for_text(
+            page, INVALID_INDICATORS + VALID_INDICATORS, "outcome", ignore_case=True
+        )
 
         return await self._check_result(page)
 
@@ -86,29 +117,48 @@ class VerificationBot:
     async def _check_result(self, page: Page) -> VerificationStatus:
         page_content = await page.locator("body").inner_text()
 
-        invalid_indicators = [
-            "n'est pas valide",
-            "pas valide",
-            "invalide",
-            "non trouvé",
-            "erreur",
-        ]
-
-        for indicator in invalid_indicators:
+        for indicator in INVALID_INDICATORS:
             if indicator in page_content.lower():
                 logger.info("Account verification: INVALID")
                 return VerificationStatus.INVALID
 
-        valid_indicators = [
-            "Voici les informations",
-            "En règle",
-            "Statut du dossier",
-        ]
-
-        for indicator in valid_indicators:
+        for indicator in VALID_INDICATORS:
             if indicator in page_content:
                 logger.info("Account verification: VALID")
                 return VerificationStatus.VALID
 
         logger.warning("Could not determine verification status from page content")
         return VerificationStatus.ERROR
+
+
+@dataclass
+class ParticipantVerification:
+    participant: Participant
+    status: VerificationStatus
+    elapsed: float
+
+
+async def verify_participants_in(
+    browser: Browser,
+    participants: list[Participant],
+    concurrency: int = 4,
+    waits: WaitStrategy | None = None,
+    network: NetworkMonitor | None = None,
+) -> list[ParticipantVerification]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def verify_one(participant: Participant) -> ParticipantVerification:
+        async with semaphore:
+            start = time.perf_counter()
+            bot = VerificationBot(
+                carte_acces=participant.carte_acces,
+                telephone=participant.telephone,
+                waits=waits,
+                network=network,
+            )
+            status = await bot.run_in(browser)
+            elapsed = time.perf_counter() - start
+            logger.info(f"Verified {participant.name} in {elapsed:.1f}s: {status.value}")
+            return ParticipantVerification(participant, status, elapsed)
+
+    return list(await asyncio.gather(*(verify_one(p) for p in participants)))
@@ -0,0 +1,197 @@
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Locator, Page
+
+logger = logging.getLogger(__name__)
+
+STALE_ATTRIBUTE = "data-aweille-stale"
+RESULTS_GRID_SELECTOR = "[id*='ctlGrille']"
+
+DEFAULT_STEP_TIMEOUTS: dict[str, int] = {
+    "navigate": 30000,
+    "tab": 5000,
+    "option": 3000,
+    "search": 30000,
+    "pagination": 30000,
+    "reload": 30000,
+    "popup": 5000,
+    "popup_close": 3000,
+    "select": 10000,
+    "cart": 30000,
+    "submit": 30000,
+    "outcome": 10000,
+    "unregister": 5000,
+}
+
+# Fixed sleeps (in ms) each step used before, reported next to the measured waits.
+LEGACY_SLEEPS: dict[str, int] = {
+    "tab": 1000,
+    "option": 500,
+    "search": 3000,
+    "pagination": 2000,
+    "reload": 2000,
+    "popup": 500,
+    "popup_close": 300,
+    "select": 500,
+    "submit": 2000,
+    "unregister": 300,
+}
+
+
+@dataclass
+class StepTiming:
+    step: str
+    elapsed_ms: float
+    met: bool
+
+
+@dataclass
+class StepSummary:
+    step: str
+    count: int
+    avg_ms: float
+    max_ms: float
+    timeouts: int
+    legacy_ms: int | None
+
+
+@dataclass
+class WaitStrategy:
+    """Wait on concrete page conditions instead of fixed sleeps.
+
+    Every wait is bounded by a per-step timeout. A wait that times out is logged
+    and the caller carries on, as it would have after the old fixed sleep.
+    """
+
+    timeouts: dict[str, int] = field(default_factory=dict)
+    profile: bool = False
+    timings: list[StepTiming] = field(default_factory=list)
+
+    def timeout(self, step: str) -> int:
+        return self.timeouts.get(step, DEFAULT_STEP_TIMEOUTS.get(step, 10000))
+
+    async def for_visible(self, locator: Locator, step: str) -> bool:
+        return await self._timed(
+            step, lambda: locator.first.wait_for(state="visible", timeout=self.timeout(step))
+        )
+
+    async def for_hidden(self, locator: Locator, step: str) -> bool:
+        return await self._timed(
+            step, lambda: locator.first.wait_for(state="hidden", timeout=self.timeout(step))
+        )
+
+    async def for_checked(self, locator: Locator, step: str) -> bool:
+        async def wait() -> None:
+            handle = await locator.first.element_handle(timeout=self.timeout(step))
+            await locator.page.wait_for_function(
+                "el => el.checked", arg=handle, timeout=self.timeout(step)
+            )
+
+        return await self._timed(step, wait)
+
+    async def for_text(
+        self, page: Page, texts: list[str], step: str, ignore_case: bool = False
+    ) -> bool:
+        """Wait until the page body mentions any of ``texts``."""
+        return await self._timed(
+            step,
+            lambda: page.wait_for_function(
+                """([texts, ignoreCase]) => {
+                    let body = document.body ? document.body.innerText : "";
+                    if (ignoreCase) body = body.toLowerCase();
+                    return texts.some(text => body.includes(ignoreCase ? text.toLowerCase() : text));
+                }""",
+                arg=[texts, ignore_case],
+                timeout=self.timeout(step),
+            ),
+        )
+
+    async def for_replaced(
+        self,
+        page: Page,
+        action: Callable[[], Awaitable[object]],
+        step: str,
+        selector: str = RESULTS_GRID_SELECTOR,
+    ) -> bool:
+        """Run ``action`` and wait until the elements matching ``selector`` are re-rendered.
+
+        Existing matches are tagged first, so both full postbacks and partial
+        (UpdatePanel) refreshes are detected by the appearance of an untagged match.
+        """
+        await page.evaluate(
+            "([sel, attr]) => document.querySelectorAll(sel).forEach(el => el.setAttribute(attr, ''))",
+            [selector, STALE_ATTRIBUTE],
+        )
+        start = time.perf_counter()
+        await action()
+        return await self._timed(
+            step,
+            lambda: page.wait_for_selector(
+                f"{selector}:not([{STALE_ATTRIBUTE}])",
+                state="attached",
+                timeout=self.timeout(step),
+            ),
+            start=start,
+        )
+
+    async def for_postback(
+        self, page: Page, action: Callable[[], Awaitable[object]], step: str
+    ) -> bool:
+        """Run ``action`` and wait for the POST response it triggers."""
+        start = time.perf_counter()
+        try:
+            async with page.expect_response(
+                lambda r: r.request.method == "POST", timeout=self.timeout(step)
+            ):
+                await action()
+        except PlaywrightError as e:
+            self._record(step, start, met=False, reason=e)
+            return False
+        self._record(step, start, met=True)
+        return True
+
+    async def _timed(
+        self,
+        step: str,
+        wait: Callable[[], Awaitable[object]],
+        start: float | None = None,
+    ) -> bool:
+        start = time.perf_counter() if start is None else start
+        try:
+            await wait()
+        except PlaywrightError as e:
+            # Timeouts, or the page navigating away mid-wait: carry on either way.
+            self._record(step, start, met=False, reason=e)
+            return False
+        self._record(step, start, met=True)
+        return True
+
+    def _record(self, step: str, start: float, met: bool, reason: Exception | None = None) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.timings.append(StepTiming(step=step, elapsed_ms=elapsed_ms, met=met))
+        if not met:
+            logger.debug(f"Wait for '{step}' gave up after {elapsed_ms:.0f} ms: {reason}")
+        elif self.profile:
+            legacy = LEGACY_SLEEPS.get(step)
+            was = f" (fixed sleep was {legacy} ms)" if legacy else ""
+            logger.info(f"Wait for '{step}' took {elapsed_ms:.0f} ms{was}")
+
+    def summary(self) -> list[StepSummary]:
+        steps: dict[str, list[StepTiming]] = {}
+        for timing in self.timings:
+            steps.setdefault(timing.step, []).append(timing)
+        return [
+            StepSummary(
+                step=step,
+                count=len(timings),
+                avg_ms=sum(t.elapsed_ms for t in timings) / len(timings),
+                max_ms=max(t.elapsed_ms for t in timings),
+                timeouts=sum(1 for t in timings if not t.met),
+                legacy_ms=LEGACY_SLEEPS.get(step),
+            )
+            for step, timings in steps.items()
+        ]
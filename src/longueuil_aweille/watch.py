@@ -0,0 +1,189 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from enum import Enum
+
+from .browse import (
+    Activity,
+    ActivityScraper,
+    DomainNotFoundError,
+    ResultsPage,
+    RowData,
+    activity_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Where a row sits and how to open its popup are not changes worth reporting.
+WATCHED_FIELDS = (
+    "name",
+    "domain",
+    "age_min",
+    "age_max",
+    "start_date",
+    "end_date",
+    "promoter",
+    "spots",
+    "price",
+    "days",
+    "times",
+    "location",
+    "status",
+)
+
+
+class ChangeKind(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@dataclass
+class ActivityChange:
+    kind: ChangeKind
+    activity: Activity
+    # field -> (before, after), for CHANGED only.
+    fields: dict[str, tuple[object, object]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, object]:
+        data: dict[str, object] = {
+            "kind": self.kind.value,
+            "key": activity_key(self.activity),
+            "name": self.activity.name,
+        }
+        if self.fields:
+            data["fields"] = {
+                name: [plain_value(before), plain_value(after)]
+                for name, (before, after) in self.fields.items()
+            }
+        return data
+
+
+@dataclass
+class ScanStats:
+    pages: int = 0
+    pages_unchanged: int = 0
+    rows: int = 0
+    rows_parsed: int = 0
+    complete: bool = False
+
+
+def row_hash(data: RowData) -> str:
+    """Fingerprint a raw results row; its position on the page is left out."""
+    payload = json.dumps(
+        [data["cells"], data["status_src"], data["status_alt"], data["dates_button"]],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def page_hash(row_hashes: list[str]) -> str:
+    return hashlib.sha1("".join(row_hashes).encode()).hexdigest()
+
+
+def diff_activities(
+    before: dict[str, Activity], after: dict[str, Activity]
+) -> list[ActivityChange]:
+    changes: list[ActivityChange] = []
+    for key, activity in after.items():
+        previous = before.get(key)
+        if previous is None:
+            changes.append(ActivityChange(ChangeKind.ADDED, activity))
+            continue
+        fields = {
+            name: (getattr(previous, name), getattr(activity, name))
+            for name in WATCHED_FIELDS
+            if getattr(previous, name) != getattr(activity, name)
+        }
+        if fields:
+            changes.append(ActivityChange(ChangeKind.CHANGED, activity, fields))
+    changes.extend(
+        ActivityChange(ChangeKind.REMOVED, activity)
+        for key, activity in before.items()
+        if key not in after
+    )
+    return changes
+
+
+def plain_value(value: object) -> object:
+    return value.value if isinstance(value, Enum) else value
+
+
+class CatalogWatcher:
+    """Rescan the results and report what changed since the previous scan.
+
+    Every row is fingerprinted from its raw cells before parsing. A page whose
+    rows all hash the same as last time reuses last scan's activities as is,
+    and on other pages only rows with a new fingerprint are parsed again.
+    """
+
+    def __init__(self, scraper: ActivityScraper):
+        self.scraper = scraper
+        self.activities: dict[str, Activity] = {}
+        self.stats = ScanStats()
+        self._pages: dict[int, tuple[str, list[Activity]]] = {}
+        self._rows: dict[str, Activity | None] = {}
+
+    async def scan(self) -> list[ActivityChange]:
+        """Rescan every page; the first scan only records a baseline."""
+        self.stats = ScanStats()
+        rows: dict[str, Activity | None] = {}
+        pages: dict[int, tuple[str, list[Activity]]] = {}
+        current: dict[str, Activity] = {}
+
+        try:
+            async for results in self.scraper.stream_pages():
+                hashes = [row_hash(data) for data in results.rows]
+                digest = page_hash(hashes)
+                self.stats.pages += 1
+                self.stats.rows += len(hashes)
+
+                previous = self._pages.get(results.number)
+                if previous is not None and previous[0] == digest:
+                    self.stats.pages_unchanged += 1
+                    activities = previous[1]
+                    rows.update((h, self._rows.get(h)) for h in hashes)
+                else:
+                    activities = self._parse_changed(results, hashes, rows)
+
+                pages[results.number] = (digest, activities)
+                for activity in activities:
+                    current.setdefault(activity_key(activity), activity)
+        except DomainNotFoundError:
+            raise
+        except Exception as e:
+            # A partial scan would otherwise report the activities it missed as removed.
+            logger.warning(f"Scan failed, keeping the previous state: {e}")
+            return []
+
+        if not pages:
+            logger.warning("Scan returned no results pages; keeping the previous state")
+            return []
+
+        baseline = not self._pages
+        changes = [] if baseline else diff_activities(self.activities, current)
+        self.activities, self._pages, self._rows = current, pages, rows
+        self.stats.complete = True
+        logger.info(
+            f"Scanned {self.stats.pages} page(s), {self.stats.pages_unchanged} unchanged; "
+            f"parsed {self.stats.rows_parsed}/{self.stats.rows} rows; {len(changes)} change(s)"
+        )
+        return changes
+
+    def _parse_changed(
+        self, results: ResultsPage, hashes: list[str], rows: dict[str, Activity | None]
+    ) -> list[Activity]:
+        activities: list[Activity] = []
+        for data, digest in zip(results.rows, hashes, strict=True):
+            if digest in self._rows:
+                activity = self._rows[digest]
+                if activity is not None and activity.page_number != results.number:
+                    activity = replace(activity, page_number=results.number)
+            else:
+                self.stats.rows_parsed += 1
+                activity = self.scraper._parse_row(data, results.url, results.number)
+            rows[digest] = activity
+            if activity is not None:
+                activities.append(activity)
+        return activities
@@ -0,0 +1,446 @@
+import logging
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from types import TracebackType
+from typing import Self
+from urllib.parse import urljoin
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+BLOCK_TAGS = frozenset(
+    {
+        "div",
+        "p",
+        "table",
+        "tbody",
+        "thead",
+        "tfoot",
+        "tr",
+        "ul",
+        "ol",
+        "li",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "form",
+        "fieldset",
+    }
+)
+SKIPPED_TEXT_TAGS = frozenset({"script", "style", "noscript"})
+
+# Links to the next or previous block of a block pager.
+PAGER_ELLIPSES = frozenset({"...", "…"})
+POSTBACK_RE = re.compile(r"__doPostBack\(\s*'([^']*)'\s*,\s*'([^']*)'\s*\)")
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+
+@dataclass(eq=False)
+class Element:
+    tag: str
+    attrs: dict[str, str] = field(default_factory=dict)
+    children: list["Element | str"] = field(default_factory=list)
+    parent: "Element | None" = None
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.attrs.get(name, default)
+
+    def iter(self) -> Iterator["Element"]:
+        yield self
+        for child in self.children:
+            if isinstance(child, Element):
+                yield from child.iter()
+
+    def walk(self) -> Iterator["Element | str"]:
+        """Yield elements and text nodes in document order."""
+        yield self
+        for child in self.children:
+            if isinstance(child, Element):
+                yield from child.walk()
+            else:
+                yield child
+
+    def find_all(self, tag: str) -> list["Element"]:
+        return [el for el in self.iter() if el.tag == tag and el is not self]
+
+    def find_by_id(self, element_id: str) -> "Element | None":
+        return next((el for el in self.iter() if el.attrs.get("id") == element_id), None)
+
+    def inner_text(self) -> str:
+        """Approximate the browser's innerText: collapse whitespace, break on blocks."""
+        parts: list[str] = []
+        self._collect_text(parts)
+        lines = (line.strip() for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts: list[str]) -> None:
+        if self.tag in SKIPPED_TEXT_TAGS:
+            return
+        if self.tag == "br":
+            parts.append("\n")
+            return
+        block = self.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, Element):
+                child._collect_text(parts)
+            else:
+                parts.append(re.sub(r"\s+", " ", child))
+        if block:
+            parts.append("\n")
+        elif self.tag in ("td", "th"):
+            parts.append("\t")
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document")
+        self.stack: list[Element] = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        parent = self.stack[-1]
+        element = Element(tag, {k: v if v is not None else "" for k, v in attrs}, parent=parent)
+        parent.children.append(element)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.stack[-1].tag == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self.stack[-1].children.append(data)
+
+    def _close_implied(self, tag: str) -> None:
+        if tag in ("td", "th"):
+            self._pop_until({"td", "th"}, stop={"tr", "table"})
+        elif tag == "tr":
+            self._pop_until({"tr"}, stop={"table"})
+        elif tag == "option":
+            self._pop_until({"option"}, stop={"select"})
+        elif tag == "li":
+            self._pop_until({"li"}, stop={"ul", "ol"})
+
+    def _pop_until(self, tags: set[str], stop: set[str]) -> None:
+        for i in range(len(self.stack) - 1, 0, -1):
+            current = self.stack[i].tag
+            if current in stop:
+                return
+            if current in tags:
+                del self.stack[i:]
+                return
+
+
+def parse_html(html: str) -> Element:
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def parse_postback(href: str) -> tuple[str, str] | None:
+    match = POSTBACK_RE.search(href)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def find_checkbox_for_text(root: Element, text: str) -> Element | None:
+    """Return the last checkbox preceding the first text node containing ``text``."""
+    last_checkbox: Element | None = None
+    for node in root.walk():
+        if isinstance(node, Element):
+            if node.tag == "input" and node.get("type").lower() == "checkbox":
+                last_checkbox = node
+        elif text in node:
+            return last_checkbox
+    return None
+
+
+def checkbox_labels(root: Element) -> list[str]:
+    labels: list[str] = []
+    for checkbox in root.find_all("input"):
+        if checkbox.get("type").lower() != "checkbox" or checkbox.parent is None:
+            continue
+        text = checkbox.parent.inner_text().strip()
+        if text and 5 < len(text) < 100:
+            labels.append(text)
+    return labels
+
+
+def pager_link_numbers(texts: list[str], current: int) -> list[int | None]:
+    """Resolve pager link texts to the page each one leads to, ``None`` for other links.
+
+    A block pager links one block of page numbers at a time, with a "..."
+    link before it to the last page of the previous block and one after it
+    to the first page of the next block.
+    """
+    stripped = [text.strip() for text in texts]
+    numbers = [current, *(int(text) for text in stripped if text.isdigit())]
+    numbers_seen = False
+    resolved: list[int | None] = []
+    for text in stripped:
+        if text.isdigit():
+            numbers_seen = True
+            resolved.append(int(text))
+        elif text in PAGER_ELLIPSES and numbers_seen:
+            resolved.append(max(numbers) + 1)
+        elif text in PAGER_ELLIPSES and min(numbers) > 1:
+            resolved.append(min(numbers) - 1)
+        else:
+            resolved.append(None)
+    return resolved
+
+
+def pagination_targets(
+    root: Element, link_id_fragment: str = "ctlLienPage", current: int = 1
+) -> dict[int, tuple[str, str]]:
+    """Map the pages the pager links to, ``current`` being shown, to their postback."""
+    links = [link for link in root.find_all("a") if link_id_fragment in link.get("id")]
+    numbers = pager_link_numbers([link.inner_text() for link in links], current)
+    targets: dict[int, tuple[str, str]] = {}
+    for link, number in zip(links, numbers, strict=True):
+        postback = parse_postback(link.get("href"))
+        if number is not None and postback is not None:
+            targets[number] = postback
+    return targets
+
+
+@dataclass
+class WebForm:
+    action: str
+    fields: dict[str, str]
+
+    @classmethod
+    def from_document(cls, root: Element, base_url: str) -> "WebForm":
+        forms = root.find_all("form")
+        form = forms[0] if forms else root
+        action = urljoin(base_url, form.get("action") or base_url)
+        return cls(action=action, fields=_successful_controls(form))
+
+    def trigger(self, element: Element) -> dict[str, str]:
+        """Return the form data a browser would post when activating ``element``."""
+        data = dict(self.fields)
+        data["__EVENTTARGET"] = ""
+        data["__EVENTARGUMENT"] = ""
+
+        postback = parse_postback(element.get("href") or element.get("onclick"))
+        input_type = element.get("type").lower()
+        name = element.get("name")
+
+        if element.tag == "input" and input_type == "image" and name:
+            data[f"{name}.x"] = "1"
+            data[f"{name}.y"] = "1"
+        elif element.tag in ("input", "button") and input_type in ("submit", "button") and name:
+            data[name] = element.get("value")
+        elif postback is not None:
+            data["__EVENTTARGET"], data["__EVENTARGUMENT"] = postback
+        elif name:
+            data["__EVENTTARGET"] = name
+        return data
+
+    def postback(self, target: str, argument: str = "") -> dict[str, str]:
+        data = dict(self.fields)
+        data["__EVENTTARGET"] = target
+        data["__EVENTARGUMENT"] = argument
+        return data
+
+
+def _successful_controls(form: Element) -> dict[str, str]:
+    fields: dict[str, str] = {}
+    for el in form.iter():
+        name = el.get("name")
+        if not name or "disabled" in el.attrs:
+            continue
+        if el.tag == "input":
+            input_type = el.get("type", "text").lower()
+            if input_type in ("submit", "image", "button", "reset", "file"):
+                continue
+            if input_type in ("checkbox", "radio"):
+                if "checked" in el.attrs:
+                    fields[name] = el.get("value", "on")
+                continue
+            fields[name] = el.get("value")
+        elif el.tag == "select":
+            options = el.find_all("option")
+            selected = next((o for o in options if "selected" in o.attrs), None)
+            selected = selected or (options[0] if options else None)
+            if selected is not None:
+                fields[name] = selected.get("value", selected.inner_text())
+        elif el.tag == "textarea":
+            fields[name] = "".join(c for c in el.children if isinstance(c, str))
+    return fields
+
+
+class WebFormsClient:
+    """Drive the registration site with plain HTTP postbacks over a pooled client."""
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 60,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.url = url
+        self.owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+        )
+        self.document: Element | None = None
+        self.form: WebForm | None = None
+        self.page_number = 1
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self.owns_client:
+            await self.client.aclose()
+
+    async def open(self) -> Element:
+        response = await self.client.get(self.url)
+        response.raise_for_status()
+        return self._load(response)
+
+    async def post(self, data: dict[str, str]) -> Element:
+        if self.form is None:
+            await self.open()
+        assert self.form is not None
+        response = await self.client.post(self.form.action, data=data)
+        response.raise_for_status()
+        return self._load(response)
+
+    async def activate(self, element: Element, overrides: dict[str, str] | None = None) -> Element:
+        if self.form is None:
+            await self.open()
+        assert self.form is not None
+        data = self.form.trigger(element)
+        data.update(overrides or {})
+        return await self.post(data)
+
+    async def activate_by_name(self, name: str) -> Element | None:
+        if self.document is None:
+            return None
+        element = next((el for el in self.document.iter() if el.get("name") == name), None)
+        if element is None:
+            return None
+        return await self.activate(element)
+
+    async def search(
+        self,
+        search_button_id: str,
+        available_only: bool = False,
+        domain: str = "",
+        keyword: str = "",
+        keyword_input_id: str = "",
+        keyword_or_id: str = "",
+    ) -> Element:
+        """Fill the search form and post it, returning the first results page.
+
+        Raises ``LookupError`` with the available domain labels when ``domain``
+        has no matching checkbox.
+        """
+        root = self.document or await self.open()
+        assert self.form is not None
+        overrides: dict[str, str] = {}
+
+        choice = "ctlDispoSeulement" if available_only else "ctlToutes"
+        for radio in root.find_all("input"):
+            if "ctlSelDisponibilite" in radio.get("name") and radio.get("value") == choice:
+                overrides[radio.get("name")] = choice
+
+        if keyword and keyword_input_id:
+            keyword_input = root.find_by_id(keyword_input_id)
+            if keyword_input is not None:
+                overrides[keyword_input.get("name")] = keyword
+        if keyword_or_id:
+            option = root.find_by_id(keyword_or_id)
+            if option is not None:
+                overrides[option.get("name")] = option.get("value", "on")
+
+        if domain:
+            checkbox = find_checkbox_for_text(root, domain)
+            if checkbox is None:
+                raise LookupError(checkbox_labels(root))
+            overrides[checkbox.get("name")] = checkbox.get("value", "on")
+
+        button = root.find_by_id(search_button_id)
+        if button is None:
+            raise LookupError(f"Search button #{search_button_id} not found")
+
+        results = await self.activate(button, overrides)
+        self.page_number = 1
+        return results
+
+    def page_numbers(self, link_id_fragment: str = "ctlLienPage") -> list[int]:
+        if self.document is None:
+            return []
+        targets = pagination_targets(self.document, link_id_fragment, self.page_number)
+        return sorted({self.page_number, *targets})
+
+    async def goto_page(self, number: int, link_id_fragment: str = "ctlLienPage") -> Element | None:
+        if number == self.page_number and self.document is not None:
+            return self.document
+        if self.document is None or self.form is None:
+            return None
+
+        target = pagination_targets(self.document, link_id_fragment, self.page_number).get(number)
+        if target is None:
+            return None
+
+        root = await self.post(self.form.postback(*target))
+        self.page_number = number
+        return root
+
+    def _load(self, response: httpx.Response) -> Element:
+        self.url = str(response.url)
+        self.document = parse_html(response.text)
+        self.form = WebForm.from_document(self.document, self.url)
+        return self.document
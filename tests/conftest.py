@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "catalog.db"
+    monkeypatch.setenv("LONGUEUIL_CATALOG", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "daemon.json"
+    monkeypatch.setenv("LONGUEUIL_DAEMON_STATE", str(path))
+    return path
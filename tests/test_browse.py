@@ -0,0 +1,217 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from longueuil_aweille.browse import (
+    DAY_BITS,
+    Activity,
+    ActivityScraper,
+    RegistrationDates,
+    RegistrationDatesCache,
+    ResultsPage,
+    RowData,
+    merge_pages,
+    split_page_range,
+)
+from longueuil_aweille.status import ActivityStatus
+
+
+def make_row(**overrides) -> RowData:
+    cells = [
+        "",
+        "",
+        "Parent-bébé\nAQ-1234",
+        "Activités aquatiques",
+        "0",
+        "3",
+        "1 janvier 2025",
+        "31 mars 2025",
+        "Ville de Longueuil",
+        "12",
+        "45,00 $",
+        "Samedi",
+        "9 h 00 à 9 h 45",
+        "Piscine Olympique",
+    ]
+    row: RowData = {
+        "index": 0,
+        "cells": cells,
+        "status_src": "/images/Inscrire.png",
+        "status_alt": "Inscrire",
+        "dates_button": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestParseRow:
+    def test_parses_all_fields(self):
+        activity = ActivityScraper()._parse_row(make_row(), "https://example.test/page")
+
+        assert activity is not None
+        assert activity.name == "Parent-bébé"
+        assert activity.code == "AQ-1234"
+        assert activity.age_min == 0
+        assert activity.age_max == 3
+        assert activity.spots == 12
+        assert activity.location == "Piscine Olympique"
+        assert activity.status == ActivityStatus.AVAILABLE
+        assert activity.page_url == "https://example.test/page"
+
+    def test_parses_schedule_and_price(self):
+        activity = ActivityScraper()._parse_row(make_row())
+
+        assert activity is not None
+        assert activity.start_day == date(2025, 1, 1)
+        assert activity.end_day == date(2025, 3, 31)
+        assert (activity.start_minute, activity.end_minute) == (540, 585)
+        assert activity.weekdays == DAY_BITS["sat"]
+        assert activity.price_cents == 4500
+
+    def test_status_from_image(self):
+        row = make_row(status_src="/images/InscrNotNow.png", status_alt="")
+        activity = ActivityScraper()._parse_row(row)
+
+        assert activity is not None
+        assert activity.status == ActivityStatus.NOT_YET
+
+    def test_invalid_numbers_fall_back_to_defaults(self):
+        row = make_row()
+        row["cells"][4] = "n/a"
+        row["cells"][5] = ""
+        row["cells"][9] = "Complet"
+        activity = ActivityScraper()._parse_row(row)
+
+        assert activity is not None
+        assert activity.age_min == 0
+        assert activity.age_max == 150
+        assert activity.spots == 0
+
+    def test_skips_short_rows(self):
+        row = make_row(cells=["a", "b", "c"])
+        assert ActivityScraper()._parse_row(row) is None
+
+    def test_skips_rows_without_name(self):
+        row = make_row()
+        row["cells"][2] = "  "
+        assert ActivityScraper()._parse_row(row) is None
+
+
+def make_activity(name: str, code: str) -> Activity:
+    return Activity(
+        name=name,
+        code=code,
+        domain="",
+        age_min=0,
+        age_max=150,
+        start_date="",
+        end_date="",
+        promoter="",
+        spots=0,
+        price="",
+        days="",
+        times="",
+        location="",
+        status=ActivityStatus.AVAILABLE,
+    )
+
+
+class TestParallelHelpers:
+    def test_split_page_range_contiguous(self):
+        assert split_page_range(7, 3) == [[1, 2, 3], [4, 5], [6, 7]]
+
+    def test_split_page_range_more_workers_than_pages(self):
+        assert split_page_range(2, 4) == [[1], [2]]
+
+    def test_merge_pages_orders_and_deduplicates(self):
+        pages = {
+            2: [make_activity("C", "003"), make_activity("B", "002")],
+            1: [make_activity("A", "001"), make_activity("B", "002")],
+        }
+
+        merged = merge_pages(pages)
+
+        assert [a.code for a in merged] == ["001", "002", "003"]
+
+
+class PagePaginator:
+    def __init__(self, total: int):
+        self.total = total
+
+    async def discover(self) -> int:
+        return self.total
+
+    async def goto(self, number: int) -> bool:
+        return number <= self.total
+
+
+class TestParallelStream:
+    async def test_yields_pages_in_order(self):
+        scraper = ActivityScraper(workers=3)
+        scraper._navigate_and_search = AsyncMock()  # type: ignore[method-assign]
+        scraper._paginator = lambda _: PagePaginator(7)  # type: ignore[method-assign]
+
+        async def read_page(_: MagicMock, number: int) -> ResultsPage:
+            # Later pages finish first.
+            await asyncio.sleep((8 - number) / 500)
+            return ResultsPage(number, "", [make_row()])
+
+        scraper._read_page = read_page  # type: ignore[method-assign]
+        context = MagicMock()
+        context.new_page = AsyncMock()
+        context.close = AsyncMock()
+
+        with patch("longueuil_aweille.browse.new_context", AsyncMock(return_value=context)):
+            numbers = [p.number async for p in scraper._scrape_parallel(MagicMock())]
+
+        assert numbers == [1, 2, 3, 4, 5, 6, 7]
+
+    async def test_failure_stops_and_closes_every_worker(self):
+        scraper = ActivityScraper(workers=2)
+        scraper._navigate_and_search = AsyncMock()  # type: ignore[method-assign]
+        scraper._paginator = lambda _: PagePaginator(4)  # type: ignore[method-assign]
+
+        async def read_page(_: MagicMock, number: int) -> ResultsPage:
+            if number == 1:
+                raise RuntimeError("page 1 failed")
+            await asyncio.sleep(60)
+            return ResultsPage(number, "", [make_row()])
+
+        scraper._read_page = read_page  # type: ignore[method-assign]
+        context = MagicMock()
+        context.new_page = AsyncMock()
+        context.close = AsyncMock()
+
+        with (
+            patch("longueuil_aweille.browse.new_context", AsyncMock(return_value=context)),
+            pytest.raises(RuntimeError, match="page 1 failed"),
+        ):
+            async with asyncio.timeout(5):
+                _ = [p async for p in scraper._scrape_parallel(MagicMock())]
+
+        assert context.close.await_count == 2
+
+
+class TestRegistrationDatesCache:
+    def test_expired_entries_miss(self):
+        cache = RegistrationDatesCache(ttl=60)
+        cache.store("A", None, fetched_at=0)
+        cache.store("B", None)
+
+        assert cache.lookup("A") == (False, None)
+        assert cache.lookup("B") == (True, None)
+
+    async def test_fetch_uses_cache_and_skips_rows_without_popup(self):
+        dates = RegistrationDates("2025-12-01, 19:00", "2025-12-20, 23:59")
+        cache = RegistrationDatesCache()
+        cache.store("001", dates)
+        cached = make_activity("A", "001")
+        cached.dates_button = "ctlGrille$ctl01$ctlDates"
+        no_popup = make_activity("B", "002")
+
+        await ActivityScraper(dates_cache=cache).fetch_registration_dates([cached, no_popup])
+
+        assert cached.registration_dates == dates
+        assert no_popup.registration_dates is None
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from longueuil_aweille.browser import DaemonState, claim_warm_page, open_browser, running_daemon
+
+URL = "https://example.test/Page.fr.aspx?m=1"
+
+
+def fake_page(url: str, claimed: bool) -> MagicMock:
+    page = MagicMock()
+    page.url = url
+    page.evaluate = AsyncMock(return_value=not claimed)
+    return page
+
+
+class TestDaemonState:
+    def test_running_daemon(self, isolated_daemon: Path):
+        DaemonState("http://127.0.0.1:9333", os.getpid(), True, 0.0).save(isolated_daemon)
+
+        state = running_daemon()
+
+        assert state is not None
+        assert state.endpoint == "http://127.0.0.1:9333"
+
+    def test_stale_state_is_removed(self, isolated_daemon: Path):
+        # Pid numbers above the kernel's pid_max are never in use.
+        DaemonState("http://127.0.0.1:9333", 2**22 + 1, True, 0.0).save(isolated_daemon)
+
+        assert running_daemon() is None
+        assert not isolated_daemon.exists()
+
+
+class TestOpenBrowser:
+    async def test_launches_without_daemon(self):
+        pw = MagicMock()
+        pw.chromium.launch = AsyncMock()
+        pw.chromium.connect_over_cdp = AsyncMock()
+
+        async with open_browser(pw, headless=True) as browser:
+            assert browser is pw.chromium.launch.return_value
+
+        pw.chromium.connect_over_cdp.assert_not_called()
+        browser.close.assert_awaited_once()
+
+    async def test_attaches_to_daemon(self, isolated_daemon: Path):
+        DaemonState("http://127.0.0.1:9333", os.getpid(), True, 0.0).save(isolated_daemon)
+        pw = MagicMock()
+        pw.chromium.launch = AsyncMock()
+        pw.chromium.connect_over_cdp = AsyncMock()
+
+        async with open_browser(pw, headless=True) as browser:
+            assert browser is pw.chromium.connect_over_cdp.return_value
+
+        pw.chromium.connect_over_cdp.assert_awaited_once_with("http://127.0.0.1:9333")
+        pw.chromium.launch.assert_not_called()
+
+
+class TestClaimWarmPage:
+    async def test_skips_claimed_and_other_pages(self):
+        free = fake_page(URL, claimed=False)
+        context = MagicMock()
+        context.pages = [fake_page("about:blank", False), fake_page(URL, True), free]
+        browser = MagicMock()
+        browser.contexts = [context]
+
+        assert await claim_warm_page(browser, URL) is free
+
+    async def test_none_free(self):
+        context = MagicMock()
+        context.pages = [fake_page(URL, claimed=True)]
+        browser = MagicMock()
+        browser.contexts = [context]
+
+        assert await claim_warm_page(browser, URL) is None
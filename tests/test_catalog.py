@@ -0,0 +1,123 @@
+from datetime import timedelta
+from pathlib import Path
+
+from longueuil_aweille.browse import Activity, RegistrationDates, RegistrationDatesCache
+from longueuil_aweille.catalog import ActivityCatalog
+from longueuil_aweille.status import ActivityStatus
+
+
+def make_activity(code: str, spots: int = 5) -> Activity:
+    return Activity(
+        name=f"Activity {code}",
+        code=code,
+        domain="Activités aquatiques",
+        age_min=3,
+        age_max=5,
+        start_date="1 janvier 2025",
+        end_date="31 mars 2025",
+        promoter="Ville de Longueuil",
+        spots=spots,
+        price="45,00 $",
+        days="Samedi",
+        times="9 h 00",
+        location="Piscine",
+        status=ActivityStatus.AVAILABLE,
+        registration_dates=RegistrationDates("2025-12-01, 19:00", "2025-12-20, 23:59"),
+    )
+
+
+class TestActivityCatalog:
+    def test_round_trip(self, tmp_path: Path):
+        activities = [make_activity("B"), make_activity("A")]
+        dates = RegistrationDatesCache()
+        for activity in activities:
+            dates.store(activity.code, activity.registration_dates)
+
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save(activities, domain="Aqua")
+            catalog.save_dates(dates)
+            loaded = catalog.load(domain="Aqua")
+
+        assert loaded == activities
+
+    def test_dates_cache_survives_reopen(self, tmp_path: Path):
+        cache = RegistrationDatesCache()
+        cache.store("A", RegistrationDates("2025-12-01, 19:00", "2025-12-20, 23:59"))
+        cache.store("B", None)
+
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save_dates(cache)
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            reloaded = catalog.dates_cache()
+
+        assert reloaded.lookup("A") == (True, cache.entries["A"][1])
+        assert reloaded.lookup("B") == (True, None)
+        assert reloaded.lookup("C") == (False, None)
+
+    def test_scrape_without_dates_keeps_stored_dates(self, tmp_path: Path):
+        cache = RegistrationDatesCache()
+        cache.store("A", RegistrationDates("2025-12-01, 19:00", "2025-12-20, 23:59"))
+        activity = make_activity("A")
+        activity.registration_dates = None
+
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save_dates(cache)
+            catalog.save([activity])
+            loaded = catalog.load()
+
+        assert loaded is not None
+        assert loaded[0].registration_dates == cache.entries["A"][1]
+
+    def test_incremental_save(self, tmp_path: Path):
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            first = catalog.save([make_activity("A"), make_activity("B")])
+            second = catalog.save([make_activity("A"), make_activity("B", spots=0)])
+
+        assert (first.added, first.changed, first.unchanged) == (2, 0, 0)
+        assert (second.added, second.changed, second.unchanged) == (0, 1, 1)
+
+    def test_scopes_are_separate(self, tmp_path: Path):
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save([make_activity("A")], available_only=True)
+
+            loaded = catalog.load(available_only=True)
+
+            assert catalog.load() is None
+            assert loaded is not None
+            assert [a.code for a in loaded] == ["A"]
+
+    def test_stale_scope_is_not_loaded(self, tmp_path: Path):
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save([make_activity("A")])
+
+            assert catalog.load(max_age=timedelta(hours=1)) is not None
+            assert catalog.load(max_age=timedelta(seconds=-1)) is None
+
+    def test_incomplete_scrape_keeps_scope(self, tmp_path: Path):
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save([make_activity("A"), make_activity("B")])
+            age = catalog.age()
+
+            update = catalog.save([make_activity("A", spots=0)], complete=False)
+            loaded = catalog.load()
+
+            assert update.changed == 1
+            assert catalog.age() is not None and age is not None and catalog.age() >= age
+            assert loaded is not None
+            assert [(a.code, a.spots) for a in loaded] == [("A", 0), ("B", 5)]
+
+    def test_moved_rows_are_unchanged(self, tmp_path: Path):
+        first, second = make_activity("A"), make_activity("B")
+        second.page_number, second.dates_button = 1, "ctlGrille$ctl02$ctlDates"
+
+        with ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            catalog.save([first, second])
+            # A new activity at the top pushes B down a row and onto page 2.
+            moved = make_activity("B")
+            moved.page_number, moved.dates_button = 2, "ctlGrille$ctl01$ctlDates"
+            update = catalog.save([make_activity("N"), first, moved])
+            loaded = catalog.load()
+
+        assert (update.added, update.changed, update.unchanged) == (1, 0, 2)
+        assert loaded is not None
+        assert (loaded[2].page_number, loaded[2].dates_button) == (2, "ctlGrille$ctl01$ctlDates")
@@ -1,14 +1,32 @@
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from typer.testing import CliRunner
 
 from longueuil_aweille.__main__ import app
+from longueuil_aweille.config import Settings
 from longueuil_aweille.status import RegistrationStatus
-from longueuil_aweille.verify import VerificationStatus
+from longueuil_aweille.verify import ParticipantVerification, VerificationStatus
 
 runner = CliRunner()
 
+PARTICIPANTS_CONFIG = """
+activity_name = "Test Activity"
+
+[[participants]]
+name = "Parent"
+carte_acces = "01234567890123"
+telephone = "5145551234"
+age = 35
+
+[[participants]]
+name = "Kid"
+carte_acces = "01234567890124"
+telephone = "5145551234"
+age = 4
+"""
+
 
 class TestVersion:
     def test_version_flag(self):
@@ -29,6 +47,20 @@ class TestRegister:
         assert result.exit_code == 1
         assert "No participants configured" in result.stdout
 
+    def test_register_rejects_record_with_replay(self, tmp_path: Path):
+        config = tmp_path / "config.toml"
+        config.write_text(PARTICIPANTS_CONFIG)
+        har = tmp_path / "session.har"
+        har.write_text('{"log": {"entries": []}}')
+
+        result = runner.invoke(
+            app,
+            ["register", "--config", str(config), "--record", str(har), "--replay", str(har)],
+        )
+
+        assert result.exit_code == 1
+        assert "cannot be used together" in result.stdout
+
     @patch("longueuil_aweille.__main__.RegistrationBot")
     def test_register_success(self, mock_reg_bot, tmp_path: Path):
         config = tmp_path / "config.toml"
@@ -102,6 +134,26 @@ age = 30
         settings_arg = mock_reg_bot.call_args[0][0]
         assert settings_arg.timeout == 30
 
+    @patch("longueuil_aweille.__main__.RegistrationBot")
+    def test_register_reports_rejected_credentials(self, mock_reg_bot, tmp_path: Path):
+        config = tmp_path / "config.toml"
+        config.write_text(PARTICIPANTS_CONFIG)
+        first, second = Settings.from_toml(config).participants
+
+        mock_reg_instance = MagicMock()
+        mock_reg_instance.run = AsyncMock(return_value=RegistrationStatus.INVALID_CREDENTIALS)
+        mock_reg_instance.verification = [
+            ParticipantVerification(first, VerificationStatus.VALID, 1.2),
+            ParticipantVerification(second, VerificationStatus.INVALID, 1.4),
+        ]
+        mock_reg_bot.return_value = mock_reg_instance
+
+        result = runner.invoke(app, ["register", "--config", str(config)])
+
+        assert result.exit_code == 1
+        assert "Kid" in result.stdout
+        assert mock_reg_bot.call_args.kwargs["verify"] is True
+
 
 class TestVerify:
     @patch("longueuil_aweille.__main__.VerificationBot")
@@ -131,11 +183,43 @@ class TestVerify:
         assert result.exit_code != 0
 
 
+def streaming(*activities, error: Exception | None = None) -> MagicMock:
+    async def stream():
+        for activity in activities:
+            yield activity
+        if error is not None:
+            raise error
+
+    return MagicMock(side_effect=stream)
+
+
+def make_activity(name: str = "Test Activity", code: str = "ABC123", price: str = "50$"):
+    from longueuil_aweille.browse import Activity
+    from longueuil_aweille.status import ActivityStatus
+
+    return Activity(
+        name=name,
+        code=code,
+        domain="Test Domain",
+        age_min=5,
+        age_max=12,
+        start_date="1 janvier 2025",
+        end_date="31 mars 2025",
+        promoter="Test Promoter",
+        spots=10,
+        price=price,
+        days="Lundi",
+        times="18:00-19:00",
+        location="Test Location",
+        status=ActivityStatus.AVAILABLE,
+    )
+
+
 class TestBrowse:
     @patch("longueuil_aweille.__main__.ActivityScraper")
     def test_browse_no_activities(self, mock_scraper):
         mock_instance = MagicMock()
-        mock_instance.run = AsyncMock(return_value=[])
+        mock_instance.stream = streaming()
         mock_scraper.return_value = mock_instance
 
         result = runner.invoke(app, ["browse", "--headless"])
@@ -145,31 +229,9 @@ class TestBrowse:
 
     @patch("longueuil_aweille.__main__.ActivityScraper")
     def test_browse_with_activities(self, mock_scraper):
-        from longueuil_aweille.browse import Activity
-        from longueuil_aweille.status import ActivityStatus
-
         mock_instance = MagicMock()
-        mock_instance.run = AsyncMock(
-            return_value=[
-                Activity(
-                    name="Test Activity",
-                    code="ABC123",
-                    domain="Test Domain",
-                    age_min=5,
-                    age_max=12,
-                    start_date="1 janvier 2025",
-                    end_date="31 mars 2025",
-                    promoter="Test Promoter",
-                    spots=10,
-                    price="50$",
-                    days="Lundi",
-                    times="18:00-19:00",
-                    location="Test Location",
-                    status=ActivityStatus.AVAILABLE,
-                )
-            ]
-        )
-        mock_instance.filter_activities.return_value = mock_instance.run.return_value
+        mock_instance.stream = streaming(make_activity())
+        mock_instance.fetch_registration_dates = AsyncMock()
         mock_scraper.return_value = mock_instance
 
         result = runner.invoke(app, ["browse", "--headless"])
@@ -178,13 +240,100 @@ class TestBrowse:
         assert "Test Activity" in result.stdout
         assert "1 found" in result.stdout
 
+    @patch("longueuil_aweille.__main__.ActivityScraper")
+    def test_browse_ndjson_filters_while_streaming(self, mock_scraper):
+        mock_instance = MagicMock()
+        mock_instance.stream = streaming(make_activity(), make_activity("Natation", "NAT1"))
+        mock_instance.dates_cache.lookup.return_value = (False, None)
+        mock_scraper.return_value = mock_instance
+
+        result = runner.invoke(app, ["browse", "--name", "natation", "--format", "ndjson"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert len(lines) == 1
+        row = json.loads(lines[0])
+        assert row["code"] == "NAT1"
+        assert row["status"] == "available"
+        mock_instance.fetch_registration_dates.assert_not_called()
+
+    @patch("longueuil_aweille.__main__.ActivityScraper")
+    def test_browse_price_range_and_sort(self, mock_scraper):
+        mock_instance = MagicMock()
+        mock_instance.stream = streaming(
+            make_activity("Yoga", "Y1"),
+            make_activity("Natation", "NAT1", price="30,00 $"),
+            make_activity("Danse", "D1", price="Gratuit"),
+        )
+        mock_instance.dates_cache.lookup.return_value = (False, None)
+        mock_scraper.return_value = mock_instance
+
+        result = runner.invoke(
+            app, ["browse", "--max-price", "40", "--sort", "price", "--format", "ndjson"]
+        )
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [row["code"] for row in rows] == ["D1", "NAT1"]
+        assert rows[1]["price_cents"] == 3000
+        assert rows[1]["start_day"] == "2025-01-01"
+
+    def test_browse_rejects_unreadable_time(self):
+        result = runner.invoke(app, ["browse", "--after", "soon"])
+
+        assert result.exit_code == 1
+        assert "--after" in result.stdout
+
+    @patch("longueuil_aweille.__main__.ActivityScraper")
+    def test_browse_record_writes_archive(self, mock_scraper, tmp_path: Path):
+        mock_instance = MagicMock()
+        mock_instance.stream = streaming(make_activity())
+        mock_instance.fetch_registration_dates = AsyncMock()
+        mock_scraper.return_value = mock_instance
+        har = tmp_path / "browse.har"
+
+        result = runner.invoke(app, ["browse", "--record", str(har)])
+
+        assert result.exit_code == 0
+        log = json.loads(har.read_text())["log"]
+        assert log["entries"] == []
+        assert "_elapsed_s" in log
+
+    def test_browse_replay_needs_browser_backend(self, tmp_path: Path):
+        har = tmp_path / "browse.har"
+        har.write_text('{"log": {"entries": []}}')
+
+        result = runner.invoke(app, ["browse", "--replay", str(har), "--backend", "http"])
+
+        assert result.exit_code == 1
+        assert "live browser scrape" in result.stdout
+
+    @patch("longueuil_aweille.__main__.ActivityScraper")
+    def test_browse_query_ranks_accent_insensitively(self, mock_scraper):
+        mock_instance = MagicMock()
+        mock_instance.stream = streaming(
+            make_activity("Parent-bébé niveau 2", "AQ-2"),
+            make_activity("Natation", "NAT1"),
+            make_activity("Parent-bébé", "AQ-1"),
+        )
+        mock_instance.dates_cache.lookup.return_value = (False, None)
+        mock_scraper.return_value = mock_instance
+
+        result = runner.invoke(app, ["browse", "--query", "parent bebe", "--format", "ndjson"])
+
+        assert result.exit_code == 0
+        assert [json.loads(line)["code"] for line in result.stdout.splitlines()] == [
+            "AQ-1",
+            "AQ-2",
+        ]
+
     @patch("longueuil_aweille.__main__.ActivityScraper")
     def test_browse_domain_not_found(self, mock_scraper):
         from longueuil_aweille.browse import DomainNotFoundError
 
         mock_instance = MagicMock()
-        mock_instance.run = AsyncMock(
-            side_effect=DomainNotFoundError("Bad Domain", ["Domain A", "Domain B"])
+        mock_instance.stream = streaming(
+            error=DomainNotFoundError("Bad Domain", ["Domain A", "Domain B"])
         )
         mock_scraper.return_value = mock_instance
 
@@ -193,3 +342,69 @@ class TestBrowse:
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower()
         assert "Domain A" in result.stdout
+
+    @patch("longueuil_aweille.__main__.ActivityScraper")
+    def test_browse_cached_skips_scraping(self, mock_scraper, isolated_catalog: Path):
+        from longueuil_aweille.catalog import ActivityCatalog
+
+        with ActivityCatalog(isolated_catalog) as catalog:
+            catalog.save([make_activity("Cached Activity", "CACHE1")])
+
+        mock_instance = MagicMock()
+        mock_instance.stream = streaming()
+        mock_scraper.return_value = mock_instance
+
+        result = runner.invoke(app, ["browse", "--cached"])
+
+        assert result.exit_code == 0
+        assert "Cached Activity" in result.stdout
+        mock_instance.stream.assert_not_called()
+
+    @patch("longueuil_aweille.__main__.ActivityScraper")
+    def test_browse_partial_scrape_is_not_cached(self, mock_scraper, isolated_catalog: Path):
+        from longueuil_aweille.catalog import ActivityCatalog
+
+        mock_instance = MagicMock()
+        mock_instance.stream = streaming(
+            make_activity("First Page", "P1"), error=TimeoutError("page 2 timed out")
+        )
+        mock_instance.fetch_registration_dates = AsyncMock()
+        mock_scraper.return_value = mock_instance
+
+        result = runner.invoke(app, ["browse"])
+
+        assert result.exit_code == 0
+        assert "Scraping failed" in result.output
+        assert "First Page" in result.stdout
+        with ActivityCatalog(isolated_catalog) as catalog:
+            assert catalog.age() is None
+            assert catalog.load() is None
+
+
+class TestWatch:
+    def test_watch_prints_changes_as_ndjson(self):
+        from longueuil_aweille.watch import ActivityChange, ChangeKind
+
+        scans = [[], [ActivityChange(ChangeKind.ADDED, make_activity())]]
+        with (
+            patch("longueuil_aweille.__main__.ActivityScraper"),
+            patch("longueuil_aweille.__main__.CatalogWatcher") as mock_watcher,
+            patch("longueuil_aweille.__main__.asyncio.sleep", AsyncMock()),
+        ):
+            watcher = mock_watcher.return_value
+            watcher.scan = AsyncMock(side_effect=scans)
+            watcher.activities = {"ABC123": make_activity()}
+
+            result = runner.invoke(app, ["watch", "--scans", "2", "--format", "ndjson"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert [json.loads(line)["kind"] for line in lines] == ["added"]
+        assert watcher.scan.await_count == 2
+
+
+class TestDaemon:
+    def test_daemon_status_not_running(self):
+        result = runner.invoke(app, ["daemon", "--status"])
+        assert result.exit_code == 1
+        assert "No browser daemon running" in result.stdout
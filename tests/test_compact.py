@@ -0,0 +1,65 @@
+from datetime import date
+
+from longueuil_aweille.browse import Activity, RegistrationDates
+from longueuil_aweille.compact import MISSING, ActivityCodec
+from longueuil_aweille.status import ActivityStatus
+
+
+def make_activity(code: str = "AQ-101", spots: int = 5, **overrides) -> Activity:
+    fields = {
+        "name": "Parent-bébé",
+        "code": code,
+        "domain": "Activités aquatiques",
+        "age_min": 0,
+        "age_max": 3,
+        "start_date": "6 janvier 2026",
+        "end_date": "24 mars 2026",
+        "promoter": "Ville de Longueuil",
+        "spots": spots,
+        "price": "45,00 $",
+        "days": "Samedi",
+        "times": "9 h 00 à 9 h 45",
+        "location": "Piscine Olympique",
+        "status": ActivityStatus.AVAILABLE,
+        "page_number": 2,
+        "dates_button": "ctlGrille$ctl03$ctlDates",
+    }
+    fields.update(overrides)
+    return Activity(**fields)
+
+
+class TestActivityCodec:
+    def test_roundtrip(self):
+        codec = ActivityCodec()
+        activities = [
+            make_activity(),
+            make_activity(
+                "AQ-102",
+                registration_dates=RegistrationDates("2025-12-01, 19:00", "2025-12-15"),
+            ),
+        ]
+
+        assert codec.decode_all(codec.encode_all(activities)) == activities
+
+    def test_parsed_columns(self):
+        row = ActivityCodec().encode(make_activity())
+
+        assert row.start_day == date(2026, 1, 6).toordinal()
+        assert row.end_day == date(2026, 3, 24).toordinal()
+        assert (row.start_minute, row.end_minute) == (540, 585)
+        assert row.price_cents == 4500
+
+    def test_unparseable_columns_are_missing(self):
+        row = ActivityCodec().encode(make_activity(start_date="", times="", price="?"))
+
+        assert row.start_day == row.start_minute == row.price_cents == MISSING
+
+    def test_shares_strings_and_unchanged_rows(self):
+        codec = ActivityCodec()
+        first = codec.encode_all([make_activity("A1"), make_activity("A2")])
+        second = codec.encode_all([make_activity("A1"), make_activity("A2", spots=4)])
+
+        assert second[0] is first[0]
+        assert second[1] is not first[1]
+        assert first[0].name == first[1].name
+        assert codec.text(first[0].location) == "Piscine Olympique"
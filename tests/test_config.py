@@ -42,3 +42,50 @@ def test_settings_custom_values():
     assert settings.timeout == 120
     assert len(settings.participants) == 1
     assert settings.participants[0].name == "Participant 1"
+
+
+def test_resolved_targets_in_priority_order(tmp_path):
+    config = tmp_path / "config.toml"
+    config.write_text("""
+domain = "Activités aquatiques"
+
+[[targets]]
+activity_name = "Niveau 1"
+day = "wed"
+priority = 3
+
+[[targets]]
+activity_name = "Niveau 1"
+day = "sat"
+priority = 1
+
+[[targets]]
+activity_name = "Niveau 1"
+day = "sun"
+domain = "Activités aquatiques (Saint-Hubert)"
+priority = 2
+""")
+
+    targets = Settings.from_toml(config).resolved_targets()
+
+    assert [t.day for t in targets] == ["sat", "sun", "wed"]
+    assert targets[0].domain == "Activités aquatiques"
+    assert targets[1].domain == "Activités aquatiques (Saint-Hubert)"
+
+
+def test_resolved_targets_defaults_to_activity():
+    settings = Settings(activity_name="Parent-bébé", activity_day="samedi")
+    (target,) = settings.resolved_targets()
+    assert target.activity_name == "Parent-bébé"
+    assert target.label == "Parent-bébé (samedi)"
+
+
+def test_targets_ignore_unprefixed_env(monkeypatch):
+    monkeypatch.setenv("DOMAIN", "Sports")
+    monkeypatch.setenv("DAY", "mon")
+    monkeypatch.setenv("PRIORITY", "9")
+    settings = Settings(domain="Activités aquatiques", targets=[{"activity_name": "Niveau 1"}])
+
+    (target,) = settings.resolved_targets()
+
+    assert (target.domain, target.day, target.priority) == ("Activités aquatiques", "", 0)
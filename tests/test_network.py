@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from longueuil_aweille.network import NetworkMonitor, should_block
+
+SITE = "https://loisir.longueuil.quebec/inscription/"
+
+
+def fake_route(resource_type: str, url: str) -> MagicMock:
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.fallback = AsyncMock()
+    return route
+
+
+class TestShouldBlock:
+    def test_full_loads_everything(self):
+        assert not should_block("full", "image", f"{SITE}images/InscrNotNow.png")
+
+    def test_lean_drops_images_and_trackers(self):
+        assert should_block("lean", "image", f"{SITE}images/InscrNotNow.png")
+        assert should_block("lean", "script", "https://www.googletagmanager.com/gtag/js")
+        assert not should_block("lean", "stylesheet", f"{SITE}style.css")
+        assert not should_block("lean", "script", "https://cdn.example.com/jquery.js")
+
+    def test_minimal_keeps_only_site_documents_and_scripts(self):
+        assert should_block("minimal", "stylesheet", f"{SITE}style.css")
+        assert should_block("minimal", "script", "https://cdn.example.com/jquery.js")
+        assert not should_block("minimal", "script", f"{SITE}WebResource.axd")
+        assert not should_block("minimal", "document", SITE)
+
+
+class TestNetworkMonitor:
+    async def test_counts_blocked_requests(self):
+        monitor = NetworkMonitor("lean")
+        image = fake_route("image", f"{SITE}images/InscrNotNow.png")
+        document = fake_route("document", SITE)
+
+        await monitor._route(image)
+        await monitor._route(document)
+
+        image.abort.assert_awaited_once()
+        document.fallback.assert_awaited_once()
+        assert monitor.stats.blocked_total == 1
+        assert "1 image" in monitor.summary()
+
+    def test_reports_bytes_received_by_type(self):
+        monitor = NetworkMonitor("lean")
+        for resource_type, length in [("document", "4096"), ("script", "2048"), ("script", "")]:
+            response = MagicMock()
+            response.request.resource_type = resource_type
+            response.headers = {"content-length": length}
+            monitor._on_response(response)
+
+        assert monitor.stats.bytes_received == 6144
+        assert "6 KB received (4 KB document, 2 KB script)" in monitor.summary()
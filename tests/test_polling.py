@@ -0,0 +1,57 @@
+from longueuil_aweille.config import Settings
+from longueuil_aweille.polling import (
+    AdaptiveScheduler,
+    FixedScheduler,
+    PollObservation,
+    make_scheduler,
+)
+
+
+def adaptive(**kwargs: float) -> AdaptiveScheduler:
+    # rng of 0.5 means no jitter.
+    return AdaptiveScheduler(
+        interval=5.0,
+        burst_interval=0.5,
+        burst_lead=3.0,
+        burst_window=90.0,
+        rng=lambda: 0.5,
+        **kwargs,
+    )
+
+
+class TestFixedScheduler:
+    def test_burst_around_opening(self):
+        scheduler = FixedScheduler(5.0, 0.5, 3.0, 90.0)
+        assert scheduler.next_delay(PollObservation(since_opening=-2)).delay == 0.5
+        assert scheduler.next_delay(PollObservation(since_opening=-600)).delay == 5.0
+        assert scheduler.next_delay(PollObservation()).delay == 5.0
+
+
+class TestAdaptiveScheduler:
+    def test_backs_off_while_not_yet(self):
+        scheduler = adaptive(max_interval=10.0)
+        delays = [scheduler.next_delay(PollObservation(not_yet=True)).delay for _ in range(4)]
+        assert delays == [5.0, 7.5, 10.0, 10.0]
+
+        assert scheduler.next_delay(PollObservation()).delay == 5.0
+
+    def test_bursts_around_opening(self):
+        scheduler = adaptive()
+        assert scheduler.next_delay(PollObservation(since_opening=-2)).delay == 0.5
+        assert scheduler.next_delay(PollObservation(since_opening=120)).delay == 5.0
+
+    def test_slows_down_for_slow_server(self):
+        decision = adaptive().next_delay(PollObservation(since_opening=1, latency=1.5))
+        assert decision.delay == 3.0
+        assert "latency" in decision.reason
+
+    def test_jitter(self):
+        scheduler = adaptive(jitter=0.2)
+        scheduler.rng = lambda: 1.0
+        assert scheduler.next_delay(PollObservation()).delay == 6.0
+
+
+def test_make_scheduler_from_settings():
+    scheduler = make_scheduler(Settings(scheduler="adaptive", max_refresh_interval=30.0))
+    assert isinstance(scheduler, AdaptiveScheduler)
+    assert scheduler.max_interval == 30.0
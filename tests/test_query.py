@@ -0,0 +1,183 @@
+import itertools
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from longueuil_aweille.browse import Activity, ActivityScraper, day_mask
+from longueuil_aweille.query import ActivityIndex, Query, SearchIndex, sort_activities
+from longueuil_aweille.status import ActivityStatus
+
+DAYS = ["Lundi", "Mardi", "Samedi", "Dimanche", "Lundi, Mercredi"]
+LOCATIONS = ["Piscine Olympique", "Centre Vieux-Longueuil", "Aréna Saint-Hubert"]
+
+
+def catalog() -> list[Activity]:
+    activities = []
+    for i, (day, location, ages) in enumerate(
+        itertools.product(DAYS, LOCATIONS, [(0, 3), (5, 12), (16, 150)])
+    ):
+        activities.append(
+            Activity(
+                name=f"{'Natation' if i % 2 else 'Yoga'} {i}",
+                code=f"C{i:03}",
+                domain="Aquatique" if "Piscine" in location else "Loisirs",
+                age_min=ages[0],
+                age_max=ages[1],
+                # Every ninth activity has text the parsers cannot read.
+                start_date="" if i % 9 == 0 else f"{i % 28 + 1} janvier 2026",
+                end_date="",
+                promoter="",
+                spots=i % 7,
+                price="" if i % 9 == 0 else f"{10 * (i % 6)},00 $",
+                days=day,
+                times="" if i % 9 == 0 else f"{8 + i % 10} h 00 à {9 + i % 10} h 30",
+                location=location,
+                status=ActivityStatus.AVAILABLE if i % 3 else ActivityStatus.FULL,
+            )
+        )
+    return activities
+
+
+def make_activity(name: str, code: str) -> Activity:
+    return replace(catalog()[1], name=name, code=code, age_min=0, age_max=150, price="", days="")
+
+
+class TestQueryMatches:
+    def test_matches_each_criterion(self):
+        activity = replace(
+            make_activity("Parent-bébé", "AQ-1"),
+            days="Samedi",
+            location="Piscine Olympique",
+            age_max=3,
+        )
+
+        assert Query(name_contains="PARENT", day="sam", age=2).matches(activity)
+        assert Query(location_contains="olympique", day="saturday").matches(activity)
+        assert not Query(day="sun").matches(activity)
+        assert not Query(age=5).matches(activity)
+        assert not Query(name_contains="Natation").matches(activity)
+
+    def test_matches_ranges_on_parsed_fields(self):
+        activity = replace(
+            make_activity("Yoga", "Y1"),
+            start_date="10 janvier 2026",
+            times="18 h 00 à 19 h 00",
+            price="45,00 $",
+        )
+
+        assert Query(starts_from=date(2026, 1, 10), max_price=4500).matches(activity)
+        assert Query(time_from=17 * 60, time_until=19 * 60).matches(activity)
+        assert not Query(starts_until=date(2026, 1, 1)).matches(activity)
+        assert not Query(time_until=18 * 60 + 30).matches(activity)
+        assert not Query(max_price=4000).matches(activity)
+        assert not Query(max_price=4000).matches(make_activity("Free?", "F1"))
+
+
+class TestActivityIndex:
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            {},
+            {"name_contains": "natation"},
+            {"location_contains": "longueuil"},
+            {"day": "mer"},
+            {"day": "samedi", "age": 8},
+            {"age": 16},
+            {"name_contains": "Yoga", "location_contains": "arena", "day": "mon", "age": 2},
+            {"starts_from": date(2026, 1, 10), "starts_until": date(2026, 1, 20)},
+            {"time_from": 10 * 60, "time_until": 15 * 60},
+            {"max_price": 2000, "day": "lundi"},
+        ],
+    )
+    def test_matches_row_by_row(self, criteria: dict):
+        activities = catalog()
+        expected = [a for a in activities if Query(**criteria).matches(a)]
+
+        assert ActivityIndex(activities).query(Query(**criteria)) == expected
+
+    def test_composite_query_with_sorting(self):
+        index = ActivityIndex(catalog())
+
+        result = index.query(
+            Query(
+                domain="aquatique",
+                day="sat, sun",
+                statuses=frozenset({ActivityStatus.AVAILABLE}),
+                sort_by=("spots", "code"),
+                descending=True,
+                limit=3,
+            )
+        )
+
+        assert [a.spots for a in result] == sorted((a.spots for a in result), reverse=True)
+        assert len(result) == 3
+        assert all(a.days in ("Samedi", "Dimanche") for a in result)
+        assert all(a.status == ActivityStatus.AVAILABLE for a in result)
+
+    def test_sorts_parsed_fields_with_unparsed_last(self):
+        activities = catalog()
+
+        for descending in (False, True):
+            result = sort_activities(activities, ("price_cents", "start_day"), descending)
+            prices = [a.price_cents for a in result if a.price_cents is not None]
+            assert prices == sorted(prices, reverse=descending)
+            assert all(a.price_cents is None for a in result[len(prices) :])
+
+    def test_unknown_sort_field(self):
+        with pytest.raises(ValueError, match="colour"):
+            ActivityIndex(catalog()).query(Query(sort_by=("colour",)))
+
+    def test_day_mask(self):
+        assert day_mask("lundi, mercredi") == 0b101
+        assert day_mask("") == 0
+
+
+def named(name: str, code: str = "", location: str = "") -> Activity:
+    activity = catalog()[0]
+    activity.name, activity.code, activity.location = name, code, location
+    return activity
+
+
+class TestSearchIndex:
+    def index(self) -> SearchIndex:
+        return SearchIndex(
+            [
+                named("Natation niveau 3", "NAT-3", "Piscine Olympique"),
+                named("Parent-bébé", "AQ-101", "Piscine Olympique"),
+                named("Parent-bébé niveau 2", "AQ-102", "Centre Vieux-Longueuil"),
+                named("Yoga doux", "YO-1", "Centre Vieux-Longueuil"),
+            ]
+        )
+
+    def test_accent_insensitive_and_exact_first(self):
+        hits = self.index().search("parent-bebe")
+
+        assert [h.activity.code for h in hits] == ["AQ-101", "AQ-102"]
+        assert hits[0].score > hits[1].score
+
+    def test_tolerates_typos(self):
+        assert self.index().best("natatoin niv 3").code == "NAT-3"
+
+    def test_code_and_location(self):
+        index = self.index()
+
+        assert index.best("aq-102").code == "AQ-102"
+        assert {h.activity.code for h in index.search("vieux longueuil")} == {"AQ-102", "YO-1"}
+        assert index.search("hockey") == []
+
+    def test_spelling(self):
+        index = self.index()
+
+        assert index.spelling("PARENT-BEBE") == "Parent-bébé"
+        assert index.spelling("yoga dous") == "Yoga doux"
+        assert index.spelling("hockey") is None
+
+
+def test_filter_activities_rebuilds_index_when_activities_change():
+    scraper = ActivityScraper()
+    scraper.activities = catalog()
+    assert len(scraper.filter_activities(day="dim")) == 9
+
+    scraper.activities.append(catalog()[27])
+    assert len(scraper.filter_activities(day="dim")) == 10
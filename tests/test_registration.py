@@ -0,0 +1,394 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from longueuil_aweille.config import Participant, Settings, Target
+from longueuil_aweille.registration import (
+    CredentialsRejectedError,
+    RegistrationBot,
+    ResultsRequest,
+    TargetLocation,
+    row_matches_day,
+)
+from longueuil_aweille.status import Paginator, RegistrationStatus
+from longueuil_aweille.verify import ParticipantVerification, VerificationStatus
+
+RESULTS_ROW = """
+<table id="ctlGrille"><tr>
+  <td>Parent-bébé<br />AQ-101</td><td>Samedi</td><td>9 h 00</td>
+  <td><input type="image" id="ctlGrille_ctl01_ctlSelecteur" src="{src}" /></td>
+</tr></table>
+"""
+
+PARENT = Participant(name="Parent", age=35, carte_acces="01234567890123", telephone="5145551234")
+KID = Participant(name="Kid", age=4, carte_acces="01234567890124", telephone="5145551234")
+
+
+def bot_with_verification(results: list[ParticipantVerification]) -> RegistrationBot:
+    bot = RegistrationBot(Settings(participants=[PARENT, KID]), verify=True)
+
+    async def verification() -> list[ParticipantVerification]:
+        await asyncio.sleep(0)
+        return results
+
+    bot._verification_task = asyncio.create_task(verification())
+    return bot
+
+
+class TestCredentialCheck:
+    async def test_waits_for_verification_before_cart(self):
+        bot = bot_with_verification(
+            [
+                ParticipantVerification(PARENT, VerificationStatus.VALID, 1.0),
+                ParticipantVerification(KID, VerificationStatus.ERROR, 1.0),
+            ]
+        )
+
+        await bot._check_credentials()
+
+        assert [v.status for v in bot.verification] == [
+            VerificationStatus.VALID,
+            VerificationStatus.ERROR,
+        ]
+
+    async def test_rejected_credentials_stop_before_cart(self):
+        bot = bot_with_verification(
+            [
+                ParticipantVerification(PARENT, VerificationStatus.VALID, 1.0),
+                ParticipantVerification(KID, VerificationStatus.INVALID, 1.0),
+            ]
+        )
+
+        with pytest.raises(CredentialsRejectedError) as e:
+            await bot._check_credentials()
+        assert e.value.names == ["Kid"]
+
+    async def test_rejection_is_reported_as_soon_as_known(self, caplog: pytest.LogCaptureFixture):
+        bot = bot_with_verification(
+            [
+                ParticipantVerification(PARENT, VerificationStatus.VALID, 1.0),
+                ParticipantVerification(KID, VerificationStatus.INVALID, 1.0),
+            ]
+        )
+        assert bot._verification_task is not None
+        bot._verification_task.add_done_callback(bot._report_rejected)
+
+        with caplog.at_level("WARNING"):
+            await asyncio.sleep(0.01)
+
+        assert "Invalid credentials for: Kid" in caplog.text
+
+    async def test_without_verification(self):
+        bot = RegistrationBot(Settings(participants=[PARENT]))
+        await bot._check_credentials()
+        assert bot.verification == []
+
+
+class TestRowMatchesDay:
+    def test_full_day_name(self):
+        assert row_matches_day("Niveau 1 Mardi 18 h 00", "tue")
+
+    def test_month_is_not_a_day(self):
+        assert not row_matches_day("Niveau 1 Samedi 1 mars 2025", "tue")
+
+    def test_no_day_matches_all(self):
+        assert row_matches_day("Niveau 1", "")
+
+
+class TestTargets:
+    async def test_fallback_is_taken_and_lower_priorities_cancelled(self):
+        settings = Settings(
+            fallback_grace=0.05,
+            targets=[
+                Target(activity_name="Niveau 1", day="sat", priority=1),
+                Target(activity_name="Niveau 1", day="sun", priority=2),
+                Target(activity_name="Niveau 1", day="wed", priority=3),
+            ],
+        )
+        polled: list[str] = []
+        cancelled: list[str] = []
+
+        async def poll(bot: RegistrationBot, _: MagicMock) -> RegistrationStatus | None:
+            day = bot.settings.activity_day
+            polled.append(day)
+            if day == "sun":
+                return RegistrationStatus.SUCCESS
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(day)
+                raise
+            return None
+
+        completed: list[str] = []
+
+        async def complete(bot: RegistrationBot, _: MagicMock) -> RegistrationStatus:
+            completed.append(bot.settings.activity_day)
+            return RegistrationStatus.SUCCESS
+
+        page = MagicMock()
+        page.close = AsyncMock()
+        with (
+            patch("longueuil_aweille.registration.new_page", AsyncMock(return_value=page)),
+            patch.object(RegistrationBot, "_poll_target", poll),
+            patch.object(RegistrationBot, "_complete", complete),
+        ):
+            bot = RegistrationBot(settings)
+            status = await bot._run_targets(MagicMock(), settings.resolved_targets())
+
+        assert status == RegistrationStatus.SUCCESS
+        assert polled == ["sat", "sun", "wed"]
+        assert completed == ["sun"]
+        assert sorted(cancelled) == ["sat", "wed"]
+
+    async def test_superseded_cart_is_emptied(self):
+        settings = Settings(
+            fallback_grace=1,
+            targets=[
+                Target(activity_name="Niveau 1", day="sat", priority=1),
+                Target(activity_name="Niveau 1", day="sun", priority=2),
+            ],
+        )
+
+        async def poll(bot: RegistrationBot, _: MagicMock) -> RegistrationStatus:
+            # The fallback reaches its cart first, then the preferred target opens.
+            if bot.settings.activity_day == "sat":
+                await asyncio.sleep(0.01)
+            return RegistrationStatus.SUCCESS
+
+        released: list[str] = []
+
+        async def release(bot: RegistrationBot, _: MagicMock) -> None:
+            released.append(bot.settings.activity_day)
+
+        page = MagicMock()
+        page.close = AsyncMock()
+        with (
+            patch("longueuil_aweille.registration.new_page", AsyncMock(return_value=page)),
+            patch.object(RegistrationBot, "_poll_target", poll),
+            patch.object(RegistrationBot, "_release_cart", release),
+            patch.object(
+                RegistrationBot, "_complete", AsyncMock(return_value=RegistrationStatus.SUCCESS)
+            ),
+        ):
+            status = await RegistrationBot(settings)._run_targets(
+                MagicMock(), settings.resolved_targets()
+            )
+
+        assert status == RegistrationStatus.SUCCESS
+        assert released == ["sun"]
+
+    async def test_reports_most_specific_status(self):
+        settings = Settings(
+            targets=[
+                Target(activity_name="Niveau 1", day="sat", priority=1),
+                Target(activity_name="Niveau 1", day="sun", priority=2),
+            ],
+        )
+
+        async def poll(bot: RegistrationBot, _: MagicMock) -> None:
+            # The preferred row is not open yet; the fallback is full.
+            if bot.settings.activity_day == "sat":
+                bot.last_activity_status = RegistrationStatus.FAILED
+            else:
+                bot.last_activity_status = RegistrationStatus.ACTIVITY_FULL
+
+        page = MagicMock()
+        page.close = AsyncMock()
+        with (
+            patch("longueuil_aweille.registration.new_page", AsyncMock(return_value=page)),
+            patch.object(RegistrationBot, "_poll_target", poll),
+            patch.object(RegistrationBot, "_release_cart", AsyncMock()),
+        ):
+            status = await RegistrationBot(settings)._run_targets(
+                MagicMock(), settings.resolved_targets()
+            )
+
+        assert status == RegistrationStatus.ACTIVITY_FULL
+
+
+def probing_page(body: str) -> MagicMock:
+    response = MagicMock()
+    response.text = AsyncMock(return_value=body)
+    page = MagicMock()
+    page.context.request.post = AsyncMock(return_value=response)
+    return page
+
+
+class TestProbe:
+    def probing_bot(self) -> RegistrationBot:
+        bot = RegistrationBot(Settings(activity_name="Parent-bébé", probe=True))
+        bot._results_request = ResultsRequest(
+            "https://example.test/Page.fr.aspx", "__VIEWSTATE=x", {}
+        )
+        return bot
+
+    async def test_not_yet(self):
+        bot = self.probing_bot()
+        page = probing_page(RESULTS_ROW.format(src="/images/InscrNotNow.png"))
+
+        assert await bot._probe_results(page) is False
+        page.context.request.post.assert_awaited_once_with(
+            "https://example.test/Page.fr.aspx", data="__VIEWSTATE=x", headers={}
+        )
+
+    async def test_flipped_to_available(self):
+        bot = self.probing_bot()
+        page = probing_page(RESULTS_ROW.format(src="/images/InscrSelect.png"))
+
+        assert await bot._probe_results(page) is True
+
+    async def test_row_missing_falls_back_to_browser(self):
+        bot = self.probing_bot()
+        page = probing_page("<html><body>Session expirée</body></html>")
+
+        assert await bot._probe_results(page) is None
+        assert bot._results_request is None
+
+    async def test_nothing_captured_yet(self):
+        bot = RegistrationBot(Settings(activity_name="Parent-bébé", probe=True))
+        assert await bot._probe_results(MagicMock()) is None
+
+
+class FakePaginator(Paginator):
+    def __init__(self, page: MagicMock, **_: object):
+        super().__init__(page)
+        self.page_count = 7
+
+    async def _visible_numbers(self) -> list[int]:
+        return [n for n in range(1, 8) if n != self.current]
+
+    async def _click(self, number: int) -> None:
+        self.current = number
+
+
+class TestPollReport:
+    def test_next_poll_is_reported(self):
+        reports: list[str] = []
+        bot = RegistrationBot(Settings(refresh_interval=2.0), report=reports.append)
+
+        assert bot._next_delay(latency=0.25) == 2.0
+        assert reports == ["Next poll in 2.00s (fixed interval; last poll took 250 ms)"]
+
+
+class TestTargetLocation:
+    def bot_with_rows(self, rows: dict[int, str]) -> tuple[RegistrationBot, list[int]]:
+        bot = RegistrationBot(Settings(activity_name="Parent-bébé"))
+        checked: list[int] = []
+
+        async def try_select(page: MagicMock) -> RegistrationStatus | None:
+            number = bot._pager(page).current
+            checked.append(number)
+            row = rows.get(number)
+            expected = bot._target_location.row if bot._target_location else None
+            if row is None or (expected is not None and row != expected):
+                return None
+            bot.search_hits += 1
+            bot._target_location = TargetLocation(number, row)
+            return RegistrationStatus.FAILED
+
+        bot._try_select_on_page = try_select  # type: ignore[method-assign]
+        return bot, checked
+
+    async def find(self, bot: RegistrationBot, page: MagicMock) -> RegistrationStatus | None:
+        with patch("longueuil_aweille.registration.Paginator", FakePaginator):
+            return await bot._find_and_select_activity(page)
+
+    async def test_jumps_to_remembered_page(self):
+        bot, checked = self.bot_with_rows({3: "Parent-bébé\nAQ-103"})
+
+        assert await self.find(bot, MagicMock()) is None
+        assert checked == [1, 2, 3]
+        assert bot.last_activity_status == RegistrationStatus.FAILED
+
+        # A fresh search starts back on page 1.
+        checked.clear()
+        await self.find(bot, MagicMock())
+        assert checked == [3]
+        assert bot.search_hits == 1
+
+    async def test_rescans_when_row_moves(self):
+        bot, checked = self.bot_with_rows({5: "Parent-bébé\nAQ-103"})
+        bot._target_location = TargetLocation(3, "Parent-bébé\nAQ-103")
+        reports: list[str] = []
+        bot.report = reports.append
+
+        await self.find(bot, MagicMock())
+
+        assert checked == [3, 1, 2, 4, 5]
+        assert reports == [
+            "Target row moved or closed, scanning all results pages",
+            "Search hits this poll: 1 on 5 page(s)",
+        ]
+        assert bot._target_location == TargetLocation(5, "Parent-bébé\nAQ-103")
+
+
+def results_page(*rows: tuple[str, str, str]) -> tuple[MagicMock, list[MagicMock]]:
+    """A page whose matches are (activity, status text, button src) rows, with their buttons."""
+    buttons = []
+    elements = []
+    for activity, status, src in rows:
+        button = MagicMock()
+        button.get_attribute = AsyncMock(
+            side_effect=lambda name, src=src: src if name == "src" else ""
+        )
+        button.click = AsyncMock()
+        buttons.append(button)
+
+        selectors = MagicMock(count=AsyncMock(return_value=1), first=button)
+        cells = MagicMock(all_inner_texts=AsyncMock(return_value=["", "", activity, status]))
+        row = MagicMock()
+        row.locator.side_effect = lambda selector, s=selectors, c=cells: (
+            s if "Selecteur" in selector else c
+        )
+        elements.append(MagicMock(locator=MagicMock(return_value=row)))
+
+    matches = MagicMock(count=AsyncMock(return_value=len(elements)))
+    matches.nth.side_effect = elements.__getitem__
+    page = MagicMock()
+    page.get_by_text.return_value = matches
+    page.locator.return_value.click = AsyncMock()
+    return page, buttons
+
+
+class TestSelectRow:
+    def bot(self) -> RegistrationBot:
+        bot = RegistrationBot(Settings(activity_name="Parent-bébé"))
+        bot.waits = MagicMock(for_visible=AsyncMock(return_value=True))
+        return bot
+
+    async def test_skips_full_row_for_available_one(self):
+        page, buttons = results_page(
+            ("Parent-bébé AQ-101", "COMPLET", "/images/InscrComplet.png"),
+            ("Parent-bébé AQ-102", "", "/images/Inscrire.png"),
+        )
+        bot = self.bot()
+
+        assert await bot._try_select_on_page(page) == RegistrationStatus.SUCCESS
+        buttons[0].click.assert_not_awaited()
+        buttons[1].click.assert_awaited_once()
+        assert bot.last_activity_status == RegistrationStatus.ACTIVITY_FULL
+
+    async def test_forgets_remembered_row_once_full(self):
+        page, buttons = results_page(
+            ("Parent-bébé AQ-101", "COMPLET", "/images/InscrComplet.png"),
+            ("Parent-bébé AQ-102", "", "/images/Inscrire.png"),
+        )
+        bot = self.bot()
+        bot._target_location = TargetLocation(1, "Parent-bébé AQ-101")
+
+        assert await bot._try_select_on_page(page) == RegistrationStatus.SUCCESS
+        assert bot._target_location is None
+        buttons[1].click.assert_awaited_once()
+
+    async def test_remembers_row_not_open_yet(self):
+        page, _ = results_page(
+            ("Parent-bébé AQ-101", "COMPLET", "/images/InscrComplet.png"),
+            ("Parent-bébé AQ-102", "", "/images/InscrNotNow.png"),
+        )
+        bot = self.bot()
+
+        assert await bot._try_select_on_page(page) == RegistrationStatus.FAILED
+        assert bot._target_location == TargetLocation(1, "Parent-bébé AQ-102")
+        assert bot.search_hits == 2
@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from longueuil_aweille.replay import SessionArchive
+from longueuil_aweille.waits import StepSummary
+
+SITE = "https://loisir.longueuil.quebec/inscription/Pages/Anonyme/Resultat/Page.fr.aspx?m=1"
+POSTBACK = "__EVENTTARGET=&__VIEWSTATE=abc"
+
+
+def fake_route(method: str = "POST", url: str = SITE, post_data: str | None = POSTBACK):
+    route = MagicMock()
+    route.request.method = method
+    route.request.url = url
+    route.request.post_data = post_data
+    route.request.headers = {"content-type": "application/x-www-form-urlencoded"}
+    route.request.resource_type = "document"
+    route.abort = AsyncMock()
+    route.fulfill = AsyncMock()
+    return route
+
+
+def fake_response(body: bytes, content_type: str = "text/html; charset=utf-8") -> MagicMock:
+    response = MagicMock()
+    response.status = 200
+    response.status_text = "OK"
+    response.headers = {"content-type": content_type}
+    response.headers_array = [
+        {"name": "Content-Type", "value": content_type},
+        {"name": "Content-Length", "value": str(len(body))},
+    ]
+    response.body = AsyncMock(return_value=body)
+    return response
+
+
+def step(name: str, avg_ms: float) -> StepSummary:
+    return StepSummary(name, count=1, avg_ms=avg_ms, max_ms=avg_ms, timeouts=0, legacy_ms=None)
+
+
+async def record(path: Path, *bodies: bytes, content_type: str = "text/html") -> None:
+    archive = SessionArchive.record(path)
+    for body in bodies:
+        route = fake_route()
+        route.fetch = AsyncMock(return_value=fake_response(body, content_type))
+        await archive._route(route)
+        route.fulfill.assert_awaited_once()
+    archive.save([step("search", 900.0), step("reload", 400.0)], elapsed=12.5)
+
+
+class TestSessionArchive:
+    async def test_replays_identical_requests_in_recorded_order(self, tmp_path: Path):
+        path = tmp_path / "session.har"
+        await record(path, b"InscrNotNow", b"Inscrire")
+
+        archive = SessionArchive.replay(path)
+        bodies = []
+        for _ in range(3):
+            route = fake_route()
+            await archive._route(route)
+            bodies.append(route.fulfill.await_args.kwargs["body"])
+
+        # The last recorded response keeps being served once the others are used up.
+        assert bodies == [b"InscrNotNow", b"Inscrire", b"Inscrire"]
+        assert archive.served == 3
+        headers = route.fulfill.await_args.kwargs["headers"]
+        assert "Content-Length" not in headers
+
+    async def test_unknown_request_is_aborted(self, tmp_path: Path):
+        path = tmp_path / "session.har"
+        await record(path, b"<html></html>")
+
+        archive = SessionArchive.replay(path)
+        route = fake_route(post_data="__EVENTTARGET=other")
+        await archive._route(route)
+
+        route.abort.assert_awaited_once()
+        assert archive.missed == [f"POST {SITE}"]
+
+    async def test_binary_bodies_round_trip(self, tmp_path: Path):
+        path = tmp_path / "session.har"
+        png = b"\x89PNG\r\n\x1a\n\x00\xff"
+        await record(path, png, content_type="image/png")
+
+        entry = json.loads(path.read_text())["log"]["entries"][0]
+        assert entry["response"]["content"]["encoding"] == "base64"
+
+        archive = SessionArchive.replay(path)
+        route = fake_route()
+        await archive._route(route)
+        assert route.fulfill.await_args.kwargs["body"] == png
+
+    async def test_compares_steps_with_recorded_run(self, tmp_path: Path):
+        path = tmp_path / "session.har"
+        await record(path, b"<html></html>")
+
+        archive = SessionArchive.replay(path)
+        comparison = archive.compare([step("search", 90.0), step("cart", 50.0)])
+
+        assert archive.recorded_elapsed == 12.5
+        assert [(c.step, c.recorded_ms, c.replayed_ms) for c in comparison] == [
+            ("search", 900.0, 90.0),
+            ("reload", 400.0, None),
+            ("cart", None, 50.0),
+        ]
+        assert comparison[0].ratio == pytest.approx(0.1)
+        assert comparison[1].ratio is None
+
+    def test_rejects_files_that_are_not_archives(self, tmp_path: Path):
+        path = tmp_path / "notes.json"
+        path.write_text('{"entries": []}')
+
+        with pytest.raises(ValueError, match="Not a HAR archive"):
+            SessionArchive.replay(path)
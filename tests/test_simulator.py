@@ -0,0 +1,217 @@
+import asyncio
+import time
+from datetime import datetime
+
+from longueuil_aweille.browse import (
+    ActivityScraper,
+    RegistrationDates,
+    RegistrationDatesCache,
+    rows_from_document,
+)
+from longueuil_aweille.catalog import ActivityCatalog
+from longueuil_aweille.config import Settings
+from longueuil_aweille.registration import RegistrationBot, find_target_rows
+from longueuil_aweille.schedule import SITE_TIMEZONE
+from longueuil_aweille.simulator import CART_FIELD, RegistrationSite, demo_catalog, serve
+from longueuil_aweille.snipe import lookup_opening
+from longueuil_aweille.webforms import WebFormsClient
+
+SEARCH_BUTTON = "ctlBlocRecherche_ctlRechercher"
+DOMAIN = "Activités aquatiques (Vieux-Longueuil)"
+CREDENTIALS = {"01234567890123": "5145551234"}
+
+
+def make_site(opens_in: float = 0.0, size: int = 45) -> RegistrationSite:
+    activities = demo_catalog(size, target_index=size - 2)
+    target = activities[size - 2].code
+    return RegistrationSite(
+        activities, CREDENTIALS, opens_at={target: time.time() + opens_in}, per_page=10
+    )
+
+
+def grid_rows(client: WebFormsClient) -> list[str]:
+    assert client.document is not None
+    return [row["cells"][2] for row in rows_from_document(client.document) if row["cells"][14:]]
+
+
+async def select_target(client: WebFormsClient) -> None:
+    await client.open()
+    await client.search(
+        search_button_id=SEARCH_BUTTON,
+        keyword="parent bebe",
+        keyword_input_id="ctlBlocRecherche_ctlMotsCles_ctlMotsCle",
+    )
+    assert client.document is not None
+    (row,) = find_target_rows(client.document, "Parent-bébé")
+    selector = next(el for el in row.find_all("input") if "Selecteur" in el.get("id"))
+    await client.activate(selector)
+
+
+class TestRegistrationSite:
+    async def test_search_paginates_and_keeps_session(self):
+        site = make_site(size=45)
+        with serve(site) as url:
+            async with WebFormsClient(url) as client:
+                await client.open()
+                await client.search(search_button_id=SEARCH_BUTTON)
+                first = grid_rows(client)
+                assert client.page_numbers() == [1, 2, 3, 4, 5]
+
+                await client.goto_page(5)
+                last = grid_rows(client)
+                await client.open()
+
+        assert len(first) == 10
+        assert len(last) == 5
+        assert first[0].endswith("SIM-0000")
+        # A plain GET shows the session's current results page again.
+        assert grid_rows(client) == last
+
+    async def test_target_flips_when_registration_opens(self):
+        site = make_site(opens_in=0.3)
+        target = next(iter(site.opens_at))
+        with serve(site) as url:
+            async with WebFormsClient(url) as client:
+                await client.open()
+                before = await client.search(
+                    search_button_id=SEARCH_BUTTON,
+                    available_only=True,
+                    domain=DOMAIN,
+                    keyword="Parent",
+                    keyword_input_id="ctlBlocRecherche_ctlMotsCles_ctlMotsCle",
+                )
+                await asyncio.sleep(0.35)
+                after = await client.open()
+
+        def target_src(root) -> str:
+            (row,) = find_target_rows(root, "Parent-bébé")
+            return next(
+                el.get("src") for el in row.find_all("input") if "Selecteur" in el.get("id")
+            )
+
+        assert "InscrNotNow" in target_src(before)
+        assert "Inscrire" in target_src(after)
+        assert site.events[target].first_served is not None
+
+    async def test_http_scraper_reads_every_activity(self):
+        site = make_site(size=35)
+        with serve(site) as url:
+            activities = await ActivityScraper(backend="http", registration_url=url).run()
+
+        assert len(activities) == 35
+        assert activities[-1].code == "SIM-0034"
+
+    async def test_dates_follow_the_activity_after_rows_shift(self):
+        activities = demo_catalog(8, target_index=3)
+        target = activities[3].code
+        opens = datetime(2026, 2, 3, 19, 0, tzinfo=SITE_TIMEZONE).timestamp()
+        site = RegistrationSite(activities, CREDENTIALS, opens_at={target: opens})
+        with serve(site) as url:
+            scraper = ActivityScraper(backend="http", registration_url=url)
+            scraped = {a.code: a for a in await scraper.run()}
+            # Rows move up after the scrape, and one activity disappears.
+            del site.activities["SIM-0000"]
+            del site.activities["SIM-0005"]
+
+            await scraper.fetch_registration_dates([scraped[target], scraped["SIM-0005"]])
+
+        dates = scraped[target].registration_dates
+        assert dates is not None
+        assert dates.resident_start == "2026-02-03, 19:00"
+        assert scraped["SIM-0005"].registration_dates is None
+        assert scraper.dates_cache.lookup("SIM-0005") == (False, None)
+
+    async def test_opening_lookup_ignores_old_cached_dates(self, tmp_path):
+        activities = demo_catalog(8, target_index=3)
+        target = activities[3].code
+        opens = datetime(2026, 2, 3, 19, 0, tzinfo=SITE_TIMEZONE)
+        site = RegistrationSite(activities, CREDENTIALS, opens_at={target: opens.timestamp()})
+        with serve(site) as url, ActivityCatalog(tmp_path / "catalog.db") as catalog:
+            stale = RegistrationDatesCache()
+            stale.store(target, RegistrationDates("2025-12-01, 19:00", ""), fetched_at=0)
+            catalog.save_dates(stale)
+            settings = Settings(
+                registration_url=url, backend="http", domain=DOMAIN, activity_name="Parent-bébé"
+            )
+
+            assert await lookup_opening(settings, catalog) == opens
+
+    async def test_block_pager_is_followed_over_http(self):
+        site = RegistrationSite(
+            demo_catalog(45), CREDENTIALS, per_page=5, pager_window=3, pager="block"
+        )
+        with serve(site) as url:
+            async with WebFormsClient(url) as client:
+                await client.open()
+                await client.search(search_button_id=SEARCH_BUTTON)
+                # Pages 2-3, then "..." to the next block.
+                assert client.page_numbers() == [1, 2, 3, 4]
+
+                await client.goto_page(4)
+                assert client.page_numbers() == [3, 4, 5, 6, 7]
+
+            activities = await ActivityScraper(backend="http", registration_url=url).run()
+
+        assert len(activities) == 45
+
+    async def test_probe_sees_the_opening(self):
+        site = make_site(opens_in=0.3)
+        with serve(site) as url:
+            settings = Settings(
+                registration_url=url,
+                domain=DOMAIN,
+                activity_name="Parent-bébé",
+                participants=[],
+            )
+            bot = RegistrationBot(settings)
+            async with WebFormsClient(url) as client:
+                before = await bot._probe_http(client)
+                await asyncio.sleep(0.35)
+                after = await bot._probe_http(client)
+
+        assert before is False
+        assert after is True
+
+    async def test_cart_reserves_a_place(self):
+        site = make_site()
+        target = next(iter(site.opens_at))
+        spots = site.activities[target].spots
+        with serve(site) as url:
+            async with WebFormsClient(url) as client:
+                await select_target(client)
+                assert client.document is not None
+                cart = client.document.find_by_id("ctlGrille_ctlMenuActionsBas_ctlAppelPanierIdent")
+                assert cart is not None
+                await client.activate(cart)
+                assert client.form is not None
+
+                confirm = client.form.postback("ctlMenuActionBas$ctlAppelPanierConfirm")
+                confirm[CART_FIELD.format(i=0, name="ctlDossier")] = "01234567890123"
+                confirm[CART_FIELD.format(i=0, name="ctlNip")] = "5145551234"
+                outcome = (await client.post(confirm)).inner_text()
+
+        assert "Place réservée" in outcome
+        assert site.activities[target].spots == spots - 1
+        events = site.events[target]
+        assert events.selected is not None
+        assert events.in_cart is not None
+        assert events.reserved is not None
+
+    async def test_cart_rejects_unknown_card(self):
+        site = make_site()
+        with serve(site) as url:
+            async with WebFormsClient(url) as client:
+                await select_target(client)
+                assert client.document is not None
+                cart = client.document.find_by_id("ctlGrille_ctlMenuActionsBas_ctlAppelPanierIdent")
+                assert cart is not None
+                await client.activate(cart)
+                assert client.form is not None
+
+                confirm = client.form.postback("ctlMenuActionBas$ctlAppelPanierConfirm")
+                confirm[CART_FIELD.format(i=0, name="ctlDossier")] = "99999999999999"
+                confirm[CART_FIELD.format(i=0, name="ctlNip")] = "5145551234"
+                outcome = (await client.post(confirm)).inner_text()
+
+        assert "Aucun dossier" in outcome
+        assert site.events[next(iter(site.opens_at))].reserved is None
@@ -0,0 +1,123 @@
+from datetime import date, datetime
+from pathlib import Path
+
+from longueuil_aweille.browse import Activity
+from longueuil_aweille.catalog import ActivityCatalog
+from longueuil_aweille.config import Settings, Target
+from longueuil_aweille.schedule import (
+    SITE_TIMEZONE,
+    parse_price,
+    parse_site_date,
+    parse_site_datetime,
+    parse_time_range,
+)
+from longueuil_aweille.snipe import ServerClock, resolve_target_names
+from longueuil_aweille.status import ActivityStatus
+
+
+class TestParseSiteDatetime:
+    def test_iso_with_time(self):
+        assert parse_site_datetime("2025-12-01, 19:00") == datetime(
+            2025, 12, 1, 19, 0, tzinfo=SITE_TIMEZONE
+        )
+
+    def test_french_date(self):
+        assert parse_site_datetime("1er décembre 2025, 19 h") == datetime(
+            2025, 12, 1, 19, 0, tzinfo=SITE_TIMEZONE
+        )
+
+    def test_unparseable(self):
+        assert parse_site_datetime("bientôt") is None
+
+
+class TestParseColumns:
+    def test_date(self):
+        assert parse_site_date("6 janvier 2026") == date(2026, 1, 6)
+        assert parse_site_date("") is None
+
+    def test_time_range(self):
+        assert parse_time_range("9 h 00 à 10 h 30") == (540, 630)
+        assert parse_time_range("18 h") == (1080, 1080)
+        assert parse_time_range("") is None
+
+    def test_price(self):
+        assert parse_price("45,00 $") == 4500
+        assert parse_price("1 200,50 $") == 120050
+        assert parse_price("Gratuit") == 0
+        assert parse_price("") is None
+
+
+class TestServerClock:
+    def test_samples_narrow_the_offset(self):
+        clock = ServerClock()
+        # Server is 10.3 s ahead; sample just after and just before a second boundary.
+        clock.add_sample("Mon, 01 Dec 2025 00:00:10 GMT", 1764547199.75, 1764547199.80)
+        clock.add_sample("Mon, 01 Dec 2025 00:00:10 GMT", 1764547200.68, 1764547200.69)
+
+        assert clock.samples == 2
+        assert abs(clock.offset - 10.3) < 0.1
+        assert clock.uncertainty < 0.1
+
+    def test_without_samples(self):
+        clock = ServerClock()
+        assert clock.offset == 0.0
+
+
+class TestOpenAt:
+    def test_naive_open_at_uses_site_timezone(self):
+        settings = Settings(open_at=datetime(2025, 12, 1, 19, 0))
+        assert settings.open_at is not None
+        assert settings.open_at.tzinfo == SITE_TIMEZONE
+
+
+def catalog_activity(name: str, code: str) -> Activity:
+    return Activity(
+        name=name,
+        code=code,
+        domain="Aquatique",
+        age_min=0,
+        age_max=3,
+        start_date="",
+        end_date="",
+        promoter="",
+        spots=0,
+        price="",
+        days="Samedi",
+        times="",
+        location="Piscine",
+        status=ActivityStatus.NOT_YET,
+    )
+
+
+class TestResolveTargetNames:
+    def test_respells_unmatched_names_only(self, isolated_catalog: Path):
+        settings = Settings(
+            domain="Aquatique",
+            targets=[
+                Target(activity_name="Parent-bebe"),
+                Target(activity_name="Natation niveau"),
+                Target(activity_name="Hockey"),
+            ],
+        )
+        with ActivityCatalog(isolated_catalog) as catalog:
+            catalog.save(
+                [
+                    catalog_activity("Parent-bébé niveau 1", "AQ-1"),
+                    catalog_activity("Natation niveau 2", "AQ-2"),
+                ],
+                "Aquatique",
+            )
+            renamed = resolve_target_names(settings, catalog)
+
+        assert renamed == [("Parent-bebe", "Parent-bébé")]
+        assert [t.activity_name for t in settings.targets] == [
+            "Parent-bébé",
+            "Natation niveau",
+            "Hockey",
+        ]
+
+    def test_without_catalog(self, isolated_catalog: Path):
+        settings = Settings(activity_name="Parent-bebe")
+        with ActivityCatalog(isolated_catalog) as catalog:
+            assert resolve_target_names(settings, catalog) == []
+        assert settings.activity_name == "Parent-bebe"
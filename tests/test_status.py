@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from longueuil_aweille.status import Paginator
+
+
+class WindowedPaginator(Paginator):
+    """Paginator over a fake pager that links at most ``window`` pages either side."""
+
+    def __init__(self, total: int, window: int = 2):
+        super().__init__(MagicMock())
+        self.total = total
+        self.window = window
+        self.clicks: list[int] = []
+
+    async def _visible_numbers(self) -> list[int]:
+        low, high = max(1, self.current - self.window), min(self.total, self.current + self.window)
+        return [n for n in range(low, high + 1) if n != self.current]
+
+    async def _click(self, number: int) -> None:
+        assert number in await self._visible_numbers()
+        self.clicks.append(number)
+        self.current = number
+
+
+def block_pager(total: int, size: int = 3) -> Paginator:
+    """Real Paginator on a fake page whose pager links ``size`` pages at a time."""
+    page = MagicMock()
+    pager = Paginator(page, waits=MagicMock(for_replaced=AsyncMock()))
+
+    def texts() -> list[str]:
+        first = (pager.current - 1) // size * size + 1
+        last = min(total, first + size - 1)
+        links = [str(n) for n in range(first, last + 1) if n != pager.current]
+        return ["..."] * (first > 1) + links + ["..."] * (last < total)
+
+    page.locator.return_value.all_inner_texts = AsyncMock(side_effect=texts)
+    return pager
+
+
+class TestPaginator:
+    async def test_discover_walks_past_window(self):
+        pager = WindowedPaginator(total=9)
+
+        assert await pager.discover() == 9
+        assert pager.clicks == [3, 5, 7, 9]
+
+        # Cached once known.
+        assert await pager.discover() == 9
+        assert pager.clicks == [3, 5, 7, 9]
+
+    async def test_single_page(self):
+        assert await WindowedPaginator(total=1).discover() == 1
+
+    async def test_goto_jumps_through_windows(self):
+        pager = WindowedPaginator(total=12)
+
+        assert await pager.goto(8)
+        assert pager.clicks == [3, 5, 7, 8]
+
+        assert await pager.goto(2)
+        assert pager.clicks[4:] == [6, 4, 2]
+
+    async def test_goto_past_end(self):
+        pager = WindowedPaginator(total=4)
+
+        assert not await pager.goto(6)
+        assert pager.current == 4
+
+    async def test_iterates_every_page(self):
+        assert [n async for n in WindowedPaginator(total=5)] == [1, 2, 3, 4, 5]
+
+    async def test_stop_and_resume(self):
+        pager = WindowedPaginator(total=6)
+        seen = []
+        async for number in pager:
+            seen.append(number)
+            if number == 3:
+                pager.stop()
+
+        assert seen == [1, 2, 3]
+        assert [n async for n in pager.resume()] == [4, 5, 6]
+
+    async def test_follows_block_ellipses(self):
+        pager = block_pager(total=8)
+
+        assert await pager.discover() == 8
+        assert [n async for n in pager.pages(start=1)] == list(range(1, 9))
+
+        assert await pager.goto(2)
+        assert pager.current == 2
@@ -0,0 +1,25 @@
+import time
+
+from longueuil_aweille.waits import DEFAULT_STEP_TIMEOUTS, WaitStrategy
+
+
+class TestWaitStrategy:
+    def test_step_timeout_overrides(self):
+        waits = WaitStrategy(timeouts={"search": 1234})
+
+        assert waits.timeout("search") == 1234
+        assert waits.timeout("popup") == DEFAULT_STEP_TIMEOUTS["popup"]
+
+    def test_summary_groups_steps(self):
+        waits = WaitStrategy()
+        now = time.perf_counter()
+        waits._record("search", now, met=True)
+        waits._record("search", now, met=False)
+        waits._record("popup", now, met=True)
+
+        summary = {s.step: s for s in waits.summary()}
+
+        assert summary["search"].count == 2
+        assert summary["search"].timeouts == 1
+        assert summary["search"].legacy_ms == 3000
+        assert summary["popup"].count == 1
@@ -0,0 +1,95 @@
+from longueuil_aweille.browse import ActivityScraper, ResultsPage, RowData
+from longueuil_aweille.status import ActivityStatus
+from longueuil_aweille.watch import CatalogWatcher, ChangeKind, row_hash
+
+
+def make_row(code: str, spots: str = "5", src: str = "/images/Inscrire.png") -> RowData:
+    cells = ["", "", f"Natation\n{code}", "Aquatique", "5", "12", "", "", "", spots]
+    cells += ["45,00 $", "Samedi", "9 h 00", "Piscine"]
+    return {
+        "index": 0,
+        "cells": cells,
+        "status_src": src,
+        "status_alt": "",
+        "dates_button": None,
+    }
+
+
+class ScriptedScraper(ActivityScraper):
+    """Serves one list of results pages per scan."""
+
+    def __init__(self, *scans: list[list[RowData]]):
+        super().__init__()
+        self.scans = list(scans)
+        self.parsed = 0
+
+    async def stream_pages(self):
+        for number, rows in enumerate(self.scans.pop(0), start=1):
+            if isinstance(rows, Exception):
+                raise rows
+            yield ResultsPage(number, "", rows)
+
+    def _parse_row(self, data, page_url="", page_number=0):
+        self.parsed += 1
+        return super()._parse_row(data, page_url, page_number)
+
+
+class TestCatalogWatcher:
+    async def test_unchanged_pages_are_not_parsed(self):
+        pages = [[make_row("A1"), make_row("A2")], [make_row("A3")]]
+        scraper = ScriptedScraper(pages, pages)
+        watcher = CatalogWatcher(scraper)
+
+        assert await watcher.scan() == []
+        assert scraper.parsed == 3
+
+        assert await watcher.scan() == []
+        assert scraper.parsed == 3
+        assert watcher.stats.pages_unchanged == 2
+        assert len(watcher.activities) == 3
+
+    async def test_reports_changes_and_reparses_only_changed_rows(self):
+        before = [[make_row("A1"), make_row("A2", src="/images/InscrNotNow.png")], [make_row("A3")]]
+        after = [[make_row("A1", spots="4"), make_row("A2")], [make_row("A4")]]
+        scraper = ScriptedScraper(before, after)
+        watcher = CatalogWatcher(scraper)
+        await watcher.scan()
+
+        changes = await watcher.scan()
+
+        by_key = {(c.kind, c.activity.code): c for c in changes}
+        assert set(by_key) == {
+            (ChangeKind.CHANGED, "A1"),
+            (ChangeKind.CHANGED, "A2"),
+            (ChangeKind.ADDED, "A4"),
+            (ChangeKind.REMOVED, "A3"),
+        }
+        assert by_key[(ChangeKind.CHANGED, "A1")].fields == {"spots": (5, 4)}
+        assert by_key[(ChangeKind.CHANGED, "A2")].to_dict()["fields"] == {
+            "status": ["not_yet", "available"]
+        }
+        assert by_key[(ChangeKind.CHANGED, "A2")].activity.status == ActivityStatus.AVAILABLE
+        assert watcher.stats.rows_parsed == 3
+
+    async def test_failed_scan_keeps_previous_state(self):
+        watcher = CatalogWatcher(ScriptedScraper([[make_row("A1")]], []))
+        await watcher.scan()
+
+        assert await watcher.scan() == []
+        assert list(watcher.activities) == ["A1"]
+
+    async def test_scan_failing_part_way_reports_nothing_removed(self):
+        pages = [[make_row("A1")], [make_row("A2")]]
+        watcher = CatalogWatcher(ScriptedScraper(pages, [pages[0], TimeoutError("page 2")]))
+        await watcher.scan()
+
+        assert await watcher.scan() == []
+        assert not watcher.stats.complete
+        assert list(watcher.activities) == ["A1", "A2"]
+
+
+def test_row_hash_ignores_position():
+    moved = make_row("A1")
+    moved["index"] = 7
+    assert row_hash(moved) == row_hash(make_row("A1"))
+    assert row_hash(make_row("A1", spots="4")) != row_hash(make_row("A1"))
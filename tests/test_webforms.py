@@ -0,0 +1,148 @@
+from urllib.parse import parse_qs
+
+import httpx
+
+from longueuil_aweille.browse import (
+    dates_rows_from_document,
+    rows_from_document,
+    select_resident_dates,
+)
+from longueuil_aweille.registration import find_target_rows
+from longueuil_aweille.webforms import WebForm, WebFormsClient, pager_link_numbers, parse_html
+
+SEARCH_PAGE = """
+<html><body>
+<form method="post" action="./Page.fr.aspx?m=1" id="aspnetForm">
+<input type="hidden" name="__VIEWSTATE" value="vs-search" />
+<input type="hidden" name="__EVENTVALIDATION" value="ev-search" />
+<input type="radio" name="ctlBlocRecherche$ctlSelDisponibilite" value="ctlToutes" checked="checked" />
+<input type="radio" name="ctlBlocRecherche$ctlSelDisponibilite" value="ctlDispoSeulement" />
+<input type="text" id="ctlBlocRecherche_ctlMotsCles_ctlMotsCle" name="ctlBlocRecherche$ctlMotsCles$ctlMotsCle" value="" />
+<span><input type="checkbox" name="ctlDomaines$ctl01" /><label>Activités aquatiques (Vieux-Longueuil)</label></span>
+<span><input type="checkbox" name="ctlDomaines$ctl02" /><label>Arts et culture (Saint-Hubert)</label></span>
+<a id="ctlBlocRecherche_ctlRechercher" href="javascript:__doPostBack('ctlBlocRecherche$ctlRechercher','')">Rechercher</a>
+</form>
+</body></html>
+"""
+
+
+def results_page(page: int) -> str:
+    return f"""
+<html><body>
+<form method="post" action="./Page.fr.aspx?m=1">
+<input type="hidden" name="__VIEWSTATE" value="vs-page{page}" />
+<table id="ctlGrille">
+<tr><th>Statut</th><th>Info</th><th>Activité</th></tr>
+<tr>
+  <td><img id="ctlGrille_ctl0{page}_imgStatut" src="/images/InscrNotNow.png" alt="Pas encore" /></td>
+  <td><input type="image" name="ctlGrille$ctl0{page}$ctlDates" title="Voir les dates d'inscription" /></td>
+  <td>Parent-bébé<br />AQ-10{page}</td><td>Activités aquatiques</td><td>0</td><td>3</td>
+  <td>1 janvier 2025</td><td>31 mars 2025</td><td>Ville de Longueuil</td><td>12</td>
+  <td>45,00 $</td><td>Samedi</td><td>9 h 00</td><td>Piscine &amp; Spa</td>
+  <td><input type="image" id="ctlGrille_ctl0{page}_ctlSelecteur" src="/images/InscrNotNow.png" /></td>
+</tr>
+</table>
+<a id="ctlGrille_ctlPagination_ctlLienPage1" href="javascript:__doPostBack('ctlGrille$ctlPagination$ctlLienPage1','')">1</a>
+<a id="ctlGrille_ctlPagination_ctlLienPage2" href="javascript:__doPostBack('ctlGrille$ctlPagination$ctlLienPage2','')">2</a>
+</form>
+</body></html>
+"""
+
+
+DATES_POPUP = """
+<table class="DatesInscriptions">
+<tr><td class="Lieu" rowspan="2">Internet</td><td class="Clientele">Non-résident</td>
+<td class="Dates">2025-12-08, 19:00</td><td class="Dates">2025-12-20, 23:59</td></tr>
+<tr><td class="Clientele">Résident</td>
+<td class="Dates">2025-12-01, 19:00</td><td class="Dates">2025-12-20, 23:59</td></tr>
+</table>
+"""
+
+
+class TestParsing:
+    def test_rows_from_document(self):
+        rows = [r for r in rows_from_document(parse_html(results_page(1))) if len(r["cells"]) >= 14]
+
+        assert len(rows) == 1
+        row = rows[0]
+        assert row["cells"][2] == "Parent-bébé\nAQ-101"
+        assert row["cells"][13] == "Piscine & Spa"
+        assert row["status_src"] == "/images/InscrNotNow.png"
+        assert row["dates_button"] == "ctlGrille$ctl01$ctlDates"
+
+    def test_select_resident_dates(self):
+        dates = select_resident_dates(dates_rows_from_document(parse_html(DATES_POPUP)))
+
+        assert dates is not None
+        assert dates.resident_start == "2025-12-01, 19:00"
+        assert dates.resident_end == "2025-12-20, 23:59"
+
+    def test_find_target_rows_is_case_insensitive(self):
+        rows = find_target_rows(parse_html(results_page(1)), "PARENT-BÉBÉ")
+        assert len(rows) == 1
+
+    def test_form_trigger_postback_link(self):
+        root = parse_html(SEARCH_PAGE)
+        form = WebForm.from_document(root, "https://example.test/inscription/Page.fr.aspx?m=1")
+        button = root.find_by_id("ctlBlocRecherche_ctlRechercher")
+        assert button is not None
+
+        data = form.trigger(button)
+
+        assert form.action == "https://example.test/inscription/Page.fr.aspx?m=1"
+        assert data["__EVENTTARGET"] == "ctlBlocRecherche$ctlRechercher"
+        assert data["__VIEWSTATE"] == "vs-search"
+        assert data["ctlBlocRecherche$ctlSelDisponibilite"] == "ctlToutes"
+        assert "ctlDomaines$ctl01" not in data
+
+    def test_pager_ellipses_lead_to_neighbouring_blocks(self):
+        # Page 11 shown, block 11-20 linked, then the next block.
+        texts = ["...", *map(str, range(12, 21)), "..."]
+        assert pager_link_numbers(texts, current=11) == [10, *range(12, 21), 21]
+        # First block: only a trailing "...", and other links are ignored.
+        assert pager_link_numbers(["2", "3", "...", "Suivant"], current=1) == [2, 3, 4, None]
+
+
+class TestWebFormsClient:
+    async def test_search_and_paginate(self):
+        posts: list[dict[str, list[str]]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                return httpx.Response(200, text=SEARCH_PAGE)
+            form = parse_qs(request.content.decode())
+            posts.append(form)
+            page = 2 if form["__EVENTTARGET"] == ["ctlGrille$ctlPagination$ctlLienPage2"] else 1
+            return httpx.Response(200, text=results_page(page))
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http:
+            client = WebFormsClient("https://example.test/Page.fr.aspx?m=1", client=http)
+            await client.open()
+            await client.search(
+                search_button_id="ctlBlocRecherche_ctlRechercher",
+                available_only=True,
+                domain="Activités aquatiques",
+            )
+            assert client.page_numbers() == [1, 2]
+
+            page_two = await client.goto_page(2)
+
+        assert page_two is not None
+        assert "AQ-102" in page_two.inner_text()
+        assert posts[0]["ctlBlocRecherche$ctlSelDisponibilite"] == ["ctlDispoSeulement"]
+        assert posts[0]["ctlDomaines$ctl01"] == ["on"]
+        assert posts[1]["__VIEWSTATE"] == ["vs-page1"]
+
+    async def test_search_unknown_domain_lists_domains(self):
+        transport = httpx.MockTransport(lambda _: httpx.Response(200, text=SEARCH_PAGE))
+        async with httpx.AsyncClient(transport=transport) as http:
+            client = WebFormsClient("https://example.test/", client=http)
+            try:
+                await client.search(
+                    search_button_id="ctlBlocRecherche_ctlRechercher", domain="Inconnu"
+                )
+            except LookupError as e:
+                assert "Arts et culture (Saint-Hubert)" in e.args[0]
+            else:
+                raise AssertionError("expected LookupError")